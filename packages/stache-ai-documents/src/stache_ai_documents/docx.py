@@ -1,5 +1,7 @@
 """DOCX (Word) document loader"""
 
+from collections.abc import Iterator
+
 from stache_ai.loaders.base import DocumentLoader
 
 
@@ -11,10 +13,14 @@ class DocxLoader(DocumentLoader):
         return ['docx']
 
     def load(self, file_path: str) -> str:
+        return "\n\n".join(self.iter_pages(file_path))
+
+    def iter_pages(self, file_path: str) -> Iterator[str]:
         # Lazy import
         from docx import Document
 
         doc = Document(file_path)
-        text_parts = [para.text for para in doc.paragraphs if para.text.strip()]
-
-        return "\n\n".join(text_parts)
+        for para in doc.paragraphs:
+            text = para.text
+            if text.strip():
+                yield text
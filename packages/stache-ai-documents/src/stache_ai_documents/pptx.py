@@ -1,5 +1,7 @@
 """PPTX (PowerPoint) document loader"""
 
+from collections.abc import Iterator
+
 from stache_ai.loaders.base import DocumentLoader
 
 
@@ -11,15 +13,15 @@ class PptxLoader(DocumentLoader):
         return ['pptx']
 
     def load(self, file_path: str) -> str:
+        return "\n\n".join(self.iter_pages(file_path))
+
+    def iter_pages(self, file_path: str) -> Iterator[str]:
         # Lazy import
         from pptx import Presentation
 
         prs = Presentation(file_path)
-        text_parts = []
-
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text_parts.append(shape.text)
 
-        return "\n\n".join(text_parts)
+        # shape.text rebuilds the string from the XML on every access, so
+        # read it once per shape (shapes without a text frame have none)
+        texts = (getattr(shape, "text", "") for slide in prs.slides for shape in slide.shapes)
+        yield from (text for text in texts if text.strip())
@@ -4,7 +4,6 @@ import logging
 import os
 import subprocess
 import tempfile
-from pathlib import Path
 
 from stache_ai.loaders.base import DocumentLoader
 from .types import OcrLoadResult
@@ -195,11 +194,10 @@ class OcrPdfLoader(DocumentLoader):
         import pdfplumber
 
         text_parts = []
-        tmp_path = None
 
-        try:
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                tmp_path = tmp.name
+        # One directory for the OCR output; cleaned up on exit, even on timeout
+        with tempfile.TemporaryDirectory(prefix='stache-ocr-') as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, 'ocr.pdf')
 
             # This can raise TimeoutExpired or FileNotFoundError
             result = subprocess.run(
@@ -219,8 +217,4 @@ class OcrPdfLoader(DocumentLoader):
                     if text:
                         text_parts.append(text)
 
-            return text_parts
-
-        finally:
-            if tmp_path:
-                Path(tmp_path).unlink(missing_ok=True)
+        return text_parts
@@ -1,6 +1,6 @@
 """Qdrant vector database provider"""
 
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 from stache_ai.providers.base import VectorDBProvider
 from stache_ai.config import Settings
 from qdrant_client import QdrantClient
@@ -287,6 +287,54 @@ class QdrantVectorDBProvider(VectorDBProvider):
         )
         return result.count
 
+    def group_count(
+        self,
+        group_by: str,
+        filter: Optional[Dict[str, Any]] = None,
+        context=None
+    ) -> Dict[str, int]:
+        """Count vectors per distinct value of a payload field using Qdrant facets
+
+        Faceting requires a payload index on ``group_by``. This method never
+        creates one (it must work with read-only API keys); when the index is
+        missing it raises NotImplementedError so callers fall back to a scan.
+
+        Args:
+            group_by: Payload field to group on (e.g. "doc_id")
+            filter: Optional dictionary of field:value pairs to match first
+
+        Returns:
+            Mapping of field value to number of matching points
+
+        Raises:
+            NotImplementedError: If ``group_by`` has no payload index
+        """
+        from qdrant_client.models import Filter, FieldCondition, MatchValue
+
+        info = self.client.get_collection(collection_name=self.collection_name)
+        if group_by not in (info.payload_schema or {}):
+            raise NotImplementedError(f"No payload index on '{group_by}' for faceting")
+
+        # The collection size bounds the number of distinct values
+        limit = info.points_count or 0
+        if limit == 0:
+            return {}
+
+        conditions = [
+            FieldCondition(key=key, match=MatchValue(value=value))
+            for key, value in (filter or {}).items()
+        ]
+        facet_filter = Filter(must=conditions) if conditions else None
+
+        response = self.client.facet(
+            collection_name=self.collection_name,
+            key=group_by,
+            facet_filter=facet_filter,
+            limit=limit,
+            exact=True
+        )
+        return {str(hit.value): hit.count for hit in response.hits}
+
     def list_by_filter(
         self,
         filter: Dict[str, Any],
@@ -336,6 +384,47 @@ class QdrantVectorDBProvider(VectorDBProvider):
 
         return results
 
+    def iter_by_filter(
+        self,
+        filter: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        context=None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over all vectors matching a filter, one scroll page at a time
+
+        Args:
+            filter: Dictionary of field:value pairs to match
+            fields: Optional list of metadata fields to return (None = all)
+            page_size: Number of points per scroll request
+
+        Yields:
+            Lists of dictionaries with vector metadata (same shape as list_by_filter)
+        """
+        from qdrant_client.models import Filter, FieldCondition, MatchValue
+
+        conditions = [
+            FieldCondition(key=key, match=MatchValue(value=value))
+            for key, value in filter.items()
+        ]
+        scroll_filter = Filter(must=conditions) if conditions else None
+        scroll_offset = None
+
+        while True:
+            points, scroll_offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=scroll_filter,
+                limit=page_size,
+                offset=scroll_offset,
+                with_payload=fields if fields else True,
+                with_vectors=False
+            )
+
+            yield [{'key': point.id, **(point.payload or {})} for point in points]
+
+            if scroll_offset is None:
+                break
+
     def scan_by_metadata(
         self,
         filter: Optional[Dict[str, Any]] = None,
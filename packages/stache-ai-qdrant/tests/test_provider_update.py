@@ -158,3 +158,53 @@ def test_get_vectors_with_embeddings_empty_ids(provider, mock_client):
 def test_max_batch_size(provider):
     """Test max_batch_size property returns correct value."""
     assert provider.max_batch_size == 1000
+
+
+def test_iter_by_filter_yields_one_batch_per_scroll_page(provider, mock_client):
+    """iter_by_filter pages through scroll until the offset is exhausted."""
+    page1 = [Mock(id="a", payload={"doc_id": "d1"}), Mock(id="b", payload={"doc_id": "d1"})]
+    page2 = [Mock(id="c", payload=None)]
+    mock_client.scroll.side_effect = [(page1, "next"), (page2, None)]
+
+    batches = list(provider.iter_by_filter({"namespace": "ns"}, page_size=2))
+
+    assert batches == [
+        [{"key": "a", "doc_id": "d1"}, {"key": "b", "doc_id": "d1"}],
+        [{"key": "c"}],
+    ]
+    assert mock_client.scroll.call_count == 2
+    assert mock_client.scroll.call_args_list[1].kwargs["offset"] == "next"
+    assert mock_client.scroll.call_args_list[0].kwargs["limit"] == 2
+
+
+def test_group_count_uses_facet_on_indexed_field(provider, mock_client):
+    """group_count maps facet hits to counts without creating an index."""
+    mock_client.get_collection.return_value = Mock(payload_schema={"doc_id": Mock()}, points_count=5)
+    mock_client.facet.return_value = Mock(hits=[Mock(value="d1", count=3), Mock(value="d2", count=2)])
+
+    counts = provider.group_count("doc_id", filter={"namespace": "ns"})
+
+    assert counts == {"d1": 3, "d2": 2}
+    mock_client.create_payload_index.assert_not_called()
+    mock_client.count.assert_not_called()
+    facet_kwargs = mock_client.facet.call_args.kwargs
+    assert facet_kwargs["key"] == "doc_id"
+    assert facet_kwargs["limit"] == 5
+    assert facet_kwargs["exact"] is True
+
+
+def test_group_count_without_index_is_not_implemented(provider, mock_client):
+    """A missing payload index makes callers fall back to scanning."""
+    mock_client.get_collection.return_value = Mock(payload_schema={}, points_count=5)
+
+    with pytest.raises(NotImplementedError):
+        provider.group_count("doc_id")
+    mock_client.create_payload_index.assert_not_called()
+    mock_client.facet.assert_not_called()
+
+
+def test_group_count_skips_facet_when_collection_empty(provider, mock_client):
+    mock_client.get_collection.return_value = Mock(payload_schema={"doc_id": Mock()}, points_count=0)
+
+    assert provider.group_count("doc_id") == {}
+    mock_client.facet.assert_not_called()
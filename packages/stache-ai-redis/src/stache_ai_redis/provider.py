@@ -252,5 +252,9 @@ class RedisNamespaceProvider(NamespaceProvider):
         """Check if a namespace exists"""
         return self.client.exists(self._ns_key(id)) > 0
 
+    def list_ids(self, context=None) -> set:
+        """Get all namespace IDs straight from the index set"""
+        return set(self.client.smembers(NS_INDEX_KEY))
+
     # get_ancestors / get_path come from the NamespaceProvider base class
     # (context-aware parent walk over ``get``).
@@ -3,7 +3,7 @@
 import json
 import logging
 import time
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterator, List, Dict, Any, Optional, Union
 import uuid
 
 import boto3
@@ -693,6 +693,57 @@ class S3VectorsProvider(VectorDBProvider):
             logger.error(f"Failed to list vectors with filter {filter}: {e}")
             return []
 
+    def iter_by_filter(
+        self,
+        filter: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        context=None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over all vectors matching a filter, one list_vectors page at a time
+
+        Filtering is client-side (see list_by_filter), but only one page of
+        vectors is held in memory at a time.
+
+        Args:
+            filter: Dictionary of field:value pairs to match
+            fields: Optional list of metadata fields to return (None = all)
+            page_size: Number of vectors per list_vectors page (max 1000)
+
+        Yields:
+            Lists of dictionaries with vector metadata (same shape as list_by_filter)
+
+        Raises:
+            ClientError: If a list_vectors page fails. Unlike list_by_filter,
+                which logs and returns [], a failure here is raised so callers
+                never mistake a partial scan for a complete one.
+        """
+        paginator = self.client.get_paginator('list_vectors')
+
+        try:
+            for page in paginator.paginate(
+                vectorBucketName=self.bucket_name,
+                indexName=self.index_name,
+                returnMetadata=True,
+                PaginationConfig={'PageSize': min(page_size, 1000)}
+            ):
+                batch = []
+                for vector in page.get('vectors', []):
+                    metadata = vector.get('metadata', {})
+                    if not self._matches_filter(metadata, filter):
+                        continue
+
+                    extracted = {k: self._extract_value(v) for k, v in metadata.items()}
+                    if fields:
+                        extracted = {k: v for k, v in extracted.items() if k in fields}
+
+                    batch.append({'key': vector.get('key'), **extracted})
+
+                yield batch
+        except ClientError as e:
+            logger.error("Failed to iterate vectors with filter %s: %s", filter, e)
+            raise
+
     def get_by_ids(
         self,
         ids: List[str],
@@ -1776,6 +1776,90 @@ class TestS3VectorsListByFilter:
         assert result == []
 
 
+class TestS3VectorsIterByFilter:
+    """Tests for S3 Vectors iter_by_filter (paged, client-side filtering)"""
+
+    @pytest.fixture
+    def mock_settings(self):
+        return Settings(
+            vectordb_provider="s3vectors",
+            s3vectors_bucket="test-bucket",
+            s3vectors_index="test-index",
+            aws_region="us-east-1"
+        )
+
+    @pytest.fixture
+    def mock_boto_client(self):
+        with patch("boto3.client") as mock_client:
+            client_instance = MagicMock()
+            client_instance.get_vector_bucket.return_value = {}
+            client_instance.get_index.return_value = {}
+            mock_client.return_value = client_instance
+            yield client_instance
+
+    @pytest.fixture
+    def paginator(self, mock_boto_client):
+        paginator = MagicMock()
+        mock_boto_client.get_paginator.return_value = paginator
+        paginator.paginate.return_value = [
+            {"vectors": [
+                {"key": "id1", "metadata": {"namespace": "test-ns", "doc_id": "d1", "text": "a"}},
+                {"key": "id2", "metadata": {"namespace": "other-ns", "doc_id": "d2", "text": "b"}},
+            ]},
+            {"vectors": [
+                {"key": "id3", "metadata": {"namespace": "test-ns", "doc_id": "d3", "text": "c"}},
+            ]},
+            {"vectors": []},
+        ]
+        return paginator
+
+    def test_yields_one_filtered_batch_per_page(self, mock_settings, mock_boto_client, paginator):
+        """Each list_vectors page becomes one batch of matching vectors"""
+        from stache_ai_s3vectors.provider import S3VectorsProvider
+
+        provider = S3VectorsProvider(mock_settings)
+
+        batches = list(provider.iter_by_filter({"namespace": "test-ns"}, page_size=2))
+
+        assert [[v["key"] for v in batch] for batch in batches] == [["id1"], ["id3"], []]
+        assert batches[0][0]["doc_id"] == "d1"
+        call_args = paginator.paginate.call_args
+        assert call_args.kwargs["returnMetadata"] is True
+        assert call_args.kwargs["PaginationConfig"] == {"PageSize": 2}
+
+    def test_fields_projection(self, mock_settings, mock_boto_client, paginator):
+        """Only the requested metadata fields are returned (plus the key)"""
+        from stache_ai_s3vectors.provider import S3VectorsProvider
+
+        provider = S3VectorsProvider(mock_settings)
+
+        batches = list(provider.iter_by_filter({"namespace": "test-ns"}, fields=["doc_id"]))
+
+        assert batches[0] == [{"key": "id1", "doc_id": "d1"}]
+        assert batches[1] == [{"key": "id3", "doc_id": "d3"}]
+
+    def test_page_size_capped_at_api_limit(self, mock_settings, mock_boto_client, paginator):
+        from stache_ai_s3vectors.provider import S3VectorsProvider
+
+        provider = S3VectorsProvider(mock_settings)
+
+        list(provider.iter_by_filter({}, page_size=5000))
+
+        assert paginator.paginate.call_args.kwargs["PaginationConfig"] == {"PageSize": 1000}
+
+    def test_client_error_is_raised(self, mock_settings, mock_boto_client):
+        """Unlike list_by_filter, a failed page is raised rather than swallowed"""
+        from stache_ai_s3vectors.provider import S3VectorsProvider
+
+        provider = S3VectorsProvider(mock_settings)
+        paginator = MagicMock()
+        mock_boto_client.get_paginator.return_value = paginator
+        paginator.paginate.side_effect = make_client_error("AccessDeniedException")
+
+        with pytest.raises(ClientError):
+            list(provider.iter_by_filter({"namespace": "test-ns"}))
+
+
 class TestS3VectorsDeleteByMetadata:
     """Tests for S3 Vectors delete_by_metadata operation"""
 
@@ -23,11 +23,11 @@ from stache_ai.api.routes import (
     trash,
     upload,
 )
-from stache_ai.config import settings
+from stache_ai.config import get_settings
 
 # Configure logging
 logging.basicConfig(
-    level=settings.log_level.upper(),
+    level=get_settings().log_level.upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
@@ -53,7 +53,7 @@ from stache_ai.identity import (
     get_authorizer,
 )
 
-_principal_extractor = build_extractor(settings)   # raises at import if misconfigured
+_principal_extractor = build_extractor(get_settings())   # raises at import if misconfigured
 _route_authorizer = get_authorizer()               # raises at import if misconfigured (fail-closed)
 logger_boot = logging.getLogger(__name__)
 logger_boot.info(f"Principal extractor: {type(_principal_extractor).__name__}")
@@ -147,6 +147,7 @@ if static_dir.exists():
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
+    settings = get_settings()
     logger.info("Starting Stache AI API...")
     logger.info(f"LLM Provider: {settings.llm_provider}")
     logger.info(f"Embedding Provider: {settings.embedding_provider}")
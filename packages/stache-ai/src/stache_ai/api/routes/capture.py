@@ -11,7 +11,7 @@ from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from stache_ai.api import auth
-from stache_ai.config import settings
+from stache_ai.config import get_settings
 from stache_ai.identity import ForbiddenError, LimitExceededError
 from stache_ai.ingestion import IngestTextTooLargeError, JobStatus
 from stache_ai.ingestion.factory import get_ingestion_service
@@ -54,7 +54,7 @@ async def capture_thought(request: CaptureRequest, http_request: Request):
     principal = auth.principal(http_request)
     # No-namespace requests must resolve to a real string (see /ingest): a None
     # namespace propagates into blob metadata and 500s on presign/put.
-    namespace = request.namespace or settings.default_namespace or "default"
+    namespace = request.namespace or get_settings().default_namespace or "default"
     # S1 enforcement (before the broad try so a denial is a 403, not a 500).
     # Capture flows through the same ingestion service + worker as /ingest, and
     # the worker re-checks "ingest" (identity.assert_can_write). Enforce the
@@ -82,7 +82,7 @@ async def capture_thought(request: CaptureRequest, http_request: Request):
             text=request.text,
             chunking_strategy=request.chunking_strategy,
             wait=True,
-            wait_timeout=settings.ingest_wait_default_timeout,
+            wait_timeout=get_settings().ingest_wait_default_timeout,
         )
 
         if job.status == JobStatus.FAILED:
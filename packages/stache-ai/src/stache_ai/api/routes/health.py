@@ -4,7 +4,7 @@ import logging
 
 from fastapi import APIRouter
 
-from stache_ai.config import settings
+from stache_ai.config import get_settings
 from stache_ai.rag.pipeline import get_pipeline
 
 logger = logging.getLogger(__name__)
@@ -29,7 +29,7 @@ async def health_check():
         return {
             "status": "healthy",
             "providers": provider_info,
-            "vectordb_provider": settings.vectordb_provider
+            "vectordb_provider": get_settings().vectordb_provider
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}", exc_info=True)
@@ -14,7 +14,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from stache_ai.api import auth
-from stache_ai.config import settings
+from stache_ai.config import get_settings
 from stache_ai.ingestion import TERMINAL, IngestTextTooLargeError, JobStatus
 from stache_ai.ingestion.factory import get_ingestion_service
 from stache_ai.sanitize import strip_reserved_metadata
@@ -54,7 +54,7 @@ async def ingest(request: IngestRequest, http_request: Request):
     # must resolve to a real string: a None namespace is pinned into S3 object
     # metadata and botocore's ascii validation then blows up (500). Default to
     # the literal "default" namespace instead.
-    namespace = request.namespace or settings.default_namespace or "default"
+    namespace = request.namespace or get_settings().default_namespace or "default"
     # S1 enforcement: covers both direct submission and the upload-begin flow.
     # "ingest" is the canonical content-write op: the same op the worker
     # re-checks (identity.assert_can_write) so this route and its async worker
@@ -115,8 +115,8 @@ async def ingest(request: IngestRequest, http_request: Request):
             data=data,
             chunking_strategy=request.chunking_strategy,
             wait=request.wait,
-            wait_timeout=settings.ingest_wait_default_timeout,
-            poll_interval=settings.ingest_wait_poll_interval,
+            wait_timeout=get_settings().ingest_wait_default_timeout,
+            poll_interval=get_settings().ingest_wait_poll_interval,
         )
     except IngestTextTooLargeError as e:
         raise HTTPException(status_code=413, detail=str(e))
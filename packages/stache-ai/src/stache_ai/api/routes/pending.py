@@ -11,7 +11,7 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
 from stache_ai.api import auth
-from stache_ai.config import settings
+from stache_ai.config import get_settings
 from stache_ai.identity import ForbiddenError, LimitExceededError
 from stache_ai.loaders import load_document
 from stache_ai.middleware.context import RequestContext
@@ -45,7 +45,7 @@ class ApproveRequest(BaseModel):
 
 def get_queue_dir() -> Path:
     """Get the queue directory path"""
-    return Path(settings.queue_dir)
+    return Path(get_settings().queue_dir)
 
 
 @router.get("/pending")
@@ -179,7 +179,7 @@ async def approve_pending(item_id: str, request: ApproveRequest, http_request: R
         logger.info(f"Approved and ingested: {filename} -> {request.namespace}")
 
         # Move PDF to processed directory (optional - for archiving)
-        processed_dir = Path(settings.queue_dir).parent / "processed" / request.namespace.replace("/", "_")
+        processed_dir = Path(get_settings().queue_dir).parent / "processed" / request.namespace.replace("/", "_")
         processed_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -8,7 +8,7 @@ from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from pydantic import BaseModel
 
 from stache_ai.api import auth
-from stache_ai.config import settings
+from stache_ai.config import get_settings
 from stache_ai.identity import ForbiddenError, LimitExceededError
 from stache_ai.middleware.context import RequestContext
 from stache_ai.sanitize import strip_reserved_metadata
@@ -66,7 +66,7 @@ async def upload_document(
     # Coerce a missing namespace to the literal "default" so authorization and
     # the downstream ingest see the SAME value (a None namespace 500s once it
     # reaches blob metadata).
-    namespace = namespace or settings.default_namespace or "default"
+    namespace = namespace or get_settings().default_namespace or "default"
     # S1 enforcement (before the broad try so a denial is a 403, not a 500).
     auth.authorize(http_request, "upload", {"namespace": namespace})
 
@@ -146,7 +146,7 @@ async def batch_upload_documents(
     """
     # Coerce a missing namespace to "default" so authz and every per-file
     # ingest below agree on one value (a None namespace 500s in blob metadata).
-    namespace = namespace or settings.default_namespace or "default"
+    namespace = namespace or get_settings().default_namespace or "default"
     # S1 enforcement: authorize once for the whole batch.
     auth.authorize(http_request, "upload", {"namespace": namespace})
 
@@ -4,6 +4,30 @@ import re
 
 from .base import Chunk, ChunkingStrategy
 
+# Cue blocks are separated by blank lines
+_BLOCK_SPLIT_RE = re.compile(r'\n\n+')
+
+# Timestamp lines, e.g. 00:00:00.000 --> 00:00:05.000 (SRT uses a comma).
+# [^\S\n] keeps a match on a single line when searching a whole block.
+_VTT_TIMESTAMP_RE = re.compile(
+    r'(\d{2}:\d{2}:\d{2}\.\d{3})[^\S\n]*-->[^\S\n]*(\d{2}:\d{2}:\d{2}\.\d{3})'
+)
+_SRT_TIMESTAMP_RE = re.compile(
+    r'(\d{2}:\d{2}:\d{2}[,\.]\d{3})[^\S\n]*-->[^\S\n]*(\d{2}:\d{2}:\d{2}[,\.]\d{3})'
+)
+
+_VTT_SPEAKER_RE = re.compile(r'<v\s+([^>]+)>')
+_VTT_TAG_RE = re.compile(r'</?[^>]+>')
+
+
+def _split_cue(block: str, match: re.Match) -> tuple[str, str]:
+    """Return (timestamp line, text after it) for a timestamp match in a block"""
+    line_start = block.rfind('\n', 0, match.start()) + 1
+    line_end = block.find('\n', match.end())
+    if line_end == -1:
+        return block[line_start:], ''
+    return block[line_start:line_end], block[line_end + 1:].strip()
+
 
 class TranscriptChunkingStrategy(ChunkingStrategy):
     """
@@ -101,45 +125,33 @@ class TranscriptChunkingStrategy(ChunkingStrategy):
         """Parse VTT format"""
         cues = []
 
-        # Split by double newline to get cues
-        blocks = re.split(r'\n\n+', text)
-
-        for block in blocks:
+        for block in _BLOCK_SPLIT_RE.split(text):
             block = block.strip()
             if not block or block.startswith('WEBVTT') or block.startswith('NOTE'):
                 continue
 
-            lines = block.split('\n')
-
             # Find timestamp line (format: 00:00:00.000 --> 00:00:05.000)
-            timestamp_pattern = r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})'
-
-            for i, line in enumerate(lines):
-                match = re.search(timestamp_pattern, line)
-                if match:
-                    start_str, end_str = match.groups()
-                    start_time = self._parse_timestamp(start_str)
-                    end_time = self._parse_timestamp(end_str)
-
-                    # Extract speaker if present (e.g., <v Speaker Name>)
-                    speaker_match = re.search(r'<v\s+([^>]+)>', line)
-                    speaker = speaker_match.group(1) if speaker_match else None
-
-                    # Get text (everything after timestamp line)
-                    cue_text = '\n'.join(lines[i+1:]).strip()
-
-                    # Remove VTT tags like <v Speaker>
-                    cue_text = re.sub(r'<v\s+[^>]+>', '', cue_text)
-                    cue_text = re.sub(r'</?[^>]+>', '', cue_text)
-
-                    if cue_text:
-                        cues.append({
-                            'start': start_time,
-                            'end': end_time,
-                            'text': cue_text,
-                            'speaker': speaker
-                        })
-                    break
+            match = _VTT_TIMESTAMP_RE.search(block)
+            if not match:
+                continue
+
+            start_str, end_str = match.groups()
+            line, cue_text = _split_cue(block, match)
+
+            # Extract speaker if present (e.g., <v Speaker Name>)
+            speaker_match = _VTT_SPEAKER_RE.search(line)
+            speaker = speaker_match.group(1) if speaker_match else None
+
+            # Remove VTT tags like <v Speaker>
+            cue_text = _VTT_TAG_RE.sub('', cue_text)
+
+            if cue_text:
+                cues.append({
+                    'start': self._parse_timestamp(start_str),
+                    'end': self._parse_timestamp(end_str),
+                    'text': cue_text,
+                    'speaker': speaker
+                })
 
         return cues
 
@@ -147,42 +159,28 @@ class TranscriptChunkingStrategy(ChunkingStrategy):
         """Parse SRT format or plain text with timestamps"""
         cues = []
 
-        # Split by double newline
-        blocks = re.split(r'\n\n+', text)
-
-        for block in blocks:
+        for block in _BLOCK_SPLIT_RE.split(text):
             block = block.strip()
             if not block:
                 continue
 
-            lines = block.split('\n')
-
             # SRT format: number, timestamp, text
             # Format: 00:00:00,000 --> 00:00:05,000
-            timestamp_pattern = r'(\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[,\.]\d{3})'
+            match = _SRT_TIMESTAMP_RE.search(block)
+            if not match:
+                continue
+
+            start_str, end_str = match.groups()
+            _, cue_text = _split_cue(block, match)
 
-            for i, line in enumerate(lines):
-                match = re.search(timestamp_pattern, line)
-                if match:
-                    start_str, end_str = match.groups()
+            if cue_text:
+                cues.append({
                     # Normalize comma to dot
-                    start_str = start_str.replace(',', '.')
-                    end_str = end_str.replace(',', '.')
-
-                    start_time = self._parse_timestamp(start_str)
-                    end_time = self._parse_timestamp(end_str)
-
-                    # Get text (everything after timestamp line)
-                    cue_text = '\n'.join(lines[i+1:]).strip()
-
-                    if cue_text:
-                        cues.append({
-                            'start': start_time,
-                            'end': end_time,
-                            'text': cue_text,
-                            'speaker': None
-                        })
-                    break
+                    'start': self._parse_timestamp(start_str.replace(',', '.')),
+                    'end': self._parse_timestamp(end_str.replace(',', '.')),
+                    'text': cue_text,
+                    'speaker': None
+                })
 
         return cues
 
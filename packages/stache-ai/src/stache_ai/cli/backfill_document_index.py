@@ -37,7 +37,7 @@ def setup_logging(verbose: bool):
     )
 
 
-@click.command()
+@click.command(short_help='Backfill document index from vector database')
 @click.option(
     '--namespace',
     '-n',
@@ -8,7 +8,7 @@ from pathlib import Path
 import click
 
 
-@click.command()
+@click.command(short_help='Dump/export the vector database contents')
 @click.option('--output', '-o', type=click.Path(path_type=Path),
               help='Output file path (default: stdout or stache-dump-<timestamp>.json)')
 @click.option('--namespace', '-n', help='Only dump specific namespace (supports wildcards like "books/*")')
@@ -33,7 +33,7 @@ def get_files(path: Path, pattern: str, recursive: bool) -> list[Path]:
     return sorted(supported)
 
 
-@click.command()
+@click.command(short_help='Import a directory of documents')
 @click.argument('path', type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path))
 @click.option('--namespace', '-n', required=True, help='Target namespace for imported documents')
 @click.option('--pattern', '-p', default='*', help='Glob pattern for files (default: *)')
@@ -1,20 +1,23 @@
 """Migration command for creating document summaries for existing documents."""
 
 import logging
+import uuid
 from collections import defaultdict
 from datetime import datetime, timezone
 
 import click
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
 from stache_ai.rag.pipeline import get_pipeline
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Characters of document text included in each summary for semantic matching
+PREVIEW_CHARS = 1500
 
-@click.command()
+
+@click.command(short_help='Create summary records for existing documents')
 @click.option('--namespace', '-n', default=None, help='Only migrate documents in this namespace')
 @click.option('--dry-run', is_flag=True, help='Show what would be migrated without making changes')
 @click.option('--batch-size', default=1000, help='Number of points to scroll at a time')
@@ -26,6 +29,8 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
     summary records for documents that don't already have one.
 
     The summary records enable fast document listing and semantic discovery.
+    Summary IDs are derived from the doc_id, so re-running after a partial
+    failure is safe and will not create duplicates.
     """
     console.print("[bold]Document Summary Migration[/bold]")
     console.print()
@@ -40,7 +45,21 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
         console.print("No migration needed.")
         return
 
-    from qdrant_client.models import FieldCondition, Filter, MatchValue
+    from qdrant_client.models import FieldCondition, Filter, MatchValue, PayloadSchemaType
+
+    # Keyword indexes let the filtered scrolls below use the index instead of
+    # a full scan per segment. Creating an existing index is a no-op, but it
+    # still changes the schema, so a dry run leaves the collection alone.
+    if not dry_run:
+        for field_name in ("_type", "namespace"):
+            try:
+                vectordb.client.create_payload_index(
+                    collection_name=vectordb.collection_name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType.KEYWORD
+                )
+            except Exception as e:
+                logger.warning("Could not create payload index on %s: %s", field_name, e)
 
     # First, collect all existing summary doc_ids
     console.print("Checking for existing summaries...")
@@ -71,8 +90,12 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
 
     # Now scan all chunks and group by doc_id
     console.print("Scanning documents...")
+    # Only the first PREVIEW_CHARS of text per document are kept (that's all
+    # the summary uses), so memory is bounded by docs, not collection size.
     documents = defaultdict(lambda: {
         "chunks": [],
+        "preview_chars": 0,
+        "chunk_count": 0,
         "filename": None,
         "namespace": None,
         "created_at": None,
@@ -89,15 +112,14 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
     offset = None
     total_chunks = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Scanning chunks...", total=None)
+    # Exact so the bar ends at 100%; it's a single call per run
+    total_points = vectordb.client.count(
+        collection_name=vectordb.collection_name,
+        count_filter=scroll_filter,
+        exact=True
+    ).count
 
+    with click.progressbar(length=total_points, label="Scanning chunks") as bar:
         while True:
             points, offset = vectordb.client.scroll(
                 collection_name=vectordb.collection_name,
@@ -122,7 +144,12 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
                     continue
 
                 doc = documents[doc_id]
-                doc["chunks"].append(point.payload.get("text", ""))
+                doc["chunk_count"] += 1
+                remaining = PREVIEW_CHARS - doc["preview_chars"]
+                if remaining > 0:
+                    text = point.payload.get("text", "")[:remaining]
+                    doc["chunks"].append(text)
+                    doc["preview_chars"] += len(text)
                 doc["filename"] = doc["filename"] or point.payload.get("filename")
                 doc["namespace"] = doc["namespace"] or point.payload.get("namespace", "default")
                 doc["created_at"] = doc["created_at"] or point.payload.get("created_at")
@@ -136,12 +163,13 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
 
                 total_chunks += 1
 
-            progress.update(task, description=f"Scanned {total_chunks} chunks, {len(documents)} docs")
+            bar.update(len(points))
 
             if offset is None:
                 break
 
     console.print()
+    console.print(f"Scanned {total_chunks} chunks")
     console.print(f"Found {len(documents)} documents needing summaries")
 
     if not documents:
@@ -152,7 +180,7 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
         console.print()
         console.print("[yellow]Dry run - would create summaries for:[/yellow]")
         for doc_id, doc in list(documents.items())[:20]:
-            console.print(f"  - {doc['filename']} ({len(doc['chunks'])} chunks)")
+            console.print(f"  - {doc['filename']} ({doc['chunk_count']} chunks)")
         if len(documents) > 20:
             console.print(f"  ... and {len(documents) - 20} more")
         return
@@ -163,16 +191,8 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
     created = 0
     errors = 0
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Creating summaries...", total=len(documents))
-
-        for doc_id, doc in documents.items():
+    with click.progressbar(documents.items(), label="Creating summaries", show_pos=True) as bar:
+        for doc_id, doc in bar:
             try:
                 # Build summary text
                 summary_parts = [
@@ -183,15 +203,8 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
                 if doc["headings"]:
                     summary_parts.append(f"Headings: {', '.join(doc['headings'][:20])}")
 
-                # Add first ~1500 chars of content for better semantic matching
-                content_preview = ""
-                char_count = 0
-                for chunk in doc["chunks"]:
-                    remaining = 1500 - char_count
-                    if remaining <= 0:
-                        break
-                    content_preview += chunk[:remaining] + " "
-                    char_count += len(chunk[:remaining])
+                # Content preview for semantic matching (truncated while scanning)
+                content_preview = " ".join(doc["chunks"])
 
                 if content_preview.strip():
                     summary_parts.append("")
@@ -202,16 +215,16 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
                 # Generate embedding
                 summary_embedding = pipeline.embedding_provider.embed(summary_text)
 
-                # Create summary record - use new UUID (Qdrant requires valid UUID or integer)
-                import uuid
-                summary_id = str(uuid.uuid4())
+                # Deterministic ID per doc_id (Qdrant requires a valid UUID or
+                # integer) so a re-run overwrites rather than duplicates
+                summary_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"stache-summary:{doc_id}"))
                 summary_metadata = {
                     "_type": "document_summary",
                     "doc_id": doc_id,
                     "filename": doc["filename"],
                     "namespace": doc["namespace"],
                     "headings": doc["headings"][:50],
-                    "chunk_count": len(doc["chunks"]),
+                    "chunk_count": doc["chunk_count"],
                     "created_at": doc["created_at"] or datetime.now(timezone.utc).isoformat(),
                 }
 
@@ -225,12 +238,10 @@ def migrate_summaries(namespace: str | None, dry_run: bool, batch_size: int):
                 )
 
                 created += 1
-                progress.update(task, advance=1, description=f"Created {created} summaries")
 
             except Exception as e:
                 errors += 1
-                logger.error(f"Failed to create summary for {doc_id}: {e}")
-                progress.update(task, advance=1)
+                logger.error("Failed to create summary for %s: %s", doc_id, e)
 
     console.print()
     console.print(f"[green]Created {created} summaries[/green]")
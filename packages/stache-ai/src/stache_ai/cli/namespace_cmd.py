@@ -2,6 +2,8 @@
 
 import json
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -26,7 +28,7 @@ def get_settings():
     return settings
 
 
-@click.command()
+@click.command(short_help='Export all namespaces to JSON')
 @click.argument('output', type=click.Path(path_type=Path), required=False)
 @click.option('--format', '-f', 'fmt', type=click.Choice(['json', 'jsonl']), default='json',
               help='Output format (json=single file, jsonl=one per line)')
@@ -80,12 +82,20 @@ def export_namespaces(output: Path | None, fmt: str, pretty: bool):
         console.print(output_str)
 
 
-@click.command()
+@click.command(short_help='Import namespaces from JSON')
 @click.argument('input_file', type=click.Path(exists=True, path_type=Path))
 @click.option('--dry-run', is_flag=True, help='Show what would be imported without making changes')
 @click.option('--skip-existing', is_flag=True, help='Skip namespaces that already exist')
 @click.option('--update-existing', is_flag=True, help='Update existing namespaces with imported data')
-def import_namespaces(input_file: Path, dry_run: bool, skip_existing: bool, update_existing: bool):
+@click.option('--parallel', '-P', default=1, type=int,
+              help='Number of parallel create/update workers per hierarchy level (default: 1)')
+def import_namespaces(
+    input_file: Path,
+    dry_run: bool,
+    skip_existing: bool,
+    update_existing: bool,
+    parallel: int
+):
     """
     Import namespaces from a JSON file.
 
@@ -94,6 +104,7 @@ def import_namespaces(input_file: Path, dry_run: bool, skip_existing: bool, upda
         stache namespace-import --dry-run namespaces.json
         stache namespace-import --skip-existing namespaces.json
         stache namespace-import --update-existing namespaces.json
+        stache namespace-import -P 8 namespaces.json
     """
     if skip_existing and update_existing:
         console.print("[red]Cannot use both --skip-existing and --update-existing[/red]")
@@ -126,15 +137,7 @@ def import_namespaces(input_file: Path, dry_run: bool, skip_existing: bool, upda
     console.print()
 
     # Sort by hierarchy depth (parents before children)
-    def get_depth(ns):
-        return ns['id'].count('/')
-    namespaces.sort(key=get_depth)
-
-    # Process namespaces
-    created = 0
-    updated = 0
-    skipped = 0
-    errors = []
+    namespaces.sort(key=lambda ns: ns['id'].count('/'))
 
     table = Table(title="Import Results" if not dry_run else "Dry Run - Would Import")
     table.add_column("ID", style="cyan")
@@ -142,53 +145,76 @@ def import_namespaces(input_file: Path, dry_run: bool, skip_existing: bool, upda
     table.add_column("Action")
     table.add_column("Status")
 
-    for ns in namespaces:
+    # One bulk ID fetch instead of an exists() round-trip per namespace
+    existing_ids = provider.list_ids()
+
+    def process_namespace(ns: dict) -> tuple[str, str, str, str | None]:
+        """Import a single namespace and return (action, status, outcome, error)"""
         ns_id = ns['id']
-        exists = provider.exists(ns_id)
 
-        if exists:
+        if ns_id in existing_ids:
             if skip_existing:
-                table.add_row(ns_id, ns['name'], "Skip", "[yellow]exists[/yellow]")
-                skipped += 1
-                continue
-            elif update_existing:
-                if dry_run:
-                    table.add_row(ns_id, ns['name'], "Update", "[blue]would update[/blue]")
-                    updated += 1
-                else:
-                    try:
-                        provider.update(
-                            id=ns_id,
-                            name=ns.get('name'),
-                            description=ns.get('description'),
-                            metadata=ns.get('metadata')
-                        )
-                        table.add_row(ns_id, ns['name'], "Update", "[green]updated[/green]")
-                        updated += 1
-                    except Exception as e:
-                        table.add_row(ns_id, ns['name'], "Update", f"[red]error: {e}[/red]")
-                        errors.append({"id": ns_id, "error": str(e)})
-            else:
-                table.add_row(ns_id, ns['name'], "Skip", "[yellow]exists (use --skip-existing or --update-existing)[/yellow]")
-                skipped += 1
-        else:
+                return "Skip", "[yellow]exists[/yellow]", "skipped", None
+            if not update_existing:
+                return "Skip", "[yellow]exists (use --skip-existing or --update-existing)[/yellow]", "skipped", None
             if dry_run:
-                table.add_row(ns_id, ns['name'], "Create", "[blue]would create[/blue]")
-                created += 1
-            else:
-                try:
-                    provider.create(
-                        id=ns_id,
-                        name=ns['name'],
-                        description=ns.get('description', ''),
-                        parent_id=ns.get('parent_id'),
-                        metadata=ns.get('metadata')
-                    )
-                    table.add_row(ns_id, ns['name'], "Create", "[green]created[/green]")
-                    created += 1
-                except Exception as e:
-                    table.add_row(ns_id, ns['name'], "Create", f"[red]error: {e}[/red]")
-                    errors.append({"id": ns_id, "error": str(e)})
+                return "Update", "[blue]would update[/blue]", "updated", None
+            try:
+                provider.update(
+                    id=ns_id,
+                    name=ns.get('name'),
+                    description=ns.get('description'),
+                    metadata=ns.get('metadata')
+                )
+                return "Update", "[green]updated[/green]", "updated", None
+            except Exception as e:
+                return "Update", f"[red]error: {e}[/red]", "error", str(e)
+
+        if dry_run:
+            return "Create", "[blue]would create[/blue]", "created", None
+        try:
+            provider.create(
+                id=ns_id,
+                name=ns['name'],
+                description=ns.get('description', ''),
+                parent_id=ns.get('parent_id'),
+                metadata=ns.get('metadata')
+            )
+            return "Create", "[green]created[/green]", "created", None
+        except Exception as e:
+            return "Create", f"[red]error: {e}[/red]", "error", str(e)
+
+    # Process namespaces
+    counts = {"created": 0, "updated": 0, "skipped": 0, "error": 0}
+    errors = []
+
+    def record(ns: dict, action: str, status: str, outcome: str, error: str | None):
+        table.add_row(ns['id'], ns['name'], action, status)
+        counts[outcome] += 1
+        if error is not None:
+            errors.append({"id": ns['id'], "error": error})
+        elif outcome == "created" and not dry_run:
+            existing_ids.add(ns['id'])
+
+    if parallel > 1:
+        # Siblings at the same depth are independent; finish each level
+        # before starting the next so parents always exist first.
+        by_depth = defaultdict(list)
+        for ns in namespaces:
+            by_depth[ns['id'].count('/')].append(ns)
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            for depth in sorted(by_depth):
+                futures = {executor.submit(process_namespace, ns): ns for ns in by_depth[depth]}
+                for future in as_completed(futures):
+                    record(futures[future], *future.result())
+    else:
+        for ns in namespaces:
+            record(ns, *process_namespace(ns))
+
+    created = counts["created"]
+    updated = counts["updated"]
+    skipped = counts["skipped"]
 
     console.print(table)
     console.print()
@@ -205,7 +231,7 @@ def import_namespaces(input_file: Path, dry_run: bool, skip_existing: bool, upda
             console.print(f"[bold red]Errors:[/bold red] {len(errors)}")
 
 
-@click.command()
+@click.command(short_help='List all namespaces in a tree view')
 def list_namespaces():
     """
     List all namespaces in a tree view.
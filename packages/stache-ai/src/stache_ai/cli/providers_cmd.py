@@ -5,13 +5,14 @@ import click
 from stache_ai.providers import plugin_loader
 
 
-@click.command()
+@click.command(short_help='List all discovered providers')
 def providers():
     """List all discovered providers"""
     click.echo("Stache Provider Discovery\n")
 
-    for provider_type, group in plugin_loader.PROVIDER_GROUPS.items():
-        providers = plugin_loader.get_providers(provider_type)
+    grouped = {t: plugin_loader.get_providers(t) for t in plugin_loader.PROVIDER_GROUPS}
+
+    for provider_type, providers in grouped.items():
         click.echo(f"{provider_type.upper()} Providers ({len(providers)}):")
 
         for name, cls in providers.items():
@@ -20,5 +21,5 @@ def providers():
 
         click.echo()
 
-    total = sum(len(plugin_loader.get_providers(t)) for t in plugin_loader.PROVIDER_GROUPS)
+    total = sum(len(p) for p in grouped.values())
     click.echo(f"Total: {total} providers discovered")
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 console = Console()
 
 
-@click.command()
+@click.command(short_help='Export all namespaces from Redis to JSON')
 @click.argument('output', type=click.Path(path_type=Path), required=False)
 @click.option('--host', '-h', default='localhost', help='Redis host (default: localhost)')
 @click.option('--port', '-p', type=int, default=6379, help='Redis port (default: 6379)')
@@ -50,7 +50,10 @@ def redis_export(output: Path | None, host: str, port: int, password: str | None
             port=port,
             password=password or None,
             db=db,
-            decode_responses=True
+            # Raw bytes: json.loads parses them directly, no per-value decode
+            decode_responses=False,
+            socket_keepalive=True,
+            health_check_interval=30
         )
         client.ping()
         console.print("[green]Connected successfully[/green]")
@@ -71,11 +74,12 @@ def redis_export(output: Path | None, host: str, port: int, password: str | None
 
     console.print(f"[bold]Found:[/bold] {len(all_ids)} namespaces")
 
-    # Fetch all namespaces
+    # Fetch all namespaces in a single round-trip
+    ns_ids = sorted(ns_id.decode() for ns_id in all_ids)
+    values = client.mget([f"{NS_KEY_PREFIX}{ns_id}" for ns_id in ns_ids])
+
     namespaces = []
-    for ns_id in sorted(all_ids):
-        key = f"{NS_KEY_PREFIX}{ns_id}"
-        data = client.get(key)
+    for ns_id, data in zip(ns_ids, values, strict=True):
         if data:
             try:
                 ns = json.loads(data)
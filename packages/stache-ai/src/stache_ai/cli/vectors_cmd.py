@@ -10,8 +10,10 @@ This script provides tools to:
 import json
 import logging
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +24,94 @@ from rich.table import Table
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Metadata projections: only these payload fields are fetched, so chunk text
+# (and anything else large) never crosses the wire for grouping scans.
+GROUPING_FIELDS = ['doc_id', 'namespace', 'filename', '_type']
+INDEX_FIELDS = GROUPING_FIELDS + ['headings', 'file_type', 'file_size']
+SUMMARY_TEXT_FIELDS = ['doc_id', 'text', 'summary']
+
+# Rows shown in terminal tables; use --output to see everything
+DISPLAY_ROWS = 50
+
+
+# Exported records are plain decoded payloads (no cycles), so the circular
+# reference check is skipped; default=str covers any non-JSON values
+_JSON_ENCODER = json.JSONEncoder(default=str, check_circular=False)
+
+# Records encoded per call when writing a JSON array
+JSON_BATCH_SIZE = 1000
+
+
+def _write_json_array(f, records: list[Any]) -> None:
+    """Write records as a JSON array, encoding JSON_BATCH_SIZE at a time.
+
+    Each batch goes through the C encoder in one call, which is much faster
+    than json.dump's pure-Python iterencode while keeping peak memory to a
+    single batch rather than the whole export.
+    """
+    encode = _JSON_ENCODER.encode
+    f.write('[')
+    for start in range(0, len(records), JSON_BATCH_SIZE):
+        if start:
+            f.write(', ')
+        f.write(encode(records[start:start + JSON_BATCH_SIZE])[1:-1])
+    f.write(']')
+
+
+def write_json_output(output: Path, data: Any, records_key: str | None = None):
+    """Write data to a JSON file, or to JSON Lines when OUTPUT ends in .jsonl.
+
+    Record lists (``data`` itself, or ``data[records_key]`` for a dict) are
+    encoded in batches so large exports never exist as one string in
+    memory. For JSON Lines, a dict is written as a header line (with
+    ``records_key`` nulled) followed by one line per record, the same
+    layout as namespace-export; a list is written one item per line.
+    A dict without ``records_key`` is written as a single line.
+    """
+    encode = _JSON_ENCODER.encode
+    jsonl = output.suffix == '.jsonl'
+
+    with output.open('w', encoding='utf-8') as f:
+        records = data
+        if isinstance(data, dict):
+            if records_key is None:
+                f.write(encode(data))
+                f.write('\n')
+                return
+            records = data[records_key]
+            if jsonl:
+                f.write(encode(data | {records_key: None}))
+                f.write('\n')
+            else:
+                # Re-open the encoded header object to append the records
+                # array as its last key
+                header = encode({k: v for k, v in data.items() if k != records_key})
+                f.write(header[:-1])
+                if len(header) > 2:
+                    f.write(', ')
+                f.write(f'{encode(records_key)}: ')
+                _write_json_array(f, records)
+                f.write('}\n')
+                return
+
+        if jsonl:
+            for record in records:
+                f.write(encode(record))
+                f.write('\n')
+        else:
+            _write_json_array(f, records)
+            f.write('\n')
+
+
+def to_columnar(records: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Transpose records into one list per field.
+
+    Keys are collected across all records (first-seen order) so rows with
+    extra metadata don't drop fields; missing values become None.
+    """
+    keys = dict.fromkeys(key for record in records for key in record)
+    return {key: [record.get(key) for record in records] for key in keys}
+
 
 def setup_logging(verbose: bool):
     """Configure logging based on verbosity"""
@@ -33,27 +123,43 @@ def setup_logging(verbose: bool):
     )
 
 
-@click.group()
+def get_vectordb_provider():
+    """Create the configured vector DB provider.
+
+    The vectors commands only talk to the vector DB and document index, so
+    they build those providers directly rather than importing the RAG
+    pipeline, which pulls in the embedding, LLM and chunking modules.
+    """
+    from stache_ai.config import settings
+    from stache_ai.providers import VectorDBProviderFactory
+    return VectorDBProviderFactory.create(settings)
+
+
+def get_document_index_provider():
+    """Create the configured document index provider."""
+    from stache_ai.config import settings
+    from stache_ai.providers import DocumentIndexProviderFactory
+    return DocumentIndexProviderFactory.create(settings)
+
+
+@click.group(short_help='Vector database inspection tools')
 def vectors():
     """Vector database inspection and document creation tools."""
     pass
 
 
-@vectors.command(name='stats')
+@vectors.command(name='stats', short_help='Show vector database statistics')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 def vectors_stats(verbose: bool):
     """Show vector database statistics."""
     setup_logging(verbose)
 
-    console.print("[bold]Initializing pipeline...[/bold]")
+    console.print("[bold]Initializing vector DB provider...[/bold]")
     try:
-        from stache_ai.rag.pipeline import get_pipeline
-        pipeline = get_pipeline()
+        vector_db = get_vectordb_provider()
     except Exception as e:
-        console.print(f"[red]Error initializing pipeline: {e}[/red]")
+        console.print(f"[red]Error initializing vector DB provider: {e}[/red]")
         sys.exit(1)
-
-    vector_db = pipeline.vectordb_provider
     console.print(f"[bold]Vector DB Provider:[/bold] {vector_db.get_name()}")
     console.print()
 
@@ -71,12 +177,15 @@ def vectors_stats(verbose: bool):
     console.print("[bold]Vector Counts by Type:[/bold]")
 
     try:
-        # Count regular chunks (exclude summaries)
-        total_chunks = vector_db.count_by_filter({})
-        console.print(f"  Total vectors: {total_chunks}")
+        # Total and summary counts are independent; issue both at once so
+        # the command waits on one round-trip instead of two
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            total_future = executor.submit(vector_db.count_by_filter, {})
+            summary_future = executor.submit(vector_db.count_by_filter, {"_type": "document_summary"})
+            total_chunks = total_future.result()
+            summary_count = summary_future.result()
 
-        # Count document summaries
-        summary_count = vector_db.count_by_filter({"_type": "document_summary"})
+        console.print(f"  Total vectors: {total_chunks}")
         console.print(f"  Document summaries: {summary_count}")
         console.print(f"  Regular chunks: {total_chunks - summary_count}")
     except NotImplementedError:
@@ -85,12 +194,14 @@ def vectors_stats(verbose: bool):
         console.print(f"  [red]Error counting vectors: {e}[/red]")
 
 
-@vectors.command(name='list')
+@vectors.command(name='list', short_help='List vectors with optional filtering')
 @click.option('--namespace', '-n', default=None, help='Filter by namespace')
 @click.option('--doc-id', '-d', default=None, help='Filter by document ID')
 @click.option('--type', '-t', 'vector_type', default=None, help='Filter by _type (e.g., document_summary)')
 @click.option('--limit', '-l', type=int, default=100, help='Maximum results (default: 100)')
-@click.option('--output', '-o', type=click.Path(path_type=Path), help='Output to JSON file')
+@click.option('--output', '-o', type=click.Path(path_type=Path), help='Output to JSON file (.jsonl for JSON Lines)')
+@click.option('--format', '-f', 'fmt', type=click.Choice(['records', 'columnar']), default='records',
+              help='Output layout (records=one object per row, columnar=one list per field)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 def vectors_list(
     namespace: str | None,
@@ -98,21 +209,19 @@ def vectors_list(
     vector_type: str | None,
     limit: int,
     output: Path | None,
+    fmt: str,
     verbose: bool
 ):
     """List vectors with optional filtering."""
     setup_logging(verbose)
 
-    console.print("[bold]Initializing pipeline...[/bold]")
+    console.print("[bold]Initializing vector DB provider...[/bold]")
     try:
-        from stache_ai.rag.pipeline import get_pipeline
-        pipeline = get_pipeline()
+        vector_db = get_vectordb_provider()
     except Exception as e:
-        console.print(f"[red]Error initializing pipeline: {e}[/red]")
+        console.print(f"[red]Error initializing vector DB provider: {e}[/red]")
         sys.exit(1)
 
-    vector_db = pipeline.vectordb_provider
-
     # Build filter
     filter_dict = {}
     if namespace:
@@ -127,7 +236,16 @@ def vectors_list(
     console.print()
 
     try:
-        results = vector_db.list_by_filter(filter=filter_dict, limit=limit)
+        if output:
+            results = vector_db.list_by_filter(filter=filter_dict, limit=limit)
+        else:
+            # The table only shows grouping fields and DISPLAY_ROWS rows; one
+            # extra row is enough to tell whether there are more
+            results = vector_db.list_by_filter(
+                filter=filter_dict,
+                fields=GROUPING_FIELDS,
+                limit=min(limit, DISPLAY_ROWS + 1)
+            )
     except NotImplementedError:
         console.print("[red]list_by_filter not supported by this provider[/red]")
         sys.exit(1)
@@ -135,11 +253,16 @@ def vectors_list(
         console.print(f"[red]Error listing vectors: {e}[/red]")
         sys.exit(1)
 
-    console.print(f"[bold]Found:[/bold] {len(results)} vectors")
+    if output or len(results) <= DISPLAY_ROWS:
+        console.print(f"[bold]Found:[/bold] {len(results)} vectors")
+    else:
+        console.print(f"[bold]Found:[/bold] more than {DISPLAY_ROWS} vectors")
 
     if output:
-        # Write to JSON file
-        output.write_text(json.dumps(results, indent=2, default=str), encoding='utf-8')
+        if fmt == 'columnar':
+            write_json_output(output, {'columns': to_columnar(results)})
+        else:
+            write_json_output(output, results)
         console.print(f"[green]Saved to {output}[/green]")
     else:
         # Display in table
@@ -151,27 +274,125 @@ def vectors_list(
             table.add_column("Doc ID", max_width=15)
             table.add_column("Type")
 
-            for r in results[:50]:  # Limit display to 50
-                table.add_row(
-                    str(r.get('key', r.get('id', 'N/A')))[:20],
-                    r.get('namespace', 'N/A'),
-                    r.get('filename', 'N/A')[:30] if r.get('filename') else 'N/A',
-                    str(r.get('doc_id', 'N/A'))[:15] if r.get('doc_id') else 'N/A',
-                    r.get('_type', 'chunk')
-                )
+            # Build display columns up front, then hand Rich ready-made rows
+            display = results[:DISPLAY_ROWS]
+            ids = [str(r.get('key', r.get('id', 'N/A')))[:20] for r in display]
+            namespaces = [r.get('namespace', 'N/A') for r in display]
+            filenames = [(r.get('filename') or 'N/A')[:30] for r in display]
+            doc_ids = [str(r.get('doc_id') or 'N/A')[:15] for r in display]
+            types = [r.get('_type', 'chunk') for r in display]
+
+            for row in zip(ids, namespaces, filenames, doc_ids, types, strict=True):
+                table.add_row(*row)
 
             console.print(table)
-            if len(results) > 50:
-                console.print(f"  ... and {len(results) - 50} more (use --output to see all)")
+            if len(results) > DISPLAY_ROWS:
+                console.print("  ... and more (use --output to see all)")
 
 
-@vectors.command(name='documents')
+class _DocumentCollector:
+    """Flat per-field collectors for grouping vectors by doc_id.
+
+    Each field lives in its own dict keyed by doc_id; the per-document
+    records are only assembled once, in ``build``.
+    """
+
+    def __init__(self):
+        self.namespaces: dict[str, str] = {}
+        self.filenames: dict[str, str] = {}
+        self.summary_ids: dict[str, Any] = {}
+        self.summary_rows: Counter = Counter()
+
+    def add(self, r: dict[str, Any]) -> None:
+        get = r.get
+        doc_id = get('doc_id')
+        if not doc_id:
+            return
+
+        namespace = get('namespace')
+        if namespace:
+            self.namespaces[doc_id] = namespace
+        filename = get('filename')
+        if filename:
+            self.filenames[doc_id] = filename
+
+        if get('_type') == 'document_summary':
+            self.summary_ids[doc_id] = get('key', get('id'))
+            self.summary_rows[doc_id] += 1
+
+    def build(self, vector_counts: dict[str, int]) -> dict[str, dict[str, Any]]:
+        """Assemble records; vector_counts includes summary vectors"""
+        summary_rows = self.summary_rows
+        return {
+            doc_id: {
+                'chunk_count': count - summary_rows[doc_id],
+                'has_summary': summary_rows[doc_id] > 0,
+                'namespace': self.namespaces.get(doc_id),
+                'filename': self.filenames.get(doc_id),
+                'summary_id': self.summary_ids.get(doc_id),
+            }
+            for doc_id, count in vector_counts.items()
+        }
+
+
+def _group_documents_by_scan(
+    vector_db,
+    filter_dict: dict[str, Any]
+) -> tuple[dict[str, dict[str, Any]], int]:
+    """Group every vector by doc_id client-side (providers without group_count)"""
+    collector = _DocumentCollector()
+    add = collector.add
+    vector_counts: Counter = Counter()
+
+    # Pages are streamed from the provider and grouped as they arrive
+    for batch in vector_db.iter_by_filter(filter=filter_dict, fields=GROUPING_FIELDS):
+        # Tally the doc_id column in C; the loop below only tracks names/summaries
+        vector_counts.update(map(dict.get, batch, repeat('doc_id')))
+        for r in batch:
+            add(r)
+
+    no_doc_id_count = vector_counts.pop(None, 0) + vector_counts.pop('', 0)
+    return collector.build(vector_counts), no_doc_id_count
+
+
+def _group_documents_aggregated(
+    vector_db,
+    filter_dict: dict[str, Any],
+    vector_counts: dict[str, int]
+) -> tuple[dict[str, dict[str, Any]], int] | None:
+    """Build per-document info from server-side counts plus summary records only.
+
+    ``vector_counts`` comes from ``group_count('doc_id')`` and includes summary
+    vectors, which are subtracted back out. Namespace/filename come from each
+    document's summary record, so this returns None when any document has no
+    summary; the caller then falls back to the full scan rather than querying
+    documents one by one.
+    """
+    collector = _DocumentCollector()
+    add = collector.add
+
+    summary_filter = {**filter_dict, '_type': 'document_summary'}
+    for batch in vector_db.iter_by_filter(filter=summary_filter, fields=GROUPING_FIELDS):
+        for r in batch:
+            add(r)
+
+    if any(doc_id not in collector.summary_rows for doc_id in vector_counts):
+        return None
+
+    no_doc_id_count = vector_db.count_by_filter(filter_dict) - sum(vector_counts.values())
+    return collector.build(vector_counts), no_doc_id_count
+
+
+@vectors.command(name='documents', short_help='Group vectors by document ID')
 @click.option('--namespace', '-n', default=None, help='Filter by namespace')
-@click.option('--output', '-o', type=click.Path(path_type=Path), help='Output to JSON file')
+@click.option('--output', '-o', type=click.Path(path_type=Path), help='Output to JSON file (.jsonl for JSON Lines)')
+@click.option('--format', '-f', 'fmt', type=click.Choice(['records', 'columnar']), default='records',
+              help='Output layout (records=one object per row, columnar=one list per field)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 def vectors_documents(
     namespace: str | None,
     output: Path | None,
+    fmt: str,
     verbose: bool
 ):
     """Group vectors by document ID to discover documents.
@@ -181,16 +402,13 @@ def vectors_documents(
     """
     setup_logging(verbose)
 
-    console.print("[bold]Initializing pipeline...[/bold]")
+    console.print("[bold]Initializing vector DB provider...[/bold]")
     try:
-        from stache_ai.rag.pipeline import get_pipeline
-        pipeline = get_pipeline()
+        vector_db = get_vectordb_provider()
     except Exception as e:
-        console.print(f"[red]Error initializing pipeline: {e}[/red]")
+        console.print(f"[red]Error initializing vector DB provider: {e}[/red]")
         sys.exit(1)
 
-    vector_db = pipeline.vectordb_provider
-
     # Build filter
     filter_dict = {}
     if namespace:
@@ -199,8 +417,17 @@ def vectors_documents(
     console.print("[bold]Scanning vectors...[/bold]")
 
     try:
-        # Get all vectors (may need pagination for large datasets)
-        results = vector_db.list_by_filter(filter=filter_dict, limit=100000)
+        try:
+            vector_counts = vector_db.group_count('doc_id', filter=filter_dict)
+        except NotImplementedError:
+            vector_counts = None
+
+        grouped = None
+        if vector_counts is not None:
+            grouped = _group_documents_aggregated(vector_db, filter_dict, vector_counts)
+        if grouped is None:
+            grouped = _group_documents_by_scan(vector_db, filter_dict)
+        documents, no_doc_id_count = grouped
     except NotImplementedError:
         console.print("[red]list_by_filter not supported by this provider[/red]")
         sys.exit(1)
@@ -208,33 +435,6 @@ def vectors_documents(
         console.print(f"[red]Error listing vectors: {e}[/red]")
         sys.exit(1)
 
-    # Group by doc_id
-    documents: dict[str, dict[str, Any]] = defaultdict(lambda: {
-        'chunk_count': 0,
-        'has_summary': False,
-        'namespace': None,
-        'filename': None,
-        'summary_id': None
-    })
-
-    no_doc_id_count = 0
-
-    for r in results:
-        doc_id = r.get('doc_id')
-        if not doc_id:
-            no_doc_id_count += 1
-            continue
-
-        doc = documents[doc_id]
-        doc['namespace'] = r.get('namespace') or doc['namespace']
-        doc['filename'] = r.get('filename') or doc['filename']
-
-        if r.get('_type') == 'document_summary':
-            doc['has_summary'] = True
-            doc['summary_id'] = r.get('key', r.get('id'))
-        else:
-            doc['chunk_count'] += 1
-
     console.print(f"[bold]Found:[/bold] {len(documents)} unique documents")
     console.print(f"[bold]Vectors without doc_id:[/bold] {no_doc_id_count}")
     console.print()
@@ -254,9 +454,13 @@ def vectors_documents(
             'namespace_filter': namespace,
             'total_documents': len(doc_list),
             'vectors_without_doc_id': no_doc_id_count,
-            'documents': doc_list
         }
-        output.write_text(json.dumps(export_data, indent=2, default=str), encoding='utf-8')
+        if fmt == 'columnar':
+            export_data['columns'] = to_columnar(doc_list)
+            write_json_output(output, export_data)
+        else:
+            export_data['documents'] = doc_list
+            write_json_output(output, export_data, records_key='documents')
         console.print(f"[green]Saved to {output}[/green]")
     else:
         # Display summary table
@@ -267,18 +471,19 @@ def vectors_documents(
         table.add_column("Chunks", justify="right")
         table.add_column("Summary", justify="center")
 
-        for doc in doc_list[:50]:
-            table.add_row(
-                str(doc['doc_id'])[:20],
-                doc['namespace'] or 'N/A',
-                (doc['filename'] or 'N/A')[:35],
-                str(doc['chunk_count']),
-                "[green]Yes[/green]" if doc['has_summary'] else "[yellow]No[/yellow]"
-            )
+        display = doc_list[:DISPLAY_ROWS]
+        doc_ids = [str(doc['doc_id'])[:20] for doc in display]
+        namespaces = [doc['namespace'] or 'N/A' for doc in display]
+        filenames = [(doc['filename'] or 'N/A')[:35] for doc in display]
+        chunk_counts = [str(doc['chunk_count']) for doc in display]
+        summaries = ["[green]Yes[/green]" if doc['has_summary'] else "[yellow]No[/yellow]" for doc in display]
+
+        for row in zip(doc_ids, namespaces, filenames, chunk_counts, summaries, strict=True):
+            table.add_row(*row)
 
         console.print(table)
-        if len(doc_list) > 50:
-            console.print(f"  ... and {len(doc_list) - 50} more (use --output to see all)")
+        if len(doc_list) > DISPLAY_ROWS:
+            console.print(f"  ... and {len(doc_list) - DISPLAY_ROWS} more (use --output to see all)")
 
     # Summary
     console.print()
@@ -289,15 +494,49 @@ def vectors_documents(
     console.print(f"  Documents without summaries: {without_summary}")
 
 
-@vectors.command(name='create-index')
+def _list_existing_documents(doc_index, namespace: str | None) -> set[tuple[str, str]]:
+    """Fetch (filename, namespace) for every index entry, active or trashed.
+
+    Covers everything document_exists would report, in paginated passes
+    over list_documents and list_trash, so callers need no per-document
+    lookups. Providers without trash support only have active entries.
+    """
+    existing = set()
+    next_key = None
+
+    while True:
+        page = doc_index.list_documents(namespace=namespace, limit=1000, last_evaluated_key=next_key)
+        for d in page.get('documents', []):
+            existing.add((d.get('filename'), d.get('namespace')))
+        next_key = page.get('next_key')
+        if not next_key:
+            break
+
+    try:
+        while True:
+            page = doc_index.list_trash(namespace=namespace, limit=100, next_key=next_key)
+            for d in page.get('documents', []):
+                existing.add((d.get('filename'), d.get('namespace')))
+            next_key = page.get('next_key')
+            if not next_key:
+                break
+    except NotImplementedError:
+        pass  # No soft delete, so nothing can be trashed
+
+    return existing
+
+
+@vectors.command(name='create-index', short_help='Create document index entries from vectors')
 @click.option('--namespace', '-n', default=None, help='Filter by namespace')
 @click.option('--dry-run', is_flag=True, help='Preview changes without creating entries')
 @click.option('--skip-existing', is_flag=True, default=True, help='Skip documents that already exist in index (default: True)')
+@click.option('--parallel', '-P', default=8, type=int, help='Number of concurrent index writes (default: 8)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 def vectors_create_index(
     namespace: str | None,
     dry_run: bool,
     skip_existing: bool,
+    parallel: int,
     verbose: bool
 ):
     """Create document index entries from vectors.
@@ -316,17 +555,14 @@ def vectors_create_index(
         console.print("[yellow][DRY RUN] No changes will be made.[/yellow]")
         console.print()
 
-    console.print("[bold]Initializing pipeline...[/bold]")
+    console.print("[bold]Initializing providers...[/bold]")
     try:
-        from stache_ai.rag.pipeline import get_pipeline
-        pipeline = get_pipeline()
+        vector_db = get_vectordb_provider()
+        doc_index = get_document_index_provider()
     except Exception as e:
-        console.print(f"[red]Error initializing pipeline: {e}[/red]")
+        console.print(f"[red]Error initializing providers: {e}[/red]")
         sys.exit(1)
 
-    vector_db = pipeline.vectordb_provider
-    doc_index = pipeline.document_index_provider
-
     if doc_index is None:
         console.print("[red]Error: Document index provider not available[/red]")
         sys.exit(1)
@@ -342,15 +578,6 @@ def vectors_create_index(
 
     console.print("[bold]Scanning vectors...[/bold]")
 
-    try:
-        results = vector_db.list_by_filter(filter=filter_dict, limit=100000)
-    except NotImplementedError:
-        console.print("[red]list_by_filter not supported by this provider[/red]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]Error listing vectors: {e}[/red]")
-        sys.exit(1)
-
     # Group by doc_id
     documents: dict[str, dict[str, Any]] = defaultdict(lambda: {
         'chunk_ids': [],
@@ -363,26 +590,42 @@ def vectors_create_index(
         'file_size': None
     })
 
-    for r in results:
-        doc_id = r.get('doc_id')
-        if not doc_id:
-            continue
-
-        doc = documents[doc_id]
-        doc['namespace'] = r.get('namespace') or doc['namespace']
-        doc['filename'] = r.get('filename') or doc['filename']
-
-        vector_id = r.get('key', r.get('id'))
+    try:
+        for batch in vector_db.iter_by_filter(filter=filter_dict, fields=INDEX_FIELDS):
+            for r in batch:
+                get = r.get
+                doc_id = get('doc_id')
+                if not doc_id:
+                    continue
 
-        if r.get('_type') == 'document_summary':
-            doc['summary'] = r.get('text') or r.get('summary')
-            doc['summary_embedding_id'] = vector_id
-            doc['headings'] = r.get('headings')
-            doc['file_type'] = r.get('file_type')
-            doc['file_size'] = r.get('file_size')
-        else:
-            if vector_id:
-                doc['chunk_ids'].append(vector_id)
+                doc = documents[doc_id]
+                doc['namespace'] = get('namespace') or doc['namespace']
+                doc['filename'] = get('filename') or doc['filename']
+
+                # Short-circuit: only look up 'id' when 'key' is absent
+                vector_id = get('key') or get('id')
+
+                if get('_type') == 'document_summary':
+                    doc['summary_embedding_id'] = vector_id
+                    doc['headings'] = get('headings')
+                    doc['file_type'] = get('file_type')
+                    doc['file_size'] = get('file_size')
+                elif vector_id:
+                    doc['chunk_ids'].append(vector_id)
+
+        # Summary text is only fetched for summary records, not every chunk
+        summary_filter = {**filter_dict, '_type': 'document_summary'}
+        for batch in vector_db.iter_by_filter(filter=summary_filter, fields=SUMMARY_TEXT_FIELDS):
+            for r in batch:
+                doc_id = r.get('doc_id')
+                if doc_id in documents:
+                    documents[doc_id]['summary'] = r.get('text') or r.get('summary')
+    except NotImplementedError:
+        console.print("[red]list_by_filter not supported by this provider[/red]")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]Error listing vectors: {e}[/red]")
+        sys.exit(1)
 
     console.print(f"[bold]Found:[/bold] {len(documents)} documents with doc_id")
 
@@ -390,19 +633,30 @@ def vectors_create_index(
     to_create = []
     skipped = 0
 
+    existing = None
+    if skip_existing:
+        try:
+            existing = _list_existing_documents(doc_index, namespace)
+        except Exception as e:
+            logger.debug(f"Could not prefetch document index, checking per document: {e}")
+
     for doc_id, data in documents.items():
         if not data['namespace'] or not data['filename']:
             skipped += 1
             continue
 
         if skip_existing:
-            try:
-                exists = doc_index.document_exists(data['filename'], data['namespace'])
-                if exists:
+            if existing is not None:
+                if (data['filename'], data['namespace']) in existing:
                     skipped += 1
                     continue
-            except Exception:
-                pass  # Proceed if we can't check
+            else:
+                try:
+                    if doc_index.document_exists(data['filename'], data['namespace']):
+                        skipped += 1
+                        continue
+                except Exception:
+                    pass  # Proceed if we can't check
 
         to_create.append({'doc_id': doc_id, **data})
 
@@ -427,29 +681,36 @@ def vectors_create_index(
         console.print("Aborted.")
         return
 
-    # Create entries
+    # Create entries (each write is an independent index round-trip)
     success = 0
     failed = 0
 
-    with click.progressbar(to_create, label='Creating entries') as docs:
-        for doc in docs:
+    def create_entry(doc: dict[str, Any]) -> None:
+        doc_index.create_document(
+            doc_id=doc['doc_id'],
+            filename=doc['filename'],
+            namespace=doc['namespace'],
+            chunk_ids=doc['chunk_ids'],
+            summary=doc['summary'],
+            summary_embedding_id=doc['summary_embedding_id'],
+            headings=doc['headings'],
+            file_type=doc['file_type'],
+            file_size=doc['file_size']
+        )
+
+    with click.progressbar(length=len(to_create), label='Creating entries') as bar, \
+            ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        futures = {executor.submit(create_entry, doc): doc for doc in to_create}
+
+        for future in as_completed(futures):
             try:
-                doc_index.create_document(
-                    doc_id=doc['doc_id'],
-                    filename=doc['filename'],
-                    namespace=doc['namespace'],
-                    chunk_ids=doc['chunk_ids'],
-                    summary=doc['summary'],
-                    summary_embedding_id=doc['summary_embedding_id'],
-                    headings=doc['headings'],
-                    file_type=doc['file_type'],
-                    file_size=doc['file_size']
-                )
+                future.result()
                 success += 1
             except Exception as e:
                 failed += 1
                 if verbose:
-                    logger.error(f"Failed to create {doc['filename']}: {e}")
+                    logger.error(f"Failed to create {futures[future]['filename']}: {e}")
+            bar.update(1)
 
     console.print()
     console.print("[bold]Results:[/bold]")
@@ -1,9 +1,60 @@
 """Configuration management for Stache - Extensible provider architecture"""
 
+from functools import cache
 from typing import Literal
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Known output dimensions per embedding provider and model
+_EMBEDDING_DIMENSIONS = {
+    "openai": {
+        "text-embedding-3-small": 1536,
+        "text-embedding-3-large": 3072,
+    },
+    "cohere": {
+        "embed-english-v3.0": 1024,
+    },
+    "ollama": {
+        "mxbai-embed-large": 1024,
+        "nomic-embed-text": 768,
+        "all-minilm": 384,
+        "snowflake-arctic-embed": 1024,
+        "bge-large": 1024,
+        "bge-m3": 1024,
+    },
+    "mixedbread": {
+        "mxbai-embed-large-v1": 1024,
+        "deepset-mxbai-embed-de-large-v1": 1024,
+        "mxbai-embed-2d-large-v1": 1024,
+    },
+    "bedrock": {
+        "amazon.titan-embed-text-v1": 1536,
+        "amazon.titan-embed-text-v2:0": 1024,
+        "cohere.embed-english-v3": 1024,
+        "cohere.embed-multilingual-v3": 1024,
+    },
+}
+
+# (check, message) pairs for validate_aws_config; check returns True when a
+# setting required by the selected AWS providers is missing
+_AWS_REQUIREMENTS = (
+    # S3 Vectors configuration
+    (
+        lambda s: s.vectordb_provider == "s3vectors" and not s.s3vectors_bucket,
+        "S3VECTORS_BUCKET environment variable is required when vectordb_provider='s3vectors'",
+    ),
+    # DynamoDB configuration
+    (
+        lambda s: s.namespace_provider == "dynamodb" and not s.dynamodb_namespace_table,
+        "DYNAMODB_NAMESPACE_TABLE environment variable is required when namespace_provider='dynamodb'",
+    ),
+    # Bedrock configuration
+    (
+        lambda s: "bedrock" in (s.llm_provider, s.embedding_provider) and not s.aws_region,
+        "AWS_REGION environment variable is required when using Bedrock providers",
+    ),
+)
 
 
 class Settings(BaseSettings):
@@ -220,6 +271,11 @@ class Settings(BaseSettings):
     # Lambda has 6MB payload limit, so this protects against near-limit payloads.
     max_ingest_text_bytes: int = 10 * 1024 * 1024  # 10MB
 
+    # Seconds that core operations cache do_get_document / do_list_namespaces
+    # results per caller. 0 disables. Writes made through other processes or
+    # routes are only seen once the entry expires, so keep this short.
+    doc_cache_ttl: int = 0
+
     # ===== Middleware Configuration =====
     # Enrichment
     enrichment_enabled: bool = True
@@ -242,6 +298,9 @@ class Settings(BaseSettings):
     )
     ai_enrichment_max_tokens: int = 1024
     ai_enrichment_temperature: float = 0.0  # Deterministic for metadata
+    # Seconds to reuse structured output for an identical enrichment prompt
+    # (e.g. re-ingested documents). 0 disables; ignored above temperature 0.1.
+    ai_enrichment_cache_ttl: int = 0
 
     # Post-ingest processing
     enable_summary_generation: bool = Field(
@@ -364,10 +423,11 @@ class Settings(BaseSettings):
     upload_dir: str = "uploads"
     queue_dir: str = "/data/queue"  # Shared directory for pending uploads from dropbox
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"  # Ignore unknown fields from .env to handle old config variables
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",  # Ignore unknown fields from .env to handle old config variables
+    )
 
     def get_llm_model(self) -> str:
         """Get LLM model name based on provider"""
@@ -400,41 +460,12 @@ class Settings(BaseSettings):
 
     def get_embedding_dimensions(self) -> int:
         """Get embedding dimensions based on provider/model"""
-        dimension_map = {
-            "openai": {
-                "text-embedding-3-small": 1536,
-                "text-embedding-3-large": 3072,
-            },
-            "cohere": {
-                "embed-english-v3.0": 1024,
-            },
-            "ollama": {
-                "mxbai-embed-large": 1024,
-                "nomic-embed-text": 768,
-                "all-minilm": 384,
-                "snowflake-arctic-embed": 1024,
-                "bge-large": 1024,
-                "bge-m3": 1024,
-            },
-            "mixedbread": {
-                "mxbai-embed-large-v1": 1024,
-                "deepset-mxbai-embed-de-large-v1": 1024,
-                "mxbai-embed-2d-large-v1": 1024,
-            },
-            "bedrock": {
-                "amazon.titan-embed-text-v1": 1536,
-                "amazon.titan-embed-text-v2:0": 1024,
-                "cohere.embed-english-v3": 1024,
-                "cohere.embed-multilingual-v3": 1024,
-            },
-        }
-
         # For fallback, use primary provider's dimensions
         provider = self.embedding_provider
         if provider == "fallback":
             provider = self.embedding_fallback_primary
 
-        provider_models = dimension_map.get(provider, {})
+        provider_models = _EMBEDDING_DIMENSIONS.get(provider, {})
         model = self.get_embedding_model()
         return provider_models.get(model, self.embedding_dimension)
 
@@ -444,28 +475,7 @@ class Settings(BaseSettings):
         Raises:
             ValueError: If required AWS settings are missing for selected providers
         """
-        errors = []
-
-        # Check S3 Vectors configuration
-        if self.vectordb_provider == "s3vectors":
-            if not self.s3vectors_bucket:
-                errors.append(
-                    "S3VECTORS_BUCKET environment variable is required when vectordb_provider='s3vectors'"
-                )
-
-        # Check DynamoDB configuration
-        if self.namespace_provider == "dynamodb":
-            if not self.dynamodb_namespace_table:
-                errors.append(
-                    "DYNAMODB_NAMESPACE_TABLE environment variable is required when namespace_provider='dynamodb'"
-                )
-
-        # Check Bedrock configuration
-        if self.llm_provider == "bedrock" or self.embedding_provider == "bedrock":
-            if not self.aws_region:
-                errors.append(
-                    "AWS_REGION environment variable is required when using Bedrock providers"
-                )
+        errors = [message for is_missing, message in _AWS_REQUIREMENTS if is_missing(self)]
 
         if errors:
             raise ValueError(
@@ -473,5 +483,15 @@ class Settings(BaseSettings):
             )
 
 
-# Global settings instance
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Get the global settings instance, created on first use"""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Global settings instance; built lazily so importing this module doesn't
+    # read .env and validate every field until settings are actually needed
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
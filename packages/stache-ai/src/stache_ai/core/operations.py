@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
-import uuid
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from stache_ai.config import settings
+from stache_ai.config import get_settings
+from stache_ai.ingestion import get_ingestion_service
+from stache_ai.ingestion.base import strip_transport
 from stache_ai.providers import NamespaceProviderFactory
 from stache_ai.sanitize import strip_reserved_metadata
+from stache_ai.utils.text import utf8_len
+from stache_ai.utils.ttl_cache import TTLCache
 from stache_ai.rag.pipeline import get_pipeline
 
 if TYPE_CHECKING:
@@ -17,6 +24,46 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _new_request_id() -> str:
+    """Random request ID in the dashed 8-4-4-4-12 hex layout of a UUID.
+
+    Formats os.urandom bytes directly instead of building a UUID object;
+    request IDs are opaque tracking tokens, so no version bits are set.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Read caches for do_get_document / do_list_namespaces (settings.doc_cache_ttl)
+_document_cache = TTLCache(maxsize=1024)
+_namespace_list_cache = TTLCache(maxsize=64)
+
+
+def _cache_identity(context: "RequestContext | None"):
+    """Caller part of a read-cache key, or None when the call must not be cached.
+
+    Providers may scope reads by the caller, so entries are keyed per user and
+    roles. Contexts carrying custom state (principal claims, ACL middleware
+    data) can scope in ways this key cannot capture and bypass the cache.
+    """
+    if context is None:
+        return ()
+    if context.custom:
+        return None
+    return (context.user_id, tuple(context.roles))
+
+
+@lru_cache(maxsize=1)
+def _get_namespace_provider():
+    """Get the configured namespace provider, created once and reused.
+
+    Providers hold DB clients/connections, so building one per operation
+    re-opens them on every request. Call ``_get_namespace_provider.cache_clear()``
+    after changing settings (tests).
+    """
+    return NamespaceProviderFactory.create(get_settings())
+
+
 def _run_async(coro):
     """Run an async coroutine from sync code.
 
@@ -39,10 +86,10 @@ def _run_async(coro):
         return loop.run_until_complete(coro)
 
 
-def do_search(query: str, namespace: str = None, top_k: int = 20,
-              rerank: bool = True, filter: dict = None, request_id: str = None,
-              *, context: "RequestContext | None" = None) -> dict:
-    """Search knowledge base - shared by HTTP routes and external integrations
+async def aio_search(query: str, namespace: str = None, top_k: int = 20,
+                     rerank: bool = True, filter: dict = None, request_id: str = None,
+                     *, context: "RequestContext | None" = None) -> dict:
+    """Search knowledge base without blocking the event loop (async do_search)
 
     Args:
         query: Search query string
@@ -55,18 +102,20 @@ def do_search(query: str, namespace: str = None, top_k: int = 20,
     Returns:
         Dictionary with results and request_id
     """
-    request_id = request_id or str(uuid.uuid4())
+    request_id = request_id or _new_request_id()
 
     # Enforce top_k max 50
     if top_k > 50:
         top_k = 50
-        logger.warning(f"[{request_id}] top_k exceeded max of 50, clamping to 50")
+        logger.warning("[%s] top_k exceeded max of 50, clamping to 50", request_id)
 
-    logger.info(f"[{request_id}] Search: query={query[:50]}..., namespace={namespace}, top_k={top_k}, rerank={rerank}, filter={filter}")
+    # Lazy %-formatting: nothing is built when INFO is disabled
+    logger.info("[%s] Search: query=%.50s..., namespace=%s, top_k=%s, rerank=%s, filter=%s",
+                request_id, query, namespace, top_k, rerank, filter)
 
     try:
         pipeline = get_pipeline()
-        result = _run_async(pipeline.query(
+        result = await pipeline.query(
             question=query,
             top_k=top_k,
             synthesize=False,  # ALWAYS disable synthesis
@@ -74,10 +123,10 @@ def do_search(query: str, namespace: str = None, top_k: int = 20,
             rerank=rerank,
             filter=filter,
             context=context
-        ))
+        )
         return {"request_id": request_id, **result}
     except Exception as e:
-        logger.error(f"[{request_id}] Search failed: {e}")
+        logger.error("[%s] Search failed: %s", request_id, e)
         return {
             "request_id": request_id,
             "error": str(e),
@@ -86,11 +135,24 @@ def do_search(query: str, namespace: str = None, top_k: int = 20,
         }
 
 
-def do_ingest_text(text: str, metadata: dict = None, namespace: str = None,
-                   chunking_strategy: str = "recursive", prepend_metadata: list = None,
-                   request_id: str = None,
-                   *, context: "RequestContext | None" = None) -> dict:
-    """Ingest text - shared by HTTP routes and external integrations
+def do_search(query: str, namespace: str = None, top_k: int = 20,
+              rerank: bool = True, filter: dict = None, request_id: str = None,
+              *, context: "RequestContext | None" = None) -> dict:
+    """Search knowledge base - shared by HTTP routes and external integrations
+
+    Sync wrapper around aio_search; see it for arguments and return value.
+    """
+    return _run_async(aio_search(
+        query=query, namespace=namespace, top_k=top_k, rerank=rerank,
+        filter=filter, request_id=request_id, context=context
+    ))
+
+
+async def aio_ingest_text(text: str, metadata: dict = None, namespace: str = None,
+                          chunking_strategy: str = "recursive", prepend_metadata: list = None,
+                          request_id: str = None,
+                          *, context: "RequestContext | None" = None) -> dict:
+    """Ingest text without blocking the event loop (async do_ingest_text)
 
     Args:
         text: Text to ingest
@@ -106,37 +168,43 @@ def do_ingest_text(text: str, metadata: dict = None, namespace: str = None,
     Raises:
         ValueError: If text exceeds max_ingest_text_bytes (default 10MB, configurable)
     """
-    request_id = request_id or str(uuid.uuid4())
+    request_id = request_id or _new_request_id()
 
     # Enforce max text size (configurable via MAX_INGEST_TEXT_BYTES env var)
-    text_bytes = text.encode('utf-8')
-    max_bytes = settings.max_ingest_text_bytes
-    if len(text_bytes) > max_bytes:
-        size_mb = len(text_bytes) / 1024 / 1024
+    text_bytes = utf8_len(text)
+    max_bytes = get_settings().max_ingest_text_bytes
+    if text_bytes > max_bytes:
+        size_mb = text_bytes / 1024 / 1024
         limit_mb = max_bytes / 1024 / 1024
         error_msg = f"Text exceeds maximum size of {limit_mb:.1f}MB (got {size_mb:.1f}MB)"
-        logger.error(f"[{request_id}] {error_msg}")
+        logger.error("[%s] %s", request_id, error_msg)
         raise ValueError(error_msg)
 
     metadata = strip_reserved_metadata(metadata)
 
-    logger.info(f"[{request_id}] Ingest: {len(text)} chars, namespace={namespace}, strategy={chunking_strategy}")
+    logger.info("[%s] Ingest: %s chars, namespace=%s, strategy=%s", request_id, len(text), namespace, chunking_strategy)
 
     try:
         pipeline = get_pipeline()
-        result = _run_async(pipeline.ingest_text(
+        result = await pipeline.ingest_text(
             text=text,
             metadata=metadata,
             namespace=namespace,
             chunking_strategy=chunking_strategy,
             prepend_metadata=prepend_metadata,
             context=context
-        ))
+        )
+        # A new version (or re-ingest under the same doc_id) makes cached
+        # copies of the document stale, as do_delete_document does
+        stale = {result.get("doc_id"), result.get("previous_doc_id")} - {None}
+        if stale:
+            ns = result.get("namespace")
+            _document_cache.invalidate(lambda key: key[0] in stale and key[1] == ns)
         return {"request_id": request_id, **result}
     except ValueError:
         raise
     except Exception as e:
-        logger.error(f"[{request_id}] Ingest failed: {e}")
+        logger.error("[%s] Ingest failed: %s", request_id, e)
         return {
             "request_id": request_id,
             "error": str(e),
@@ -144,6 +212,163 @@ def do_ingest_text(text: str, metadata: dict = None, namespace: str = None,
         }
 
 
+def do_ingest_text(text: str, metadata: dict = None, namespace: str = None,
+                   chunking_strategy: str = "recursive", prepend_metadata: list = None,
+                   request_id: str = None,
+                   *, context: "RequestContext | None" = None) -> dict:
+    """Ingest text - shared by HTTP routes and external integrations
+
+    Sync wrapper around aio_ingest_text; see it for arguments and return value.
+
+    Raises:
+        ValueError: If text exceeds max_ingest_text_bytes (default 10MB, configurable)
+    """
+    return _run_async(aio_ingest_text(
+        text=text, metadata=metadata, namespace=namespace,
+        chunking_strategy=chunking_strategy, prepend_metadata=prepend_metadata,
+        request_id=request_id, context=context
+    ))
+
+
+def do_ingest_text_batch(items: list[dict], request_id: str = None, max_workers: int = 4,
+                         *, context: "RequestContext | None" = None) -> dict:
+    """Ingest several texts at once - shared by HTTP routes and external integrations
+
+    Each item is a dict of do_ingest_text arguments (text, metadata,
+    namespace, chunking_strategy, prepend_metadata, request_id). Documents
+    still go through their own guard, dedup and enrichment pass, but up to
+    max_workers of them are ingested concurrently so their embedding and
+    vector DB round-trips overlap.
+
+    Args:
+        items: Texts to ingest, each a dict with at least "text"
+        request_id: Optional request ID for tracking the batch
+        max_workers: Maximum number of documents ingested at the same time
+
+    Returns:
+        Dictionary with per-item results (in input order), succeeded and
+        failed counts, and request_id. Items without their own request_id
+        are tagged "<batch request_id>-<index>". Oversized items fail
+        individually instead of aborting the batch.
+    """
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Ingest batch: %s texts, max_workers=%s", request_id, len(items), max_workers)
+
+    def ingest_one(index: int, item: dict) -> dict:
+        item_request_id = item.get("request_id") or f"{request_id}-{index}"
+        # Each ingestion writes providers/job state into context.custom, so
+        # concurrent items get their own copy of the caller's context
+        item_context = None
+        if context is not None:
+            item_context = dataclasses.replace(context, custom=dict(context.custom))
+        try:
+            return do_ingest_text(**{**item, "request_id": item_request_id}, context=item_context)
+        except ValueError as e:
+            return {"request_id": item_request_id, "error": str(e), "success": False}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        results = list(executor.map(ingest_one, range(len(items)), items))
+
+    failed = sum(1 for r in results if "error" in r)
+    return {
+        "request_id": request_id,
+        "results": results,
+        "succeeded": len(results) - failed,
+        "failed": failed
+    }
+
+
+def do_submit_ingest_text(text: str, metadata: dict = None, namespace: str = None,
+                          chunking_strategy: str = "recursive", request_id: str = None,
+                          *, context: "RequestContext | None" = None) -> dict:
+    """Queue text for ingestion - shared by HTTP routes and external integrations
+
+    Unlike do_ingest_text, this hands the text to the ingestion service and
+    returns as soon as the job is enqueued. With a queue-backed tier the
+    embedding and indexing happen in the ingest workers and callers poll
+    do_get_ingest_status; the inline tier finishes the job before returning.
+
+    Args:
+        text: Text to ingest
+        metadata: Optional metadata dictionary
+        namespace: Optional namespace for isolation
+        chunking_strategy: Strategy for chunking (recursive, markdown, semantic, character)
+        request_id: Optional request ID for tracking
+
+    Returns:
+        Dictionary with job_id, status and request_id, or error dict
+
+    Raises:
+        ValueError: If text exceeds the ingestion service's inline text limit
+    """
+    request_id = request_id or _new_request_id()
+    namespace = namespace or get_settings().default_namespace or "default"
+    metadata = strip_reserved_metadata(metadata)
+
+    # Jobs are owned by the caller's principal (full principal when the HTTP
+    # layer attached one, else the bare user id)
+    requested_by = None
+    if context is not None:
+        requested_by = context.custom.get("principal") or context.user_id
+
+    logger.info("[%s] Submit ingest: %s chars, namespace=%s, strategy=%s", request_id, len(text), namespace, chunking_strategy)
+
+    try:
+        service = get_ingestion_service()
+        job = _run_async(service.submit(
+            namespace=namespace,
+            content_type="text",
+            requested_by=requested_by,
+            source=context.source if context is not None else "api",
+            metadata=metadata,
+            text=text,
+            chunking_strategy=chunking_strategy
+        ))
+        return {"request_id": request_id, "job_id": job.job_id, "status": job.status.value}
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error("[%s] Submit ingest failed: %s", request_id, e)
+        return {
+            "request_id": request_id,
+            "error": str(e),
+            "success": False
+        }
+
+
+def do_get_ingest_status(job_id: str, request_id: str = None,
+                         *, context: "RequestContext | None" = None) -> dict:
+    """Get the status of a queued ingestion job
+
+    Args:
+        job_id: Job ID returned by do_submit_ingest_text
+        request_id: Optional request ID for tracking
+
+    Returns:
+        Job dictionary (status, chunks_created, doc_id, ...) with request_id,
+        or error dict. A job the caller's principal cannot see is reported as
+        not found.
+    """
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Get ingest status: job_id=%s", request_id, job_id)
+
+    principal = None
+    if context is not None:
+        from stache_ai.identity import Principal
+        principal = Principal.of(context.custom.get("principal") or context.user_id)
+
+    try:
+        job = get_ingestion_service().get_job(job_id, principal=principal)
+        if job is None:
+            return {"request_id": request_id, "error": f"Job not found: {job_id}"}
+
+        # Non-terminal jobs still carry the inline text in their metadata
+        return {"request_id": request_id, **job.to_dict(), "metadata": strip_transport(job.metadata)}
+    except Exception as e:
+        logger.error("[%s] Get ingest status failed: %s", request_id, e)
+        return {"request_id": request_id, "error": str(e)}
+
+
 def do_list_namespaces(request_id: str = None,
                        *, context: "RequestContext | None" = None) -> dict:
     """List namespaces - shared by HTTP routes and external integrations
@@ -154,20 +379,30 @@ def do_list_namespaces(request_id: str = None,
     Returns:
         Dictionary with namespaces list, count, and request_id
     """
-    request_id = request_id or str(uuid.uuid4())
-    logger.info(f"[{request_id}] List namespaces")
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] List namespaces", request_id)
 
     try:
-        provider = NamespaceProviderFactory.create(settings)
-        # include_children=True to get ALL namespaces, not just root level
-        namespaces = provider.list(include_children=True, context=context)
+        ttl = get_settings().doc_cache_ttl
+        identity = _cache_identity(context) if ttl > 0 else None
+        cached = _namespace_list_cache.get(identity) if identity is not None else None
+
+        if cached is None:
+            provider = _get_namespace_provider()
+            # include_children=True to get ALL namespaces, not just root level
+            namespaces = provider.list(include_children=True, context=context)
+            if identity is not None:
+                # Stored as a tuple; every caller gets its own list
+                _namespace_list_cache.set(identity, tuple(namespaces), ttl)
+        else:
+            namespaces = list(cached)
         return {
             "request_id": request_id,
             "namespaces": namespaces,
             "count": len(namespaces)
         }
     except Exception as e:
-        logger.error(f"[{request_id}] List namespaces failed: {e}")
+        logger.error("[%s] List namespaces failed: %s", request_id, e)
         return {
             "request_id": request_id,
             "error": str(e),
@@ -190,21 +425,21 @@ def do_list_documents(namespace: str = None, limit: int = 50,
     Returns:
         Dictionary with documents list, next_key, and request_id
     """
-    request_id = request_id or str(uuid.uuid4())
+    request_id = request_id or _new_request_id()
 
     # Enforce limit max 100
     if limit > 100:
         limit = 100
-        logger.warning(f"[{request_id}] limit exceeded max of 100, clamping to 100")
+        logger.warning("[%s] limit exceeded max of 100, clamping to 100", request_id)
 
-    logger.info(f"[{request_id}] List documents: namespace={namespace}, limit={limit}")
+    logger.info("[%s] List documents: namespace=%s, limit=%s", request_id, namespace, limit)
 
     try:
-        pipeline = get_pipeline()
+        document_index = get_pipeline().document_index_provider
 
         # Check if document index provider is available
-        if pipeline.document_index_provider is None:
-            logger.error(f"[{request_id}] Document index provider not available (feature flag disabled)")
+        if document_index is None:
+            logger.error("[%s] Document index provider not available (feature flag disabled)", request_id)
             return {
                 "request_id": request_id,
                 "error": "Document index feature is disabled",
@@ -212,7 +447,7 @@ def do_list_documents(namespace: str = None, limit: int = 50,
                 "next_key": None
             }
 
-        result = pipeline.document_index_provider.list_documents(
+        result = document_index.list_documents(
             namespace=namespace,
             limit=limit,
             last_evaluated_key=next_key,
@@ -220,7 +455,7 @@ def do_list_documents(namespace: str = None, limit: int = 50,
         )
         return {"request_id": request_id, **result}
     except Exception as e:
-        logger.error(f"[{request_id}] List documents failed: {e}")
+        logger.error("[%s] List documents failed: %s", request_id, e)
         return {
             "request_id": request_id,
             "error": str(e),
@@ -242,28 +477,36 @@ def do_get_document(doc_id: str, namespace: str = "default",
     Returns:
         Document dictionary with request_id, or error dict
     """
-    request_id = request_id or str(uuid.uuid4())
-    logger.info(f"[{request_id}] Get document: doc_id={doc_id}, namespace={namespace}")
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Get document: doc_id=%s, namespace=%s", request_id, doc_id, namespace)
 
     try:
-        pipeline = get_pipeline()
+        document_index = get_pipeline().document_index_provider
 
         # Check if document index provider is available
-        if pipeline.document_index_provider is None:
-            logger.error(f"[{request_id}] Document index provider not available (feature flag disabled)")
+        if document_index is None:
+            logger.error("[%s] Document index provider not available (feature flag disabled)", request_id)
             return {
                 "request_id": request_id,
                 "error": "Document index feature is disabled"
             }
 
-        doc = pipeline.document_index_provider.get_document(
-            doc_id=doc_id,
-            namespace=namespace,
-            context=context
-        )
+        ttl = get_settings().doc_cache_ttl
+        identity = _cache_identity(context) if ttl > 0 else None
+        cache_key = (doc_id, namespace, identity)
+        doc = _document_cache.get(cache_key) if identity is not None else None
+
+        if doc is None:
+            doc = document_index.get_document(
+                doc_id=doc_id,
+                namespace=namespace,
+                context=context
+            )
+            if doc and identity is not None:
+                _document_cache.set(cache_key, doc, ttl)
 
         if not doc:
-            logger.info(f"[{request_id}] Document not found: {doc_id}")
+            logger.info("[%s] Document not found: %s", request_id, doc_id)
             return {
                 "request_id": request_id,
                 "error": f"Document not found: {doc_id}"
@@ -271,13 +514,41 @@ def do_get_document(doc_id: str, namespace: str = "default",
 
         return {"request_id": request_id, **doc}
     except Exception as e:
-        logger.error(f"[{request_id}] Get document failed: {e}")
+        logger.error("[%s] Get document failed: %s", request_id, e)
         return {
             "request_id": request_id,
             "error": str(e)
         }
 
 
+async def aio_list_documents(namespace: str = None, limit: int = 50,
+                             next_key: str = None, request_id: str = None,
+                             *, context: "RequestContext | None" = None) -> dict:
+    """List documents without blocking the event loop (async do_list_documents)
+
+    Document index providers are synchronous, so the call runs in a worker
+    thread.
+    """
+    return await asyncio.to_thread(
+        do_list_documents, namespace=namespace, limit=limit, next_key=next_key,
+        request_id=request_id, context=context
+    )
+
+
+async def aio_get_document(doc_id: str, namespace: str = "default",
+                           request_id: str = None,
+                           *, context: "RequestContext | None" = None) -> dict:
+    """Get document without blocking the event loop (async do_get_document)
+
+    Document index providers are synchronous, so the call runs in a worker
+    thread.
+    """
+    return await asyncio.to_thread(
+        do_get_document, doc_id=doc_id, namespace=namespace,
+        request_id=request_id, context=context
+    )
+
+
 # ===== Namespace Operations =====
 
 def do_create_namespace(id: str, name: str, description: str = "",
@@ -298,11 +569,11 @@ def do_create_namespace(id: str, name: str, description: str = "",
     Returns:
         Created namespace dict with request_id
     """
-    request_id = request_id or str(uuid.uuid4())
-    logger.info(f"[{request_id}] Create namespace: id={id}, name={name}")
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Create namespace: id=%s, name=%s", request_id, id, name)
 
     try:
-        provider = NamespaceProviderFactory.create(settings)
+        provider = _get_namespace_provider()
         namespace = provider.create(
             id=id,
             name=name,
@@ -312,9 +583,10 @@ def do_create_namespace(id: str, name: str, description: str = "",
             filter_keys=filter_keys,
             context=context
         )
+        _namespace_list_cache.clear()
         return {"request_id": request_id, "namespace": namespace, "success": True}
     except Exception as e:
-        logger.error(f"[{request_id}] Create namespace failed: {e}")
+        logger.error("[%s] Create namespace failed: %s", request_id, e)
         return {"request_id": request_id, "error": str(e), "success": False}
 
 
@@ -329,11 +601,11 @@ def do_get_namespace(id: str, request_id: str = None,
     Returns:
         Namespace dict with request_id, or error dict
     """
-    request_id = request_id or str(uuid.uuid4())
-    logger.info(f"[{request_id}] Get namespace: id={id}")
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Get namespace: id=%s", request_id, id)
 
     try:
-        provider = NamespaceProviderFactory.create(settings)
+        provider = _get_namespace_provider()
         namespace = provider.get(id, context=context)
 
         if not namespace:
@@ -341,7 +613,7 @@ def do_get_namespace(id: str, request_id: str = None,
 
         return {"request_id": request_id, "namespace": namespace}
     except Exception as e:
-        logger.error(f"[{request_id}] Get namespace failed: {e}")
+        logger.error("[%s] Get namespace failed: %s", request_id, e)
         return {"request_id": request_id, "error": str(e)}
 
 
@@ -360,11 +632,11 @@ def do_update_namespace(id: str, name: str = None, description: str = None,
     Returns:
         Updated namespace dict with request_id, or error dict
     """
-    request_id = request_id or str(uuid.uuid4())
-    logger.info(f"[{request_id}] Update namespace: id={id}")
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Update namespace: id=%s", request_id, id)
 
     try:
-        provider = NamespaceProviderFactory.create(settings)
+        provider = _get_namespace_provider()
         namespace = provider.update(
             id=id,
             name=name,
@@ -372,13 +644,14 @@ def do_update_namespace(id: str, name: str = None, description: str = None,
             metadata=metadata,
             context=context
         )
+        _namespace_list_cache.clear()
 
         if not namespace:
             return {"request_id": request_id, "error": f"Namespace not found: {id}"}
 
         return {"request_id": request_id, "namespace": namespace, "success": True}
     except Exception as e:
-        logger.error(f"[{request_id}] Update namespace failed: {e}")
+        logger.error("[%s] Update namespace failed: %s", request_id, e)
         return {"request_id": request_id, "error": str(e), "success": False}
 
 
@@ -394,19 +667,20 @@ def do_delete_namespace(id: str, cascade: bool = False, request_id: str = None,
     Returns:
         Success dict with request_id, or error dict
     """
-    request_id = request_id or str(uuid.uuid4())
-    logger.info(f"[{request_id}] Delete namespace: id={id}, cascade={cascade}")
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Delete namespace: id=%s, cascade=%s", request_id, id, cascade)
 
     try:
-        provider = NamespaceProviderFactory.create(settings)
+        provider = _get_namespace_provider()
         deleted = provider.delete(id=id, cascade=cascade, context=context)
+        _namespace_list_cache.clear()
 
         if not deleted:
             return {"request_id": request_id, "error": f"Namespace not found: {id}", "success": False}
 
         return {"request_id": request_id, "success": True}
     except Exception as e:
-        logger.error(f"[{request_id}] Delete namespace failed: {e}")
+        logger.error("[%s] Delete namespace failed: %s", request_id, e)
         return {"request_id": request_id, "error": str(e), "success": False}
 
 
@@ -424,16 +698,18 @@ def do_delete_document(doc_id: str, namespace: str = "default", request_id: str
     Returns:
         Success dict with chunks_deleted count, or error dict
     """
-    request_id = request_id or str(uuid.uuid4())
-    logger.info(f"[{request_id}] Delete document: doc_id={doc_id}, namespace={namespace}")
+    request_id = request_id or _new_request_id()
+    logger.info("[%s] Delete document: doc_id=%s, namespace=%s", request_id, doc_id, namespace)
 
     try:
         pipeline = get_pipeline()
+        document_index = pipeline.document_index_provider
+        vectordb = pipeline.vectordb_provider
 
         # Use document index if available (preferred method)
-        if pipeline.document_index_provider:
+        if document_index:
             # Get chunk IDs from document index
-            chunk_ids = pipeline.document_index_provider.get_chunk_ids(doc_id, namespace, context=context)
+            chunk_ids = document_index.get_chunk_ids(doc_id, namespace, context=context)
 
             if not chunk_ids:
                 return {
@@ -443,13 +719,12 @@ def do_delete_document(doc_id: str, namespace: str = "default", request_id: str
                 }
 
             # Delete from vector database first (atomic operation pattern)
-            vectordb = pipeline.vectordb_provider
             vectordb.delete(chunk_ids, namespace=namespace, context=context)
 
             # Delete from document index
-            pipeline.document_index_provider.delete_document(doc_id, namespace, context=context)
+            document_index.delete_document(doc_id, namespace, context=context)
 
-            logger.info(f"[{request_id}] Deleted document {doc_id} ({len(chunk_ids)} chunks) from {namespace}")
+            logger.info("[%s] Deleted document %s (%s chunks) from %s", request_id, doc_id, len(chunk_ids), namespace)
 
             return {
                 "request_id": request_id,
@@ -460,7 +735,6 @@ def do_delete_document(doc_id: str, namespace: str = "default", request_id: str
             }
 
         # Fallback: Use legacy vector DB deletion (for backwards compatibility)
-        vectordb = pipeline.vectordb_provider
         result = vectordb.delete_by_metadata(
             field="doc_id",
             value=doc_id,
@@ -481,7 +755,7 @@ def do_delete_document(doc_id: str, namespace: str = "default", request_id: str
                 "success": False
             }
 
-        logger.info(f"[{request_id}] Deleted {result['deleted']} chunks + summary for doc_id: {doc_id}")
+        logger.info("[%s] Deleted %s chunks + summary for doc_id: %s", request_id, result['deleted'], doc_id)
 
         return {
             "request_id": request_id,
@@ -491,6 +765,8 @@ def do_delete_document(doc_id: str, namespace: str = "default", request_id: str
             "chunks_deleted": result["deleted"]
         }
     except Exception as e:
-        logger.error(f"[{request_id}] Delete document failed: {e}")
+        logger.error("[%s] Delete document failed: %s", request_id, e)
         return {"request_id": request_id, "error": str(e), "success": False}
+    finally:
+        _document_cache.invalidate(lambda key: key[:2] == (doc_id, namespace))
 
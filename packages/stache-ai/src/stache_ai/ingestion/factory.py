@@ -19,9 +19,10 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
-from ..config import settings as global_settings
+from ..config import get_settings
 from ..providers import plugin_loader
 from stache_ai.identity import Principal
+from stache_ai.utils.text import utf8_len
 
 from .base import TERMINAL, IngestTextTooLargeError, IntakeTicket, Job, JobStatus
 from .providers.inline import (
@@ -149,7 +150,7 @@ class IngestionService:
         if text is not None:
             cap = self._effective_text_cap()
             if cap is not None:
-                text_bytes = len(text.encode("utf-8"))
+                text_bytes = utf8_len(text)
                 if text_bytes > cap:
                     raise IngestTextTooLargeError(
                         f"text is {text_bytes} bytes, exceeds the {cap}-byte "
@@ -176,7 +177,7 @@ class IngestionService:
         if text is not None:
             md["_text"] = text
             md["_chunking"] = chunking_strategy
-            size = len(text.encode("utf-8"))
+            size = utf8_len(text)
         else:
             blob_key = self.blobstore.make_key(
                 job_id, filename or "upload.bin", principal=principal)
@@ -355,7 +356,7 @@ def get_ingestion_service() -> IngestionService:
         with _service_lock:
             if _service is None:
                 from ..rag.pipeline import get_pipeline
-                _service = IngestionServiceFactory.build(global_settings, get_pipeline())
+                _service = IngestionServiceFactory.build(get_settings(), get_pipeline())
     return _service
 
 
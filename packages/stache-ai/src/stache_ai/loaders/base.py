@@ -1,6 +1,7 @@
 """Base class for document loaders"""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 
 class DocumentLoader(ABC):
@@ -36,6 +37,22 @@ class DocumentLoader(ABC):
         """
         pass
 
+    def iter_pages(self, file_path: str) -> Iterator[str]:
+        """Yield extracted text one page (or slide, section) at a time
+
+        Lets callers process large documents without holding every page
+        in memory at once. The default yields the whole of load() as a
+        single page; loaders with a natural page unit should override
+        this and build load() by joining it.
+
+        Args:
+            file_path: Path to the document file
+
+        Yields:
+            Non-empty text of each page, in document order
+        """
+        yield self.load(file_path)
+
     @property
     def priority(self) -> int:
         """Priority for extension conflicts (higher wins)
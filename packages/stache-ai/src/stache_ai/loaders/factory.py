@@ -4,9 +4,7 @@ Uses the centralized plugin_loader for consistency with provider patterns.
 """
 
 import logging
-from pathlib import Path
-
-from stache_ai.providers import plugin_loader
+import os
 
 from .base import DocumentLoader
 
@@ -45,6 +43,13 @@ class DocumentLoaderFactory:
         Raises:
             ValueError: If no loader available for file type
         """
+        loader = cls._get_loader(file_path, filename)
+        logger.info("Loading %s with %s", filename or file_path, loader.name)
+        return loader.load(file_path)
+
+    @classmethod
+    def _get_loader(cls, file_path: str, filename: str | None) -> DocumentLoader:
+        """Look up the loader for a file, raising ValueError if none"""
         cls._ensure_discovered()
         ext = cls._get_extension(file_path, filename)
         loader = cls._loaders.get(ext)
@@ -55,9 +60,7 @@ class DocumentLoaderFactory:
                 f"No loader for extension: .{ext}. "
                 f"Available: {available or 'none'}"
             )
-
-        logger.info(f"Loading {filename or file_path} with {loader.name}")
-        return loader.load(file_path)
+        return loader
 
     @classmethod
     def _ensure_discovered(cls):
@@ -65,6 +68,10 @@ class DocumentLoaderFactory:
         if cls._discovered:
             return
 
+        # Imported here: stache_ai.providers pulls in config and the provider
+        # factories, which importing the loaders package alone doesn't need
+        from stache_ai.providers import plugin_loader
+
         # Use centralized plugin_loader for discovery
         loader_classes = plugin_loader.get_providers('loader')
 
@@ -73,10 +80,12 @@ class DocumentLoaderFactory:
                 loader = loader_class()
                 cls._register_loader(loader)
             except Exception as e:
-                logger.warning(f"Failed to instantiate loader {name}: {e}")
+                logger.warning("Failed to instantiate loader %s: %s", name, e)
 
         cls._discovered = True
-        logger.info(f"Discovered {len(cls._loaders)} document loaders for extensions: {sorted(cls._loaders.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Discovered %d document loaders for extensions: %s",
+                        len(cls._loaders), sorted(cls._loaders.keys()))
 
     @classmethod
     def _register_loader(cls, loader: DocumentLoader):
@@ -86,16 +95,17 @@ class DocumentLoaderFactory:
             existing = cls._loaders.get(ext)
             if not existing or loader.priority > existing.priority:
                 cls._loaders[ext] = loader
-                logger.debug(
-                    f"Registered {loader.name} for .{ext} "
-                    f"(priority={loader.priority})"
-                )
+                logger.debug("Registered %s for .%s (priority=%s)",
+                             loader.name, ext, loader.priority)
 
     @classmethod
     def _get_extension(cls, file_path: str, filename: str | None) -> str:
         """Extract and normalize file extension"""
-        name = filename or Path(file_path).name
-        ext = name.lower().rsplit('.', 1)[-1] if '.' in name else ''
+        # Only the last path component counts, so directory names with dots
+        # are ignored. Unlike splitext, a leading-dot name such as ".md"
+        # still yields "md".
+        name = os.path.basename(filename or file_path)
+        ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
         # Apply aliases
         return EXTENSION_ALIASES.get(ext, ext)
 
@@ -8,38 +8,46 @@ This module provides hook points for enterprise features:
 - stache.delete_observer: Delete validation and auditing
 """
 
-from .context import (
-    RequestContext,
-    QueryContext,
-)
-from .results import (
-    SearchResult,
-    EnrichmentResult,
-    ObserverResult,
-    QueryProcessorResult,
-    ResultProcessorResult,
-    PostIngestResult,
-)
-from .base import (
-    MiddlewareBase,
-    Enricher,
-    ChunkObserver,
-    StorageResult,
-    QueryProcessor,
-    ResultProcessor,
-    DeleteObserver,
-    DeleteTarget,
-    PostIngestProcessor,
-    IngestGuard,
-    GuardResult,
-    ErrorProcessor,
-    ErrorResult,
-)
-from .chain import (
-    MiddlewareChain,
-    MiddlewareError,
-    MiddlewareRejection,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Exports are resolved on first access (PEP 562) so importing one name, or a
+# submodule such as .context, does not load the whole package (chain pulls
+# in asyncio).
+if TYPE_CHECKING:
+    from .context import (
+        RequestContext,
+        QueryContext,
+    )
+    from .results import (
+        SearchResult,
+        EnrichmentResult,
+        ObserverResult,
+        QueryProcessorResult,
+        ResultProcessorResult,
+        PostIngestResult,
+    )
+    from .base import (
+        MiddlewareBase,
+        Enricher,
+        ChunkObserver,
+        StorageResult,
+        QueryProcessor,
+        ResultProcessor,
+        DeleteObserver,
+        DeleteTarget,
+        PostIngestProcessor,
+        IngestGuard,
+        GuardResult,
+        ErrorProcessor,
+        ErrorResult,
+    )
+    from .chain import (
+        MiddlewareChain,
+        MiddlewareError,
+        MiddlewareRejection,
+    )
+
 
 __all__ = [
     # Context
@@ -71,3 +79,45 @@ __all__ = [
     "MiddlewareError",
     "MiddlewareRejection",
 ]
+
+
+_LAZY = {
+    "RequestContext": ".context",
+    "QueryContext": ".context",
+    "SearchResult": ".results",
+    "EnrichmentResult": ".results",
+    "ObserverResult": ".results",
+    "QueryProcessorResult": ".results",
+    "ResultProcessorResult": ".results",
+    "PostIngestResult": ".results",
+    "MiddlewareBase": ".base",
+    "Enricher": ".base",
+    "ChunkObserver": ".base",
+    "StorageResult": ".base",
+    "QueryProcessor": ".base",
+    "ResultProcessor": ".base",
+    "DeleteObserver": ".base",
+    "DeleteTarget": ".base",
+    "PostIngestProcessor": ".base",
+    "IngestGuard": ".base",
+    "GuardResult": ".base",
+    "ErrorProcessor": ".base",
+    "ErrorResult": ".base",
+    "MiddlewareChain": ".chain",
+    "MiddlewareError": ".chain",
+    "MiddlewareRejection": ".chain",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Literal, Any, ClassVar, TYPE_CHECKING
@@ -20,6 +21,9 @@ class MiddlewareBase(ABC):
         required: If False, chain continues even on error
         timeout_seconds: Per-middleware timeout (None = no timeout)
 
+    The base classes declare empty ``__slots__``, so a subclass that also
+    declares ``__slots__`` gets instances without a ``__dict__``.
+
     Lazy Loading Pattern (for heavy dependencies like Whisper):
         class AudioTranscriber(Enricher):
             _whisper = None
@@ -32,6 +36,8 @@ class MiddlewareBase(ABC):
                 return cls._whisper
     """
 
+    __slots__ = ()
+
     # Ordering
     priority: ClassVar[int] = 100
     depends_on: ClassVar[tuple[str, ...]] = ()
@@ -44,6 +50,15 @@ class MiddlewareBase(ABC):
     # Timeout (PE addition)
     timeout_seconds: ClassVar[float | None] = None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Accept lists (or a single name) but store interned tuples
+        for attr in ("depends_on", "runs_before"):
+            names = getattr(cls, attr)
+            if isinstance(names, str):
+                names = (names,)
+            setattr(cls, attr, tuple(sys.intern(name) for name in names))
+
     @classmethod
     def get_metadata(cls) -> dict[str, Any]:
         """Return middleware metadata for introspection."""
@@ -76,6 +91,8 @@ class Enricher(MiddlewareBase):
     Phases run in order: extract -> transform -> enrich
     """
 
+    __slots__ = ()
+
     phase: ClassVar[Literal["extract", "transform", "enrich"]] = "enrich"
 
     @abstractmethod
@@ -117,6 +134,8 @@ class QueryProcessor(MiddlewareBase):
     or reject queries (rate limiting).
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def process(
         self,
@@ -157,7 +176,7 @@ class ErrorResult:
     """Additional metadata about error handling."""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteTarget:
     """What is being deleted."""
     target_type: Literal["document", "namespace", "chunks"]
@@ -173,6 +192,8 @@ class DeleteObserver(MiddlewareBase):
     on_delete_complete: Called AFTER deletion (audit/sync only)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def on_delete(
         self,
@@ -214,6 +235,8 @@ class IngestGuard(MiddlewareBase):
         on_error="allow" - Continue if guard fails (log warning)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def validate(
         self,
@@ -242,6 +265,8 @@ class ErrorProcessor(MiddlewareBase):
     the error is logged but does not block other processors.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def on_error(
         self,
@@ -276,6 +301,8 @@ class ResultProcessor(MiddlewareBase):
     Supports batch mode (default) or streaming mode.
     """
 
+    __slots__ = ()
+
     mode: ClassVar[Literal["batch", "stream"]] = "batch"
 
     @abstractmethod
@@ -310,7 +337,7 @@ class ResultProcessor(MiddlewareBase):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageResult:
     """Information about stored chunks."""
     vector_ids: list[str]
@@ -329,6 +356,8 @@ class ChunkObserver(MiddlewareBase):
     pre-flight check in enrichment phase instead.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def on_chunks_stored(
         self,
@@ -395,6 +424,8 @@ class PostIngestProcessor(MiddlewareBase):
                 )
     """
 
+    __slots__ = ()
+
     # Enforce skip-on-error semantics
     on_error: ClassVar[Literal["skip"]] = "skip"
 
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
+import itertools
 import time
 import logging
-from collections import defaultdict
+import sys
 from typing import TypeVar, Generic, Any, TYPE_CHECKING
 
+from .base import MiddlewareBase
+
 if TYPE_CHECKING:
-    from .base import MiddlewareBase
     from .context import RequestContext
-    from .results import EnrichmentResult, QueryProcessorResult
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,75 @@ T = TypeVar('T')
 R = TypeVar('R')
 
 
+if sys.version_info >= (3, 11):
+    async def _wait_for(awaitable, timeout: float):
+        """asyncio.wait_for without wrapping the awaitable in a Task."""
+        async with asyncio.timeout(timeout):
+            return await awaitable
+else:
+    _wait_for = asyncio.wait_for
+
+
+def _overrides_hook(middleware: MiddlewareBase, hook: str) -> bool:
+    """Whether the middleware's class replaces MiddlewareBase's no-op hook."""
+    return getattr(type(middleware), hook) is not getattr(MiddlewareBase, hook)
+
+
+@functools.lru_cache(maxsize=128)
+def _sorted_positions(
+    specs: tuple[tuple[str, int, tuple[str, ...], tuple[str, ...]], ...]
+) -> tuple[int, ...]:
+    """Kahn's algorithm over (name, priority, depends_on, runs_before) specs.
+
+    Returns positions into ``specs`` in execution order.
+    """
+    n = len(specs)
+    index_of = {name: i for i, (name, _, _, _) in enumerate(specs)}
+
+    # Build dependency graph over positions
+    in_degree = [0] * n
+    dependents: list[list[int]] = [[] for _ in range(n)]
+
+    for i, (_, _, depends_on, runs_before) in enumerate(specs):
+        for dep in depends_on:
+            j = index_of.get(dep)
+            if j is not None:
+                dependents[j].append(i)
+                in_degree[i] += 1
+
+        for before in runs_before:
+            j = index_of.get(before)
+            if j is not None:
+                dependents[i].append(j)
+                in_degree[j] += 1
+
+    # Kahn's algorithm with a min-heap on (priority, insertion order), so
+    # equal priorities keep the order in which they became available
+    result: list[int] = []
+    counter = itertools.count()
+    available = [(specs[i][1], next(counter), i) for i in range(n) if in_degree[i] == 0]
+    heapq.heapify(available)
+
+    while available:
+        _, _, current = heapq.heappop(available)
+        result.append(current)
+
+        for dep in dependents[current]:
+            in_degree[dep] -= 1
+            if in_degree[dep] == 0:
+                heapq.heappush(available, (specs[dep][1], next(counter), dep))
+
+    if len(result) != n:
+        emitted = set(result)
+        remaining = [spec[0] for i, spec in enumerate(specs) if i not in emitted]
+        raise ValueError(
+            f"Circular dependency detected in middleware chain. "
+            f"Middleware involved: {remaining}"
+        )
+
+    return tuple(result)
+
+
 class MiddlewareError(Exception):
     """Raised when middleware fails and on_error=reject."""
     def __init__(self, middleware_name: str, reason: str):
@@ -47,75 +119,76 @@ class MiddlewareChain(Generic[T, R]):
         that benefit from centralized dependency ordering, timeouts, and lifecycle hooks.
     """
 
-    def __init__(self, middlewares: list["MiddlewareBase"]):
+    def __init__(self, middlewares: list["MiddlewareBase"], process_fn: str | None = None):
+        """Sort ``middlewares`` into execution order.
+
+        Args:
+            middlewares: Middleware instances to chain
+            process_fn: Default method for execute() to call. When given, it
+                is validated on every middleware now rather than per request.
+        """
         self.middlewares = self._topological_sort(middlewares)
+        self._names = [type(m).__name__ for m in self.middlewares]
+        # Only await lifecycle hooks that do something
+        self._start_hooks = [m for m in self.middlewares if _overrides_hook(m, "on_chain_start")]
+        self._complete_hooks = [m for m in self.middlewares if _overrides_hook(m, "on_chain_complete")]
+
+        self.process_fn = process_fn or "process"
+        self._bound: dict[str, list[tuple[str, "MiddlewareBase", Any]]] = {}
+        if process_fn is not None:
+            self._bind(process_fn)
+
+    def _bind(self, process_fn: str) -> list[tuple[str, "MiddlewareBase", Any]]:
+        """Resolve and validate ``process_fn`` on each middleware, once per name.
+
+        Raises:
+            MiddlewareError: If a middleware lacks the method or it isn't async
+        """
+        bound = self._bound.get(process_fn)
+        if bound is None:
+            bound = []
+            for name, middleware in zip(self._names, self.middlewares, strict=True):
+                method = getattr(middleware, process_fn, None)
+                if method is None:
+                    raise MiddlewareError(
+                        name, f"Missing required method '{process_fn}'"
+                    )
+                if not asyncio.iscoroutinefunction(method):
+                    raise MiddlewareError(
+                        name, f"Method '{process_fn}' must be async"
+                    )
+                bound.append((name, middleware, method))
+            self._bound[process_fn] = bound
+        return bound
 
     def _topological_sort(self, middlewares: list["MiddlewareBase"]) -> list["MiddlewareBase"]:
         """Sort by dependencies using Kahn's algorithm, priority as tiebreaker."""
         if not middlewares:
             return []
 
-        # Build name -> middleware mapping
-        by_name = {m.__class__.__name__: m for m in middlewares}
-
-        # Build dependency graph
-        in_degree: dict[str, int] = defaultdict(int)
-        dependents: dict[str, list[str]] = defaultdict(list)
-
-        for m in middlewares:
-            name = m.__class__.__name__
-            in_degree[name]  # Ensure entry exists
-
-            for dep in m.depends_on:
-                if dep in by_name:
-                    dependents[dep].append(name)
-                    in_degree[name] += 1
-
-            for before in m.runs_before:
-                if before in by_name:
-                    dependents[name].append(before)
-                    in_degree[before] += 1
-
-        # Kahn's algorithm with priority tiebreaker
-        result: list["MiddlewareBase"] = []
-        available = [m for m in middlewares if in_degree[m.__class__.__name__] == 0]
-
-        while available:
-            # Sort by priority (lower first)
-            available.sort(key=lambda m: m.priority)
-            current = available.pop(0)
-            result.append(current)
-
-            for dep_name in dependents[current.__class__.__name__]:
-                in_degree[dep_name] -= 1
-                if in_degree[dep_name] == 0:
-                    available.append(by_name[dep_name])
-
-        if len(result) != len(middlewares):
-            remaining = [m.__class__.__name__ for m in middlewares if m not in result]
-            raise ValueError(
-                f"Circular dependency detected in middleware chain. "
-                f"Middleware involved: {remaining}"
-            )
-
-        return result
+        # Ordering depends only on these class-level attributes, so the
+        # result is cached across chains built from the same middleware.
+        specs = tuple(
+            (m.__class__.__name__, m.priority, tuple(m.depends_on), tuple(m.runs_before))
+            for m in middlewares
+        )
+        return [middlewares[i] for i in _sorted_positions(specs)]
 
-    def _apply_transform(self, current: T, result: R) -> T:
-        """Apply transformation based on result type."""
-        # Import here to avoid circular imports at module level
-        from .results import EnrichmentResult, QueryProcessorResult
-
-        if isinstance(result, EnrichmentResult) and result.action == "transform":
-            return result.content if result.content is not None else current  # type: ignore
-        elif isinstance(result, QueryProcessorResult) and result.action == "transform":
-            return result.query if result.query is not None else current  # type: ignore
-        return current
+    @staticmethod
+    def _log_hook_failures(hook: str, middlewares: list["MiddlewareBase"], outcomes: list[Any]) -> None:
+        """Log lifecycle hook exceptions; they never fail the chain."""
+        for middleware, outcome in zip(middlewares, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(f"{hook} failed for {middleware.__class__.__name__}: {outcome}")
+            elif isinstance(outcome, BaseException):
+                # Cancellation and the like still propagate
+                raise outcome
 
     async def execute(
         self,
         initial_value: T,
         context: "RequestContext",
-        process_fn: str = "process"
+        process_fn: str | None = None
     ) -> tuple[T, list[tuple[str, R]]]:
         """Execute middleware chain.
 
@@ -123,63 +196,67 @@ class MiddlewareChain(Generic[T, R]):
             initial_value: Starting value to process
             context: Request context passed to all middleware
             process_fn: Name of the method to call on each middleware
+                (defaults to the chain's process_fn)
 
         Returns:
             Tuple of (final_value, [(middleware_name, result), ...])
+
+        Raises:
+            MiddlewareError: If a middleware lacks an async ``process_fn``
         """
         results: list[tuple[str, R]] = []
         current = initial_value
         success = True
 
-        # Lifecycle: chain start
-        for middleware in self.middlewares:
-            try:
-                await middleware.on_chain_start(context)
-            except Exception as e:
-                logger.warning(f"on_chain_start failed for {middleware.__class__.__name__}: {e}")
+        # Lifecycle: chain start (hooks are independent, so run concurrently)
+        if self._start_hooks:
+            outcomes = await asyncio.gather(
+                *(m.on_chain_start(context) for m in self._start_hooks),
+                return_exceptions=True
+            )
+            self._log_hook_failures("on_chain_start", self._start_hooks, outcomes)
+
+        # Timing only feeds the INFO log, so skip the clock reads without it
+        timed = logger.isEnabledFor(logging.INFO)
 
         try:
-            for middleware in self.middlewares:
-                name = middleware.__class__.__name__
-                start_time = time.monotonic()
+            # Bound inside the try so on_chain_complete still sees a failure
+            try:
+                bound = self._bind(process_fn or self.process_fn)
+            except MiddlewareError:
+                success = False
+                raise
 
-                try:
-                    # Validate method exists and is async
-                    method = getattr(middleware, process_fn, None)
-                    if method is None:
-                        raise MiddlewareError(
-                            name, f"Missing required method '{process_fn}'"
-                        )
-                    if not asyncio.iscoroutinefunction(method):
-                        raise MiddlewareError(
-                            name, f"Method '{process_fn}' must be async"
-                        )
+            for name, middleware, method in bound:
+                if timed:
+                    start_ns = time.perf_counter_ns()
 
+                try:
                     # Apply timeout if configured
                     if middleware.timeout_seconds:
                         coro = method(current, context)
-                        result = await asyncio.wait_for(coro, timeout=middleware.timeout_seconds)
+                        result = await _wait_for(coro, middleware.timeout_seconds)
                     else:
                         result = await method(current, context)
 
-                    elapsed_ms = (time.monotonic() - start_time) * 1000
-
-                    logger.info(
-                        "middleware_executed",
-                        extra={
-                            "middleware": name,
-                            "action": result.action,
-                            "duration_ms": round(elapsed_ms, 2),
-                            "request_id": context.request_id,
-                        }
-                    )
+                    if timed:
+                        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                        logger.info(
+                            "middleware_executed",
+                            extra={
+                                "middleware": name,
+                                "action": result.action,
+                                "duration_ms": round(elapsed_ms, 2),
+                                "request_id": context.request_id,
+                            }
+                        )
 
                     results.append((name, result))
 
                     if result.action == "reject":
                         raise MiddlewareRejection(name, result.reason)
                     elif result.action == "transform":
-                        current = self._apply_transform(current, result)
+                        current = result.apply_to(current)
 
                 except MiddlewareRejection:
                     success = False
@@ -199,10 +276,9 @@ class MiddlewareChain(Generic[T, R]):
                     elif middleware.on_error == "skip":
                         continue
                     # on_error == "allow": continue with current value
+                except MiddlewareError:
+                    raise
                 except Exception as e:
-                    if isinstance(e, (MiddlewareError, MiddlewareRejection)):
-                        raise
-
                     logger.error(
                         "middleware_error",
                         extra={
@@ -220,11 +296,12 @@ class MiddlewareChain(Generic[T, R]):
 
         finally:
             # Lifecycle: chain complete
-            for middleware in self.middlewares:
-                try:
-                    await middleware.on_chain_complete(context, success)
-                except Exception as e:
-                    logger.warning(f"on_chain_complete failed for {middleware.__class__.__name__}: {e}")
+            if self._complete_hooks:
+                outcomes = await asyncio.gather(
+                    *(m.on_chain_complete(context, success) for m in self._complete_hooks),
+                    return_exceptions=True
+                )
+                self._log_hook_failures("on_chain_complete", self._complete_hooks, outcomes)
 
         return current, results
 
@@ -270,9 +347,9 @@ class MiddlewareChain(Generic[T, R]):
             try:
                 # Execute processor with timeout protection
                 if processor.timeout_seconds:
-                    result: PostIngestResult = await asyncio.wait_for(
+                    result: PostIngestResult = await _wait_for(
                         processor.process(chunks, storage_result, context),
-                        timeout=processor.timeout_seconds
+                        processor.timeout_seconds
                     )
                 else:
                     result: PostIngestResult = await processor.process(chunks, storage_result, context)
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from fastapi import Request
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestContext:
     """Context passed to all middleware.
 
@@ -42,8 +42,12 @@ class RequestContext:
     @classmethod
     def from_fastapi_request(cls, request: "Request", namespace: str) -> "RequestContext":
         """Create context from FastAPI request."""
+        # Only mint an ID when the caller didn't send one
+        request_id = request.headers.get("x-request-id")
+        if request_id is None:
+            request_id = str(uuid4())
         return cls(
-            request_id=request.headers.get("x-request-id", str(uuid4())),
+            request_id=request_id,
             timestamp=datetime.now(timezone.utc),
             namespace=namespace,
             user_id=getattr(request.state, "user_id", None),
@@ -61,7 +65,7 @@ class RequestContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryContext:
     """Query-specific context using composition (not inheritance).
 
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
 import threading
 from abc import abstractmethod
@@ -13,9 +16,17 @@ if TYPE_CHECKING:
 
 from ...middleware.base import Enricher
 from ...middleware.results import EnrichmentResult
+from ...utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Structured LLM output by prompt, shared by all AI enrichers in the process
+# (settings.ai_enrichment_cache_ttl)
+_llm_output_cache = TTLCache(maxsize=1024)
+
+# Above this temperature outputs are meant to vary, so they aren't reused
+_MAX_CACHEABLE_TEMPERATURE = 0.1
+
 
 class BaseAIEnricher(Enricher):
     """Base class for AI-powered enrichment middleware.
@@ -113,6 +124,29 @@ class BaseAIEnricher(Enricher):
         truncated = content[:max_chars]
         return truncated + "\n\n[... content truncated for analysis ...]"
 
+    def _cache_ttl(self) -> float:
+        """Output cache TTL; 0 (off) for configs that predate the setting."""
+        ttl = getattr(self.config, "ai_enrichment_cache_ttl", 0)
+        return ttl if isinstance(ttl, (int, float)) else 0
+
+    def _cache_key(self, prompt: str, schema: dict) -> str | None:
+        """Key for reusing LLM output for this prompt, or None if caching is off."""
+        if self._cache_ttl() <= 0:
+            return None
+        if self.config.ai_enrichment_temperature > _MAX_CACHEABLE_TEMPERATURE:
+            return None
+        payload = json.dumps(
+            [
+                self.__class__.__name__,
+                self.config.ai_enrichment_model,
+                self.config.ai_enrichment_max_tokens,
+                schema,
+                prompt,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     async def process(
         self,
         content: str,
@@ -122,6 +156,8 @@ class BaseAIEnricher(Enricher):
         """Process content with AI enrichment.
 
         Shared implementation: truncate, prompt, call LLM, apply results.
+        With ai_enrichment_cache_ttl set, output for an identical prompt is
+        reused instead of calling the LLM again.
         """
         try:
             # Truncate content to token budget
@@ -133,15 +169,27 @@ class BaseAIEnricher(Enricher):
             # Get schema
             schema = self.get_schema()
 
-            # Call LLM in thread pool (sync method)
-            llm_output = await asyncio.to_thread(
-                self.llm_provider.generate_structured,
-                prompt=prompt,
-                schema=schema,
-                max_tokens=self.config.ai_enrichment_max_tokens,
-                temperature=self.config.ai_enrichment_temperature,
-                context=context
-            )
+            # Re-ingested and duplicate documents produce the same prompt
+            cache_key = self._cache_key(prompt, schema)
+            cached = _llm_output_cache.get(cache_key) if cache_key else None
+
+            if cached is not None:
+                llm_output = copy.deepcopy(cached)
+                logger.debug(f"{self.__class__.__name__} reused cached LLM output")
+            else:
+                # Call LLM in thread pool (sync method)
+                llm_output = await asyncio.to_thread(
+                    self.llm_provider.generate_structured,
+                    prompt=prompt,
+                    schema=schema,
+                    max_tokens=self.config.ai_enrichment_max_tokens,
+                    temperature=self.config.ai_enrichment_temperature,
+                    context=context
+                )
+                if cache_key:
+                    _llm_output_cache.set(
+                        cache_key, copy.deepcopy(llm_output), self._cache_ttl()
+                    )
 
             # Apply enrichment to metadata
             enriched_metadata = self.apply_enrichment(metadata.copy(), llm_output)
@@ -27,6 +27,12 @@ class EnrichmentResult:
     metadata: dict[str, Any] | None = None
     reason: str | None = None
 
+    def apply_to(self, content: str) -> str:
+        """Return the content to continue with after this result."""
+        if self.action == "transform" and self.content is not None:
+            return self.content
+        return content
+
 
 @dataclass
 class ObserverResult:
@@ -56,6 +62,12 @@ class QueryProcessorResult:
     filters: dict[str, Any] | None = None
     reason: str | None = None
 
+    def apply_to(self, query: str) -> str:
+        """Return the query to continue with after this result."""
+        if self.action == "transform" and self.query is not None:
+            return self.query
+        return query
+
 
 @dataclass
 class ResultProcessorResult:
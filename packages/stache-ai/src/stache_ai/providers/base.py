@@ -1,7 +1,9 @@
 """Base provider interfaces - Abstract base classes for all providers"""
 
 import builtins
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any, Dict, TYPE_CHECKING
 
 from stache_ai.providers.tool_types import ToolSpec, ToolCall, ToolUseResult, Message
@@ -461,6 +463,16 @@ class NamespaceProvider(ABC):
         """
         pass
 
+    def list_ids(self, context: "RequestContext | None" = None) -> set[str]:
+        """Get the IDs of every namespace in one call.
+
+        Lets bulk callers (e.g. namespace import) test membership locally
+        instead of issuing one ``exists`` round-trip per ID. Default
+        implementation projects ``list(include_children=True)``; providers
+        may override with a cheaper ID-only query.
+        """
+        return {ns["id"] for ns in self.list(include_children=True, context=context)}
+
     def get_ancestors(self, id: str, context: "RequestContext | None" = None) -> builtins.list[dict[str, Any]]:
         """Get all ancestor namespaces, root first.
 
@@ -728,6 +740,29 @@ class VectorDBProvider(ABC):
         """
         raise NotImplementedError("count_by_filter not implemented for this provider")
 
+    def group_count(
+        self,
+        group_by: str,
+        filter: dict[str, Any] | None = None,
+        context: "RequestContext | None" = None
+    ) -> dict[str, int]:
+        """
+        Count vectors per distinct value of a metadata field
+
+        Lets callers aggregate server-side (e.g. chunks per doc_id) instead of
+        downloading every record. Vectors missing the field are not counted.
+
+        Args:
+            group_by: Metadata field to group on (e.g. "doc_id")
+            filter: Optional dictionary of field:value pairs to match first
+            context: optional request context (caller identity); implementations
+                may scope behavior on it, core providers ignore it.
+
+        Returns:
+            Mapping of field value to number of matching vectors
+        """
+        raise NotImplementedError("group_count not implemented for this provider")
+
     def list_by_filter(
         self,
         filter: dict[str, Any],
@@ -750,6 +785,35 @@ class VectorDBProvider(ABC):
         """
         raise NotImplementedError("list_by_filter not implemented for this provider")
 
+    def iter_by_filter(
+        self,
+        filter: dict[str, Any],
+        fields: list[str] | None = None,
+        page_size: int = 1000,
+        context: "RequestContext | None" = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over ALL vectors matching a filter, one page at a time
+
+        Unlike list_by_filter there is no limit: callers consume pages as the
+        provider fetches them, so peak memory is bounded by page_size rather
+        than by collection size. Records have the same shape as list_by_filter.
+
+        Default implementation yields a single page from list_by_filter with
+        no limit; providers with a server-side cursor should override.
+
+        Args:
+            filter: Dictionary of field:value pairs to match
+            fields: Optional list of metadata fields to return (None = all)
+            page_size: Target number of records per yielded page
+            context: optional request context (caller identity); implementations
+                may scope behavior on it, core providers ignore it.
+
+        Yields:
+            Lists of dictionaries with vector metadata
+        """
+        yield self.list_by_filter(filter, fields=fields, limit=sys.maxsize, context=context)
+
     def scan_by_metadata(
         self,
         filter: dict[str, Any] | None = None,
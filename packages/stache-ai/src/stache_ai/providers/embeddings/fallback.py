@@ -84,13 +84,10 @@ class FallbackEmbeddingProvider(EmbeddingProvider):
         """Lazy-load primary provider"""
         if self._primary is None:
             logger.info(f"Initializing primary embedding provider: {self._primary_name}")
-            # Temporarily change the setting to create the right provider
-            original = self.settings.embedding_provider
-            self.settings.embedding_provider = self._primary_name
-            try:
-                self._primary = EmbeddingProviderFactory.create(self.settings)
-            finally:
-                self.settings.embedding_provider = original
+            # Build from a copy so the shared settings object is never mutated
+            self._primary = EmbeddingProviderFactory.create(
+                self.settings.model_copy(update={"embedding_provider": self._primary_name})
+            )
         return self._primary
 
     @property
@@ -98,12 +95,9 @@ class FallbackEmbeddingProvider(EmbeddingProvider):
         """Lazy-load secondary provider"""
         if self._secondary is None:
             logger.info(f"Initializing secondary embedding provider: {self._secondary_name}")
-            original = self.settings.embedding_provider
-            self.settings.embedding_provider = self._secondary_name
-            try:
-                self._secondary = EmbeddingProviderFactory.create(self.settings)
-            finally:
-                self.settings.embedding_provider = original
+            self._secondary = EmbeddingProviderFactory.create(
+                self.settings.model_copy(update={"embedding_provider": self._secondary_name})
+            )
         return self._secondary
 
     def embed(self, text: str, *, context=None) -> list[float]:
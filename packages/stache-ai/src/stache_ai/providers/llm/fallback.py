@@ -34,13 +34,10 @@ class FallbackLLMProvider(LLMProvider):
         """Lazy-load primary provider"""
         if self._primary is None:
             logger.info(f"Initializing primary LLM provider: {self._primary_name}")
-            # Temporarily change the setting to create the right provider
-            original = self.settings.llm_provider
-            self.settings.llm_provider = self._primary_name
-            try:
-                self._primary = LLMProviderFactory.create(self.settings)
-            finally:
-                self.settings.llm_provider = original
+            # Build from a copy so the shared settings object is never mutated
+            self._primary = LLMProviderFactory.create(
+                self.settings.model_copy(update={"llm_provider": self._primary_name})
+            )
         return self._primary
 
     @property
@@ -48,12 +45,9 @@ class FallbackLLMProvider(LLMProvider):
         """Lazy-load secondary provider"""
         if self._secondary is None:
             logger.info(f"Initializing secondary LLM provider: {self._secondary_name}")
-            original = self.settings.llm_provider
-            self.settings.llm_provider = self._secondary_name
-            try:
-                self._secondary = LLMProviderFactory.create(self.settings)
-            finally:
-                self.settings.llm_provider = original
+            self._secondary = LLMProviderFactory.create(
+                self.settings.model_copy(update={"llm_provider": self._secondary_name})
+            )
         return self._secondary
 
     def get_name(self) -> str:
@@ -277,5 +277,11 @@ class SQLiteNamespaceProvider(NamespaceProvider):
             )
             return cursor.fetchone() is not None
 
+    def list_ids(self, context=None) -> set[str]:
+        """Get all namespace IDs without materializing full records"""
+        with self._get_connection() as conn:
+            cursor = conn.execute("SELECT id FROM namespaces")
+            return {row["id"] for row in cursor.fetchall()}
+
     # get_ancestors / get_path come from the NamespaceProvider base class
     # (context-aware parent walk over ``get``).
@@ -37,6 +37,7 @@ Usage:
 
 import importlib.metadata
 import logging
+import sys
 from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
@@ -139,6 +140,11 @@ _load_failures: dict[str, dict[str, Exception]] = {}
 # Track if full discovery has been performed
 _loaded: bool = False
 
+# Parsed entry points of every installed distribution, keyed by the sys.path
+# they were read under. Discovery runs once per group, and each uncached
+# entry_points() call re-reads the metadata of every distribution.
+_entry_points_cache: tuple[tuple, object] | None = None
+
 
 def _entry_point_groups(group_or_type: str) -> list[str]:
     """Resolve a provider type ('llm') or entry point group ('stache.llm')
@@ -154,6 +160,21 @@ def _entry_point_groups(group_or_type: str) -> list[str]:
     return [group_or_type]
 
 
+def _installed_entry_points():
+    """All installed entry points, parsed once per sys.path
+
+    The lookup function is part of the key so a patched
+    ``importlib.metadata.entry_points`` is never served from, or left
+    behind in, the cache.
+    """
+    global _entry_points_cache
+    entry_points = importlib.metadata.entry_points
+    key = (entry_points, tuple(sys.path))
+    if _entry_points_cache is None or _entry_points_cache[0] != key:
+        _entry_points_cache = (key, entry_points())
+    return _entry_points_cache[1]
+
+
 def discover_providers(group: str) -> dict[str, ProviderType]:
     """Discover providers for a specific entry point group
 
@@ -174,7 +195,7 @@ def discover_providers(group: str) -> dict[str, ProviderType]:
     failures: dict[str, Exception] = {}
 
     try:
-        entry_points = importlib.metadata.entry_points()
+        entry_points = _installed_entry_points()
 
         # Python 3.10+ returns SelectableGroups, 3.9 returns dict
         if hasattr(entry_points, 'select'):
@@ -353,12 +374,14 @@ def reset() -> None:
     """Reset plugin loader cache
 
     For testing purposes only. Clears all cached providers (and the recorded
-    import failures) so they will be rediscovered on next access.
+    import failures and parsed entry points) so they will be rediscovered on
+    next access.
     """
-    global _provider_cache, _loaded, _load_failures
+    global _provider_cache, _loaded, _load_failures, _entry_points_cache
     _provider_cache = {}
     _load_failures = {}
     _loaded = False
+    _entry_points_cache = None
     logger.debug("Plugin loader cache reset")
 
 
@@ -22,7 +22,7 @@ import stache_ai.providers.embeddings  # noqa
 import stache_ai.providers.llm  # noqa
 import stache_ai.providers.vectordb  # noqa
 from stache_ai.chunking import ChunkingStrategyFactory
-from stache_ai.config import Settings, settings
+from stache_ai.config import Settings, get_settings
 from stache_ai.providers import (
     DocumentIndexProviderFactory,
     EmbeddingProviderFactory,
@@ -180,7 +180,7 @@ class RAGPipeline:
     """
 
     def __init__(self, config: Settings | None = None):
-        self.config = config or settings
+        self.config = config or get_settings()
         self._embedding_provider = None
         self._llm_provider = None
         self._vectordb_provider = None
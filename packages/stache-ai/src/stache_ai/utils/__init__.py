@@ -5,9 +5,11 @@ from .hashing import (
     compute_hash_async,
     compute_file_hash_streaming,
 )
+from .text import utf8_len
 
 __all__ = [
     "compute_hash_sync",
     "compute_hash_async",
     "compute_file_hash_streaming",
+    "utf8_len",
 ]
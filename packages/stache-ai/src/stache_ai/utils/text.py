@@ -0,0 +1,12 @@
+"""Text size utilities."""
+
+
+def utf8_len(text: str) -> int:
+    """Size of ``text`` in bytes when encoded as UTF-8.
+
+    ASCII-only strings (flagged by CPython, so ``isascii()`` is O(1)) are one
+    byte per character; only non-ASCII text is actually encoded.
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
@@ -0,0 +1,104 @@
+"""Tests for the migrate-summaries command"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from stache_ai.cli.migrate_cmd import PREVIEW_CHARS, migrate_summaries
+
+
+def _point(**payload):
+    return SimpleNamespace(payload=payload)
+
+
+def _vectordb(chunks, summaries=()):
+    vectordb = MagicMock()
+    vectordb.capabilities = {"metadata_scan"}
+    vectordb.collection_name = "docs"
+    vectordb.client.count.return_value = SimpleNamespace(count=len(chunks))
+
+    def scroll(with_payload, **kwargs):
+        if with_payload == ["doc_id"]:
+            return [_point(doc_id=doc_id) for doc_id in summaries], None
+        return chunks, None
+
+    vectordb.client.scroll.side_effect = scroll
+    return vectordb
+
+
+def _run(vectordb, *args):
+    pipeline = MagicMock(vectordb_provider=vectordb)
+    pipeline.embedding_provider.embed.return_value = [0.1, 0.2]
+    with patch("stache_ai.cli.migrate_cmd.get_pipeline", return_value=pipeline):
+        result = CliRunner().invoke(migrate_summaries, list(args))
+    assert result.exit_code == 0, result.output
+    return result
+
+
+CHUNKS = [
+    _point(doc_id="d1", filename="a.txt", namespace="ns", text="x" * 1000, headings=["Intro"]),
+    _point(doc_id="d1", filename="a.txt", namespace="ns", text="y" * 1000, headings=["Intro", "More"]),
+    _point(doc_id="d1", filename="a.txt", namespace="ns", text="z" * 1000),
+    _point(doc_id="d2", filename="b.txt", namespace="ns", text="short"),
+    _point(doc_id="d3", filename="c.txt", namespace="ns", text="has summary"),
+    _point(_type="document_summary", doc_id="d3", text="summary"),
+]
+
+
+def test_creates_summaries_with_truncated_preview():
+    vectordb = _vectordb(CHUNKS, summaries=["d3"])
+
+    _run(vectordb)
+
+    inserted = {call.kwargs["metadatas"][0]["doc_id"]: call.kwargs for call in vectordb.insert.call_args_list}
+    assert set(inserted) == {"d1", "d2"}
+
+    d1 = inserted["d1"]
+    assert d1["metadatas"][0]["chunk_count"] == 3
+    assert d1["metadatas"][0]["headings"] == ["Intro", "More"]
+    preview = d1["texts"][0].split("\n\n", 1)[1]
+    assert len(preview) == PREVIEW_CHARS + 1  # two chunks joined by one space
+    assert "z" not in preview
+
+
+def test_summary_ids_are_stable_across_runs():
+    first, second = _vectordb(CHUNKS), _vectordb(CHUNKS)
+
+    _run(first)
+    _run(second)
+
+    ids = [call.kwargs["ids"][0] for call in first.insert.call_args_list]
+    assert ids == [call.kwargs["ids"][0] for call in second.insert.call_args_list]
+    assert ids[0] == str(uuid.uuid5(uuid.NAMESPACE_URL, "stache-summary:d1"))
+    uuid.UUID(ids[1])
+
+
+def test_payload_index_creation_is_best_effort():
+    vectordb = _vectordb(CHUNKS)
+    vectordb.client.create_payload_index.side_effect = [RuntimeError("forbidden"), None]
+
+    _run(vectordb)
+
+    fields = [call.kwargs["field_name"] for call in vectordb.client.create_payload_index.call_args_list]
+    assert fields == ["_type", "namespace"]
+    assert vectordb.insert.call_count == 3
+
+
+def test_dry_run_leaves_collection_untouched():
+    vectordb = _vectordb(CHUNKS)
+
+    result = _run(vectordb, "--dry-run")
+
+    assert "would create summaries" in result.output
+    vectordb.client.create_payload_index.assert_not_called()
+    vectordb.insert.assert_not_called()
+
+
+def test_progress_bar_sized_from_exact_count():
+    vectordb = _vectordb(CHUNKS)
+
+    _run(vectordb)
+
+    assert vectordb.client.count.call_args.kwargs["exact"] is True
@@ -0,0 +1,116 @@
+"""Tests for the namespace import/export commands"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from stache_ai.cli import namespace_cmd
+from stache_ai.cli.namespace_cmd import import_namespaces
+
+NAMESPACES = [
+    {"id": "a/x/q", "name": "Q", "parent_id": "a/x"},
+    {"id": "a", "name": "A"},
+    {"id": "a/x", "name": "X", "parent_id": "a"},
+    {"id": "b", "name": "B"},
+    {"id": "a/y", "name": "Y", "parent_id": "a"},
+    {"id": "b/z", "name": "Z", "parent_id": "b"},
+]
+
+
+class RecordingProvider:
+    """Namespace provider that records the order of create/update calls"""
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.events = []
+        self._lock = threading.Lock()
+
+    def list_ids(self):
+        return set(self.existing)
+
+    def _call(self, id, parent_id=None):
+        with self._lock:
+            self.events.append(("start", id))
+        time.sleep(0.01)
+        with self._lock:
+            if parent_id is not None and parent_id not in self.existing:
+                raise AssertionError(f"{id} started before its parent {parent_id}")
+            self.events.append(("end", id))
+            self.existing.add(id)
+
+    def create(self, id, name, description="", parent_id=None, metadata=None):
+        if id == "a/y":
+            raise RuntimeError("boom")
+        self._call(id, parent_id)
+
+    def update(self, id, name=None, description=None, metadata=None):
+        self._call(id)
+
+
+def _rows(output):
+    """Map namespace ID to its (action, status) cells in the results table"""
+    rows = {}
+    for line in output.splitlines():
+        cells = [cell.strip() for cell in line.split("│")]
+        if len(cells) == 6 and cells[1] in {ns["id"] for ns in NAMESPACES}:
+            rows[cells[1]] = (cells[3], cells[4])
+    return rows
+
+
+@pytest.mark.parametrize("parallel", ["1", "4"])
+def test_import_runs_each_depth_level_before_the_next(tmp_path, parallel):
+    input_file = tmp_path / "namespaces.json"
+    input_file.write_text(json.dumps({"provider": "test", "namespaces": NAMESPACES}))
+    provider = RecordingProvider(existing={"b"})
+
+    with patch.object(namespace_cmd, "get_namespace_provider", return_value=provider), \
+            patch.object(namespace_cmd, "console", Console(width=200)):
+        result = CliRunner().invoke(
+            import_namespaces, [str(input_file), "--update-existing", "-P", parallel]
+        )
+
+    assert result.exit_code == 0, result.output
+
+    # Every call at one depth ends before any call at the next depth starts
+    positions = {}
+    for index, (_, ns_id) in enumerate(provider.events):
+        first, last = positions.get(ns_id.count("/"), (index, index))
+        positions[ns_id.count("/")] = (min(first, index), max(last, index))
+    depths = sorted(positions)
+    for shallow, deep in zip(depths, depths[1:], strict=False):
+        assert positions[shallow][1] < positions[deep][0]
+
+    assert _rows(result.output) == {
+        "a": ("Create", "created"),
+        "b": ("Update", "updated"),
+        "a/x": ("Create", "created"),
+        "a/y": ("Create", "error: boom"),
+        "b/z": ("Create", "created"),
+        "a/x/q": ("Create", "created"),
+    }
+    assert "Created: 4" in result.output
+    assert "Updated: 1" in result.output
+    assert "Skipped: 0" in result.output
+    assert "Errors: 1" in result.output
+
+
+def test_import_dry_run_makes_no_calls(tmp_path):
+    input_file = tmp_path / "namespaces.json"
+    input_file.write_text(json.dumps({"namespaces": NAMESPACES}))
+    provider = MagicMock()
+    provider.list_ids.return_value = {"b"}
+
+    with patch.object(namespace_cmd, "get_namespace_provider", return_value=provider), \
+            patch.object(namespace_cmd, "console", Console(width=200)):
+        result = CliRunner().invoke(import_namespaces, [str(input_file), "--dry-run", "-P", "4"])
+
+    assert result.exit_code == 0, result.output
+    assert "Would create: 5" in result.output
+    assert "Would skip: 1" in result.output
+    provider.create.assert_not_called()
+    provider.update.assert_not_called()
@@ -0,0 +1,56 @@
+"""Tests for the redis-export command"""
+
+import json
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from stache_ai.cli.redis_export import redis_export
+
+
+def _fake_redis(client):
+    return SimpleNamespace(Redis=MagicMock(return_value=client), ConnectionError=ConnectionError)
+
+
+def test_export_decodes_byte_keys_and_skips_missing_values(tmp_path):
+    client = MagicMock()
+    client.smembers.return_value = {b"b", b"a", b"gone"}
+    client.mget.return_value = [
+        b'{"id": "a", "name": "A", "metadata": "{\\"k\\": 1}"}',
+        b'{"id": "b", "name": "B", "parent_id": "a", "filter_keys": ["x"]}',
+        None,
+    ]
+    fake_redis = _fake_redis(client)
+    output = tmp_path / "namespaces.json"
+
+    with patch.dict(sys.modules, {"redis": fake_redis}):
+        result = CliRunner().invoke(redis_export, [str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert fake_redis.Redis.call_args.kwargs["decode_responses"] is False
+    client.mget.assert_called_once_with(
+        ["stache:namespace:a", "stache:namespace:b", "stache:namespace:gone"]
+    )
+
+    data = json.loads(output.read_text())
+    assert data["count"] == 2
+    assert data["namespaces"] == [
+        {"id": "a", "name": "A", "metadata": {"k": 1}, "filter_keys": []},
+        {"id": "b", "name": "B", "parent_id": "a", "filter_keys": ["x"]},
+    ]
+
+
+def test_export_with_no_namespaces(tmp_path):
+    client = MagicMock()
+    client.smembers.return_value = set()
+    output = tmp_path / "namespaces.json"
+
+    with patch.dict(sys.modules, {"redis": _fake_redis(client)}):
+        result = CliRunner().invoke(redis_export, [str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert "No namespaces found" in result.output
+    assert not output.exists()
+    client.mget.assert_not_called()
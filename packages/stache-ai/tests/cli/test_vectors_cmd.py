@@ -0,0 +1,206 @@
+"""Tests for the vectors CLI commands"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from stache_ai.cli import vectors_cmd
+from stache_ai.cli.vectors_cmd import JSON_BATCH_SIZE, to_columnar, vectors, write_json_output
+
+
+def _summary(doc_id, namespace="ns"):
+    return {"doc_id": doc_id, "namespace": namespace, "filename": f"{doc_id}.txt",
+            "_type": "document_summary", "key": f"sum-{doc_id}"}
+
+
+def _chunk(doc_id, namespace="ns"):
+    return {"doc_id": doc_id, "namespace": namespace, "filename": f"{doc_id}.txt"}
+
+
+def _run_documents(vector_db, tmp_path):
+    output = tmp_path / "docs.json"
+    with patch("stache_ai.cli.vectors_cmd.get_vectordb_provider", return_value=vector_db):
+        result = CliRunner().invoke(vectors, ["documents", "-o", str(output)])
+    assert result.exit_code == 0, result.output
+    return {d["doc_id"]: d for d in json.loads(output.read_text())["documents"]}
+
+
+class TestVectorsDocuments:
+    def test_aggregated_path_reads_only_summaries(self, tmp_path):
+        vector_db = MagicMock()
+        vector_db.group_count.return_value = {"a": 3, "b": 2}
+        vector_db.iter_by_filter.return_value = iter([[_summary("a"), _summary("b")]])
+        vector_db.count_by_filter.return_value = 6
+
+        docs = _run_documents(vector_db, tmp_path)
+
+        assert docs["a"]["chunk_count"] == 2 and docs["a"]["has_summary"]
+        assert docs["b"]["chunk_count"] == 1
+        vector_db.list_by_filter.assert_not_called()
+        assert vector_db.iter_by_filter.call_count == 1
+
+    def test_unsummarized_documents_fall_back_to_one_scan(self, tmp_path):
+        vector_db = MagicMock()
+        vector_db.group_count.return_value = {"a": 3, "b": 2}
+        vector_db.iter_by_filter.side_effect = [
+            iter([[_summary("a")]]),
+            iter([[_summary("a"), _chunk("a")], [_chunk("a"), _chunk("b"), _chunk("b")]]),
+        ]
+
+        docs = _run_documents(vector_db, tmp_path)
+
+        assert docs["a"]["chunk_count"] == 2
+        assert docs["b"] == {"doc_id": "b", "chunk_count": 2, "has_summary": False,
+                             "namespace": "ns", "filename": "b.txt", "summary_id": None}
+        vector_db.list_by_filter.assert_not_called()
+        assert vector_db.iter_by_filter.call_args_list[1].kwargs["filter"] == {}
+
+    def test_providers_without_group_count_scan(self, tmp_path):
+        vector_db = MagicMock()
+        vector_db.group_count.side_effect = NotImplementedError
+        vector_db.iter_by_filter.return_value = iter([[_chunk("a"), {"namespace": "ns"}]])
+
+        docs = _run_documents(vector_db, tmp_path)
+
+        assert docs["a"]["chunk_count"] == 1
+        assert vector_db.iter_by_filter.call_count == 1
+
+
+MIXED_RECORDS = [
+    {"key": "a", "doc_id": "d1"},
+    {"key": "b", "filename": "b.txt"},
+    {"key": "c", "doc_id": "d2", "created": object},
+]
+
+
+def _records(n):
+    return [{"key": f"k{i}", "n": i} for i in range(n)]
+
+
+class TestWriteJsonOutput:
+    @pytest.mark.parametrize("count", [0, 1, JSON_BATCH_SIZE - 1, JSON_BATCH_SIZE, JSON_BATCH_SIZE + 1, 2 * JSON_BATCH_SIZE])
+    def test_json_array_round_trips_across_batches(self, tmp_path, count):
+        output = tmp_path / "out.json"
+        records = _records(count)
+
+        write_json_output(output, records)
+
+        assert json.loads(output.read_text()) == records
+
+    @pytest.mark.parametrize("count", [0, JSON_BATCH_SIZE + 1])
+    def test_records_key_appended_to_header(self, tmp_path, count):
+        output = tmp_path / "out.json"
+        data = {"namespace": "ns", "count": count, "vectors": _records(count)}
+
+        write_json_output(output, data, records_key="vectors")
+
+        assert json.loads(output.read_text()) == data
+
+    def test_records_key_only(self, tmp_path):
+        output = tmp_path / "out.json"
+
+        write_json_output(output, {"vectors": _records(2)}, records_key="vectors")
+
+        assert json.loads(output.read_text()) == {"vectors": _records(2)}
+
+    def test_small_batches(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(vectors_cmd, "JSON_BATCH_SIZE", 2)
+        output = tmp_path / "out.json"
+
+        write_json_output(output, _records(5))
+
+        assert json.loads(output.read_text()) == _records(5)
+
+    def test_non_json_values_use_str(self, tmp_path):
+        output = tmp_path / "out.json"
+
+        write_json_output(output, MIXED_RECORDS)
+
+        assert json.loads(output.read_text())[2]["created"] == str(object)
+
+    def test_jsonl_with_records_key_writes_header_then_records(self, tmp_path):
+        output = tmp_path / "out.jsonl"
+        data = {"namespace": "ns", "vectors": MIXED_RECORDS[:2]}
+
+        write_json_output(output, data, records_key="vectors")
+
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert lines == [{"namespace": "ns", "vectors": None}, *MIXED_RECORDS[:2]]
+
+    def test_jsonl_list_and_empty(self, tmp_path):
+        output = tmp_path / "out.jsonl"
+
+        write_json_output(output, MIXED_RECORDS[:2])
+        assert [json.loads(line) for line in output.read_text().splitlines()] == MIXED_RECORDS[:2]
+
+        write_json_output(output, [])
+        assert output.read_text() == ""
+
+    def test_dict_without_records_key_is_one_document(self, tmp_path):
+        output = tmp_path / "out.jsonl"
+
+        write_json_output(output, {"total": 3})
+
+        assert output.read_text().splitlines() == ['{"total": 3}']
+
+
+class TestToColumnar:
+    def test_mixed_keys_fill_missing_with_none(self, tmp_path):
+        columns = to_columnar(MIXED_RECORDS[:2])
+
+        assert columns == {"key": ["a", "b"], "doc_id": ["d1", None], "filename": [None, "b.txt"]}
+
+        output = tmp_path / "out.json"
+        write_json_output(output, columns)
+        assert json.loads(output.read_text()) == columns
+
+    def test_empty(self):
+        assert to_columnar([]) == {}
+
+
+class TestVectorsCreateIndex:
+    @staticmethod
+    def _run(doc_index):
+        vector_db = MagicMock()
+        vector_db.iter_by_filter.side_effect = [
+            iter([[_chunk("a") | {"key": "a1"}, _chunk("b") | {"key": "b1"}, _chunk("c") | {"key": "c1"}]]),
+            iter([]),
+        ]
+        with patch("stache_ai.cli.vectors_cmd.get_vectordb_provider", return_value=vector_db), \
+                patch("stache_ai.cli.vectors_cmd.get_document_index_provider", return_value=doc_index):
+            result = CliRunner().invoke(vectors, ["create-index", "--dry-run"])
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    def test_prefetch_covers_active_and_trashed_entries(self):
+        doc_index = MagicMock()
+        doc_index.list_documents.return_value = {"documents": [{"filename": "a.txt", "namespace": "ns"}]}
+        doc_index.list_trash.side_effect = [
+            {"documents": [], "next_key": "page2"},
+            {"documents": [{"filename": "b.txt", "namespace": "ns"}], "next_key": None},
+        ]
+
+        output = self._run(doc_index)
+
+        assert "To create: 1" in output
+        assert "c.txt in ns" in output
+        assert doc_index.list_trash.call_args_list[1].kwargs["next_key"] == "page2"
+        doc_index.document_exists.assert_not_called()
+
+    def test_providers_without_trash_use_active_entries(self):
+        doc_index = MagicMock()
+        doc_index.list_documents.return_value = {"documents": [{"filename": "a.txt", "namespace": "ns"}]}
+        doc_index.list_trash.side_effect = NotImplementedError
+
+        assert "To create: 2" in self._run(doc_index)
+        doc_index.document_exists.assert_not_called()
+
+    def test_failed_prefetch_checks_each_document(self):
+        doc_index = MagicMock()
+        doc_index.list_documents.side_effect = RuntimeError("throttled")
+        doc_index.document_exists.side_effect = lambda filename, namespace: filename == "b.txt"
+
+        assert "To create: 2" in self._run(doc_index)
+        assert doc_index.document_exists.call_count == 3
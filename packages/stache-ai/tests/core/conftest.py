@@ -0,0 +1,23 @@
+"""Fixtures for core operations tests"""
+
+import pytest
+
+from stache_ai.core import operations
+
+
+@pytest.fixture(autouse=True)
+def _fresh_namespace_provider():
+    """Drop the cached namespace provider so each test sees its own mock factory"""
+    operations._get_namespace_provider.cache_clear()
+    yield
+    operations._get_namespace_provider.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_read_caches():
+    """Start every test with empty document / namespace read caches"""
+    operations._document_cache.clear()
+    operations._namespace_list_cache.clear()
+    yield
+    operations._document_cache.clear()
+    operations._namespace_list_cache.clear()
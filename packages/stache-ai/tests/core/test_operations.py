@@ -1,16 +1,23 @@
 """Tests for core operations shared by HTTP routes and AgentCore handler"""
 
+import uuid
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
 from stache_ai.core.operations import (
+    aio_get_document,
+    aio_search,
     do_get_document,
+    do_get_ingest_status,
     do_ingest_text,
+    do_ingest_text_batch,
     do_list_documents,
     do_list_namespaces,
     do_search,
+    do_submit_ingest_text,
 )
+from stache_ai.ingestion import Job, JobStatus
 
 
 class TestDoSearch:
@@ -92,6 +99,8 @@ class TestDoSearch:
 
         assert 'request_id' in result
         assert len(result['request_id']) > 0
+        # Same dashed layout as the uuid4 strings used previously
+        assert str(uuid.UUID(result['request_id'])) == result['request_id']
 
     @patch('stache_ai.core.operations.get_pipeline')
     def test_passes_namespace_parameter(self, mock_get_pipeline):
@@ -139,6 +148,33 @@ class TestDoSearch:
         assert 'request_id' in result
 
 
+class TestAsyncOperations:
+    """Tests for the async aio_* operations"""
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    async def test_aio_search_awaits_pipeline_query(self, mock_get_pipeline):
+        """Test that aio_search awaits pipeline.query on the running loop"""
+        mock_pipeline = MagicMock()
+        mock_get_pipeline.return_value = mock_pipeline
+        mock_pipeline.query = AsyncMock(return_value={"question": "q", "sources": []})
+
+        result = await aio_search(query="q", request_id="search-1")
+
+        mock_pipeline.query.assert_awaited_once()
+        assert result == {"request_id": "search-1", "question": "q", "sources": []}
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    async def test_aio_get_document_runs_sync_lookup(self, mock_get_pipeline):
+        """Test that aio_get_document returns the document index lookup"""
+        mock_pipeline = MagicMock()
+        mock_get_pipeline.return_value = mock_pipeline
+        mock_pipeline.document_index_provider.get_document.return_value = {"doc_id": "d1"}
+
+        result = await aio_get_document(doc_id="d1", namespace="ns", request_id="get-1")
+
+        assert result == {"request_id": "get-1", "doc_id": "d1"}
+
+
 class TestDoIngestText:
     """Tests for do_ingest_text operation"""
 
@@ -180,6 +216,18 @@ class TestDoIngestText:
         assert "exceeds maximum size" in str(exc_info.value)
         mock_pipeline.ingest_text.assert_not_called()
 
+    @patch('stache_ai.core.operations.get_pipeline')
+    def test_limit_counts_utf8_bytes_not_characters(self, mock_get_pipeline):
+        """Multi-byte text over the byte limit is rejected even if short in characters"""
+        from stache_ai.config import settings
+
+        # Two bytes per character in UTF-8
+        text = "é" * (settings.max_ingest_text_bytes // 2 + 1)
+
+        with pytest.raises(ValueError, match="exceeds maximum size"):
+            do_ingest_text(text=text)
+        mock_get_pipeline.return_value.ingest_text.assert_not_called()
+
     def test_accepts_text_exactly_100kb(self):
         """Test that 100KB text is accepted (not rejected)"""
         with patch('stache_ai.core.operations.get_pipeline') as mock_get_pipeline:
@@ -251,6 +299,134 @@ class TestDoIngestText:
             do_ingest_text(text=large_text)
 
 
+class TestDoIngestTextBatch:
+    """Tests for do_ingest_text_batch operation"""
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    def test_returns_results_in_input_order(self, mock_get_pipeline):
+        """Test that each item gets its own result, in input order"""
+        mock_pipeline = MagicMock()
+        mock_get_pipeline.return_value = mock_pipeline
+
+        async def ingest_text(text, **kwargs):
+            return {"success": True, "chunks_created": len(text)}
+
+        mock_pipeline.ingest_text = AsyncMock(side_effect=ingest_text)
+
+        result = do_ingest_text_batch(
+            items=[{"text": "a"}, {"text": "bb", "request_id": "own-id"}, {"text": "ccc"}],
+            request_id="batch-1"
+        )
+
+        assert result['request_id'] == "batch-1"
+        assert [r['chunks_created'] for r in result['results']] == [1, 2, 3]
+        assert [r['request_id'] for r in result['results']] == ["batch-1-0", "own-id", "batch-1-2"]
+        assert result['succeeded'] == 3
+        assert result['failed'] == 0
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    def test_oversized_item_fails_without_aborting_batch(self, mock_get_pipeline):
+        """Test that an oversized item is reported as failed while others are ingested"""
+        from stache_ai.config import settings
+
+        mock_pipeline = MagicMock()
+        mock_get_pipeline.return_value = mock_pipeline
+        mock_pipeline.ingest_text = AsyncMock(return_value={"success": True, "chunks_created": 1})
+
+        large_text = "a" * (settings.max_ingest_text_bytes + 1)
+        result = do_ingest_text_batch(items=[{"text": large_text}, {"text": "ok"}])
+
+        assert "exceeds maximum size" in result['results'][0]['error']
+        assert result['results'][1]['success'] is True
+        assert result['succeeded'] == 1
+        assert result['failed'] == 1
+        mock_pipeline.ingest_text.assert_called_once()
+
+
+def _job(status=JobStatus.QUEUED, **kwargs):
+    return Job(
+        job_id="job-1", status=status, namespace="ns", source="api",
+        filename="text", content_type="text", requested_by="anonymous", **kwargs
+    )
+
+
+class TestDoSubmitIngestText:
+    """Tests for do_submit_ingest_text operation"""
+
+    @patch('stache_ai.core.operations.get_ingestion_service')
+    def test_submits_text_and_returns_job(self, mock_get_service):
+        """Test that text is submitted to the ingestion service and the job id returned"""
+        service = MagicMock()
+        mock_get_service.return_value = service
+        service.submit = AsyncMock(return_value=_job())
+
+        result = do_submit_ingest_text(
+            text="Test text", metadata={"source": "test"}, namespace="ns", request_id="req-1"
+        )
+
+        assert result == {"request_id": "req-1", "job_id": "job-1", "status": "queued"}
+        call_kwargs = service.submit.call_args.kwargs
+        assert call_kwargs['text'] == "Test text"
+        assert call_kwargs['namespace'] == "ns"
+        assert call_kwargs['metadata'] == {"source": "test"}
+
+    @patch('stache_ai.core.operations.get_ingestion_service')
+    def test_too_large_error_propagates(self, mock_get_service):
+        """Test that the service's size-cap ValueError is re-raised"""
+        from stache_ai.ingestion import IngestTextTooLargeError
+
+        service = MagicMock()
+        mock_get_service.return_value = service
+        service.submit = AsyncMock(side_effect=IngestTextTooLargeError("too big"))
+
+        with pytest.raises(IngestTextTooLargeError):
+            do_submit_ingest_text(text="test")
+
+    @patch('stache_ai.core.operations.get_ingestion_service')
+    def test_returns_error_on_service_exception(self, mock_get_service):
+        """Test that service failures are returned as error dict"""
+        service = MagicMock()
+        mock_get_service.return_value = service
+        service.submit = AsyncMock(side_effect=Exception("queue down"))
+
+        result = do_submit_ingest_text(text="test")
+
+        assert result['error'] == "queue down"
+        assert result['success'] is False
+
+
+class TestDoGetIngestStatus:
+    """Tests for do_get_ingest_status operation"""
+
+    @patch('stache_ai.core.operations.get_ingestion_service')
+    def test_returns_job_without_transport_metadata(self, mock_get_service):
+        """Test that the job is returned with inline text stripped from metadata"""
+        service = MagicMock()
+        mock_get_service.return_value = service
+        service.get_job.return_value = _job(
+            status=JobStatus.DONE, chunks_created=3,
+            metadata={"_text": "body", "_chunking": "recursive", "source": "test"}
+        )
+
+        result = do_get_ingest_status("job-1", request_id="req-1")
+
+        assert result['request_id'] == "req-1"
+        assert result['status'] == "done"
+        assert result['chunks_created'] == 3
+        assert result['metadata'] == {"source": "test"}
+
+    @patch('stache_ai.core.operations.get_ingestion_service')
+    def test_missing_job_returns_error(self, mock_get_service):
+        """Test that an unknown job id is reported as not found"""
+        service = MagicMock()
+        mock_get_service.return_value = service
+        service.get_job.return_value = None
+
+        result = do_get_ingest_status("nope")
+
+        assert result['error'] == "Job not found: nope"
+
+
 class TestDoListNamespaces:
     """Tests for do_list_namespaces operation"""
 
@@ -269,6 +445,52 @@ class TestDoListNamespaces:
         mock_factory.create.assert_called_once()
         mock_provider.list.assert_called_once()
 
+    @patch('stache_ai.core.operations.NamespaceProviderFactory')
+    def test_reuses_namespace_provider_across_calls(self, mock_factory):
+        """Test that the namespace provider is created once and reused"""
+        mock_provider = MagicMock()
+        mock_factory.create.return_value = mock_provider
+        mock_provider.list.return_value = []
+
+        do_list_namespaces()
+        do_list_namespaces()
+
+        mock_factory.create.assert_called_once()
+        assert mock_provider.list.call_count == 2
+
+    @patch('stache_ai.core.operations.NamespaceProviderFactory')
+    def test_caches_list_when_ttl_enabled(self, mock_factory, monkeypatch):
+        """Test that doc_cache_ttl serves repeat lists from cache until a write"""
+        from stache_ai.config import settings
+        from stache_ai.core.operations import do_create_namespace
+
+        monkeypatch.setattr(settings, "doc_cache_ttl", 60)
+        mock_provider = MagicMock()
+        mock_factory.create.return_value = mock_provider
+        mock_provider.list.return_value = [{"id": "ns1"}]
+
+        do_list_namespaces()
+        result = do_list_namespaces()
+        assert result["namespaces"] == [{"id": "ns1"}]
+        assert mock_provider.list.call_count == 1
+
+        do_create_namespace(id="ns2", name="Namespace 2")
+        do_list_namespaces()
+        assert mock_provider.list.call_count == 2
+
+    @patch('stache_ai.core.operations.NamespaceProviderFactory')
+    def test_cached_list_is_not_shared_between_callers(self, mock_factory, monkeypatch):
+        """Test that mutating one response's list does not change later cache hits"""
+        from stache_ai.config import settings
+
+        monkeypatch.setattr(settings, "doc_cache_ttl", 60)
+        mock_factory.create.return_value.list.return_value = [{"id": "ns1"}]
+
+        do_list_namespaces()["namespaces"].append({"id": "bogus"})
+        do_list_namespaces()["namespaces"].clear()
+
+        assert do_list_namespaces()["namespaces"] == [{"id": "ns1"}]
+
     @patch('stache_ai.core.operations.NamespaceProviderFactory')
     def test_returns_count_and_namespaces(self, mock_factory):
         """Test that response includes count and namespaces"""
@@ -477,6 +699,91 @@ class TestDoListDocuments:
 class TestDoGetDocument:
     """Tests for do_get_document operation"""
 
+    @staticmethod
+    def _pipeline_with_doc(mock_get_pipeline):
+        mock_pipeline = MagicMock()
+        mock_get_pipeline.return_value = mock_pipeline
+        mock_document_provider = MagicMock()
+        type(mock_pipeline).document_index_provider = PropertyMock(return_value=mock_document_provider)
+        mock_document_provider.get_document.return_value = {"id": "doc1"}
+        mock_document_provider.get_chunk_ids.return_value = ["c1"]
+        return mock_document_provider
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    def test_not_cached_by_default(self, mock_get_pipeline):
+        """Test that every call reaches the provider when doc_cache_ttl is 0"""
+        provider = self._pipeline_with_doc(mock_get_pipeline)
+
+        do_get_document(doc_id="doc1")
+        do_get_document(doc_id="doc1")
+
+        assert provider.get_document.call_count == 2
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    def test_cached_until_document_deleted(self, mock_get_pipeline, monkeypatch):
+        """Test that cached documents are dropped by do_delete_document"""
+        from stache_ai.config import settings
+        from stache_ai.core.operations import do_delete_document
+
+        monkeypatch.setattr(settings, "doc_cache_ttl", 60)
+        provider = self._pipeline_with_doc(mock_get_pipeline)
+
+        first = do_get_document(doc_id="doc1", namespace="ns")
+        second = do_get_document(doc_id="doc1", namespace="ns")
+        assert provider.get_document.call_count == 1
+        assert second["id"] == "doc1"
+        assert first["request_id"] != second["request_id"]
+
+        do_delete_document(doc_id="doc1", namespace="ns")
+        do_get_document(doc_id="doc1", namespace="ns")
+        assert provider.get_document.call_count == 2
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    def test_cached_until_document_reingested(self, mock_get_pipeline, monkeypatch):
+        """Test that ingesting a new version drops cached copies of the old and new doc_id"""
+        from stache_ai.config import settings
+
+        monkeypatch.setattr(settings, "doc_cache_ttl", 60)
+        provider = self._pipeline_with_doc(mock_get_pipeline)
+        mock_get_pipeline.return_value.ingest_text = AsyncMock(return_value={
+            "success": True, "doc_id": "doc2", "previous_doc_id": "doc1", "namespace": "ns"
+        })
+
+        for doc_id in ("doc1", "doc2", "doc1"):
+            do_get_document(doc_id=doc_id, namespace="ns")
+        do_get_document(doc_id="doc1", namespace="other")
+        assert provider.get_document.call_count == 3
+
+        do_ingest_text(text="new version", namespace="ns")
+
+        for doc_id in ("doc1", "doc2"):
+            do_get_document(doc_id=doc_id, namespace="ns")
+        do_get_document(doc_id="doc1", namespace="other")
+        assert provider.get_document.call_count == 5
+
+    @patch('stache_ai.core.operations.get_pipeline')
+    def test_cache_is_per_caller_and_skips_custom_context(self, mock_get_pipeline, monkeypatch):
+        """Test that callers never share entries and custom-scoped contexts bypass the cache"""
+        from datetime import datetime, timezone
+
+        from stache_ai.config import settings
+        from stache_ai.middleware.context import RequestContext
+
+        monkeypatch.setattr(settings, "doc_cache_ttl", 60)
+        provider = self._pipeline_with_doc(mock_get_pipeline)
+
+        def ctx(user_id, **custom):
+            return RequestContext(request_id="r", timestamp=datetime.now(timezone.utc),
+                                  namespace="default", user_id=user_id, custom=custom)
+
+        do_get_document(doc_id="doc1", context=ctx("alice"))
+        do_get_document(doc_id="doc1", context=ctx("bob"))
+        assert provider.get_document.call_count == 2
+
+        do_get_document(doc_id="doc1", context=ctx("alice", principal="p"))
+        do_get_document(doc_id="doc1", context=ctx("alice", principal="p"))
+        assert provider.get_document.call_count == 4
+
     @patch('stache_ai.core.operations.get_pipeline')
     def test_calls_document_index_provider_get_document(self, mock_get_pipeline):
         """Test that do_get_document calls document_index_provider.get_document"""
@@ -33,6 +33,71 @@ def test_do_ingest_text_forwards_context(mock_get_pipeline):
     assert pipeline.ingest_text.call_args.kwargs["context"] is CTX
 
 
+@patch("stache_ai.core.operations.get_pipeline")
+def test_do_ingest_text_batch_forwards_a_context_copy_per_item(mock_get_pipeline):
+    from datetime import datetime, timezone
+
+    from stache_ai.middleware.context import RequestContext
+
+    pipeline = MagicMock()
+    mock_get_pipeline.return_value = pipeline
+    pipeline.ingest_text = AsyncMock(return_value={"success": True})
+    ctx = RequestContext(
+        request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns",
+        user_id="u", custom={"principal": "p"}
+    )
+
+    operations.do_ingest_text_batch(items=[{"text": "a"}, {"text": "b"}], context=ctx)
+
+    forwarded = [c.kwargs["context"] for c in pipeline.ingest_text.call_args_list]
+    assert len(forwarded) == 2
+    assert all(f.user_id == "u" and f.custom == {"principal": "p"} for f in forwarded)
+    assert forwarded[0].custom is not forwarded[1].custom
+    assert all(f.custom is not ctx.custom for f in forwarded)
+
+
+@patch("stache_ai.core.operations.get_ingestion_service")
+def test_do_submit_ingest_text_submits_as_context_principal(mock_get_service):
+    from datetime import datetime, timezone
+
+    from stache_ai.ingestion import Job, JobStatus
+    from stache_ai.middleware.context import RequestContext
+
+    service = MagicMock()
+    mock_get_service.return_value = service
+    service.submit = AsyncMock(return_value=Job(
+        job_id="j", status=JobStatus.QUEUED, namespace="ns", source="mcp",
+        filename="text", content_type="text", requested_by="u"
+    ))
+    ctx = RequestContext(
+        request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns",
+        user_id="u", source="mcp"
+    )
+
+    operations.do_submit_ingest_text(text="hello", context=ctx)
+
+    assert service.submit.call_args.kwargs["requested_by"] == "u"
+    assert service.submit.call_args.kwargs["source"] == "mcp"
+
+
+@patch("stache_ai.core.operations.get_ingestion_service")
+def test_do_get_ingest_status_scopes_read_to_context_principal(mock_get_service):
+    from datetime import datetime, timezone
+
+    from stache_ai.middleware.context import RequestContext
+
+    service = MagicMock()
+    mock_get_service.return_value = service
+    service.get_job.return_value = None
+    ctx = RequestContext(
+        request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns", user_id="u"
+    )
+
+    operations.do_get_ingest_status("j", context=ctx)
+
+    assert service.get_job.call_args.kwargs["principal"].user_id == "u"
+
+
 @patch("stache_ai.core.operations.NamespaceProviderFactory")
 def test_do_list_namespaces_forwards_context(mock_factory):
     provider = MagicMock()
@@ -213,3 +213,34 @@ def test_backward_compat_function():
         assert result == "Backward compat test"
     finally:
         Path(txt_path).unlink()
+
+
+def test_iter_pages_default_yields_whole_document():
+    """Loaders without a page unit stream their load() result as one page"""
+    loader = MockLoader(extensions=['custom'], load_result="whole")
+
+    assert list(loader.iter_pages("/tmp/doc.custom")) == ["whole"]
+
+
+def test_pdf_load_joins_pages(monkeypatch):
+    """PdfLoader.load is the blank-line join of its streamed pages"""
+    from stache_ai.loaders.pdf import PdfLoader
+
+    loader = PdfLoader()
+    monkeypatch.setattr(loader, "iter_pages", lambda file_path: iter(["page one", "page two"]))
+
+    assert loader.load("doc.pdf") == "page one\n\npage two"
+
+
+def test_get_extension_uses_suffix_of_last_component():
+    """Extension comes from the file name only and is lowercased"""
+    assert DocumentLoaderFactory._get_extension("/data/v1.2/Report.PDF", None) == "pdf"
+    assert DocumentLoaderFactory._get_extension("/data/v1.2/README", None) == ""
+    assert DocumentLoaderFactory._get_extension("/tmp/upload", "Notes.Markdown") == "md"
+
+
+def test_get_extension_keeps_leading_dot_names():
+    """A bare ".md" upload name is still routed to the md loader"""
+    assert DocumentLoaderFactory._get_extension("/tmp/upload", ".md") == "md"
+    assert DocumentLoaderFactory._get_extension("/data/.notes.TXT", None) == "txt"
+    assert DocumentLoaderFactory._get_extension("/tmp/upload", "notes") == ""
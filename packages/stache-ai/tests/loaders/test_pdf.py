@@ -0,0 +1,107 @@
+"""Tests for PdfLoader"""
+
+import sys
+
+import pytest
+
+from stache_ai.loaders import pdf
+from stache_ai.loaders.pdf import PdfLoader
+
+
+def _make_pdf(pages):
+    """Build a minimal PDF with one line of Helvetica text per page"""
+    objs = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objs.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objs.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                    f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objs)} 0 R >>")
+        kids.append(f"{len(objs)} 0 R")
+    objs[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, body in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+@pytest.fixture
+def no_pdfium(monkeypatch):
+    """Force the pdfplumber path even when pypdfium2 is installed"""
+    monkeypatch.setitem(sys.modules, "pypdfium2", None)
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(_make_pdf([f"Page {i}" for i in range(PdfLoader.PARALLEL_MIN_PAGES + 2)]))
+    return str(path)
+
+
+def test_serial_extraction_keeps_page_order(pdf_path, no_pdfium):
+    text = PdfLoader(max_workers=1).load(pdf_path)
+    assert text.split("\n\n") == [f"Page {i}" for i in range(PdfLoader.PARALLEL_MIN_PAGES + 2)]
+
+
+def test_parallel_extraction_matches_serial(pdf_path, no_pdfium):
+    assert PdfLoader(max_workers=3).load(pdf_path) == PdfLoader(max_workers=1).load(pdf_path)
+
+
+def test_parallel_loads_share_one_spawned_pool(pdf_path, no_pdfium):
+    PdfLoader(max_workers=2).load(pdf_path)
+    pool = pdf._pool
+    PdfLoader(max_workers=3).load(pdf_path)
+
+    assert pdf._pool is pool
+    assert pool._mp_context.get_start_method() == "spawn"
+
+
+def test_workers_from_env(monkeypatch):
+    monkeypatch.setenv("STACHE_PDF_WORKERS", "2")
+    assert PdfLoader().max_workers == 2
+
+
+def test_rejects_non_positive_workers():
+    with pytest.raises(ValueError, match="must be positive"):
+        PdfLoader(max_workers=-1)
+
+
+def test_pdfium_extraction_matches_pdfplumber(pdf_path, monkeypatch):
+    pytest.importorskip("pypdfium2")
+    pdfium_text = PdfLoader(max_workers=1).load(pdf_path)
+
+    monkeypatch.setitem(sys.modules, "pypdfium2", None)
+    assert pdfium_text == PdfLoader(max_workers=1).load(pdf_path)
+
+
+def test_pdfplumber_engine_skips_pdfium(pdf_path, monkeypatch):
+    import pdfplumber
+
+    opened = []
+    real_open = pdfplumber.open
+    monkeypatch.setattr(pdfplumber, "open", lambda path: opened.append(path) or real_open(path))
+
+    PdfLoader(max_workers=1, engine="pdfplumber").load(pdf_path)
+    assert opened == [pdf_path]
+
+
+def test_engine_from_env(monkeypatch):
+    monkeypatch.setenv("STACHE_PDF_ENGINE", "PDFplumber")
+    assert PdfLoader().engine == "pdfplumber"
+
+
+def test_rejects_unknown_engine():
+    with pytest.raises(ValueError, match="engine must be one of"):
+        PdfLoader(engine="mupdf")
+
+
+def test_pdfium_engine_requires_pypdfium2(pdf_path, no_pdfium):
+    with pytest.raises(ImportError):
+        PdfLoader(engine="pdfium").load(pdf_path)
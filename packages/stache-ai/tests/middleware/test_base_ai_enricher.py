@@ -20,6 +20,15 @@ class TestBaseAIEnricher:
         settings.ai_enrichment_temperature = 0.0
         return settings
 
+    @pytest.fixture(autouse=True)
+    def clear_llm_output_cache(self):
+        """Keep cached LLM output from leaking between tests."""
+        from stache_ai.middleware.enrichment import base_ai
+
+        base_ai._llm_output_cache.clear()
+        yield
+        base_ai._llm_output_cache.clear()
+
     @pytest.fixture
     def mock_llm_provider(self):
         """Create mock LLM provider with structured output support."""
@@ -85,6 +94,36 @@ class TestBaseAIEnricher:
         assert result.metadata["doc_type"] == "article"
         mock_llm_provider.generate_structured.assert_called_once()
 
+    async def test_process_reuses_cached_output_for_identical_prompt(
+        self, concrete_enricher, mock_context, mock_llm_provider, mock_settings
+    ):
+        """With a cache TTL, an identical prompt skips the LLM call."""
+        mock_settings.ai_enrichment_cache_ttl = 60
+
+        for _ in range(2):
+            result = await concrete_enricher.process(
+                content="Same document", metadata={}, context=mock_context
+            )
+            assert result.metadata["ai_summary"] == "Test summary"
+        await concrete_enricher.process(content="Other document", metadata={}, context=mock_context)
+
+        assert mock_llm_provider.generate_structured.call_count == 2
+
+    async def test_process_does_not_cache_sampled_output(
+        self, concrete_enricher, mock_context, mock_llm_provider, mock_settings
+    ):
+        """Outputs generated above the cacheable temperature are never reused."""
+        from stache_ai.middleware.enrichment import base_ai
+
+        mock_settings.ai_enrichment_cache_ttl = 60
+        mock_settings.ai_enrichment_temperature = 0.7
+
+        for _ in range(2):
+            await concrete_enricher.process(content="Same document", metadata={}, context=mock_context)
+
+        assert mock_llm_provider.generate_structured.call_count == 2
+        assert len(base_ai._llm_output_cache) == 0
+
     async def test_process_preserves_original_content(self, concrete_enricher, mock_context):
         """Test that process returns original content unchanged."""
         original_content = "Original content here"
@@ -0,0 +1,28 @@
+"""Tests for the lazily resolved stache_ai.middleware exports"""
+
+import subprocess
+import sys
+
+import pytest
+
+import stache_ai.middleware as middleware
+
+
+def test_every_export_resolves():
+    for name in middleware.__all__:
+        assert getattr(middleware, name).__name__ == name
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="NotAThing"):
+        _ = middleware.NotAThing
+
+
+def test_importing_context_does_not_load_chain():
+    code = (
+        "import sys\n"
+        "from stache_ai.middleware.context import RequestContext\n"
+        "print('stache_ai.middleware.chain' in sys.modules)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
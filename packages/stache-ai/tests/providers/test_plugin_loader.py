@@ -56,6 +56,26 @@ class TestPluginLoaderDiscovery:
         plugin_loader.reset()
         assert 'llm' not in plugin_loader._provider_cache
 
+    @patch('importlib.metadata.entry_points')
+    def test_entry_points_parsed_once_across_groups(self, mock_eps):
+        """Discovering several groups should read distribution metadata once"""
+        mock_eps.return_value.select.return_value = []
+
+        plugin_loader.reset()
+        plugin_loader.discover_providers('stache.llm')
+        plugin_loader.discover_providers('stache.loader')
+
+        mock_eps.assert_called_once_with()
+        plugin_loader.reset()
+
+    def test_patched_entry_points_do_not_outlive_the_patch(self):
+        """Entry points cached under a patch must not be served afterwards"""
+        with patch('importlib.metadata.entry_points') as mock_eps:
+            mock_eps.return_value.select.return_value = []
+            assert plugin_loader.discover_providers('stache.namespace') == {}
+
+        assert plugin_loader.discover_providers('stache.namespace')
+
     @patch('importlib.metadata.entry_points')
     def test_handles_import_error_gracefully(self, mock_eps):
         """Should skip providers with missing dependencies"""
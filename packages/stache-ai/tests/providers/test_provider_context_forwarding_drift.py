@@ -248,6 +248,40 @@ def test_autosplit_wrapper_forwards_context_on_single_embed_fallback():
     assert spy.embed_ctx is CTX
 
 
+def test_namespace_base_list_ids_forwards_context_into_list():
+    class _SpyNamespaces(NamespaceProvider):
+        def __init__(self):
+            self.list_ctx = "unset"
+
+        def list(self, parent_id=None, include_children=False, context=None):
+            self.list_ctx = context
+            return [{"id": "a"}, {"id": "a/b"}]
+
+        create = get = update = delete = get_tree = exists = None
+
+    spy = _SpyNamespaces()
+    assert spy.list_ids(context=CTX) == {"a", "a/b"}
+    assert spy.list_ctx is CTX
+
+
+def test_vectordb_base_iter_by_filter_forwards_context_into_list_by_filter():
+    class _SpyVectorDB(VectorDBProvider):
+        def __init__(self):
+            self.list_ctx = "unset"
+
+        def list_by_filter(self, filter, fields=None, limit=1000, context=None):
+            self.list_ctx = context
+            return [{"key": "v1", **filter}]
+
+        insert = search = delete = update_status = get_collection_info = None
+
+    spy = _SpyVectorDB()
+    assert list(spy.iter_by_filter({"namespace": "ns"}, context=CTX)) == [
+        [{"key": "v1", "namespace": "ns"}]
+    ]
+    assert spy.list_ctx is CTX
+
+
 # ---------------------------------------------------------------------------
 # Layer 3: concrete first-party (in-tree) subclass guards
 # ---------------------------------------------------------------------------
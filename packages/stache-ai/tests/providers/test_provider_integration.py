@@ -1,5 +1,7 @@
 """Integration tests for provider system - require installed package"""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from stache_ai.config import Settings
@@ -54,6 +56,22 @@ class TestProviderCreationIntegration:
         provider = LLMProviderFactory.create(fallback_settings)
         assert provider is not None
 
+    @pytest.mark.skipif(
+        'fallback' not in LLMProviderFactory.get_available_providers(),
+        reason="Fallback provider not available"
+    )
+    def test_fallback_llm_does_not_mutate_settings(self, fallback_settings):
+        """Should build the primary provider from a copy of the settings"""
+        provider = LLMProviderFactory.create(fallback_settings)
+
+        with patch.object(LLMProviderFactory, 'create', return_value=MagicMock()) as create:
+            assert provider.primary is create.return_value
+
+        built_with = create.call_args.args[0]
+        assert built_with.llm_provider == fallback_settings.fallback_primary
+        assert built_with is not fallback_settings
+        assert fallback_settings.llm_provider == 'fallback'
+
     @pytest.mark.skipif(
         'fallback' not in EmbeddingProviderFactory.get_available_providers(),
         reason="Fallback provider not available"
@@ -67,3 +67,9 @@ def test_delete_cascade_forwards_context_into_recursion(provider, monkeypatch):
     # child was enumerated via raw SQL then deleted recursively with same context
     assert ("child", CTX) in recorded
     assert provider.exists("child") is False  # actually deleted
+
+
+def test_list_ids_returns_every_namespace_id(provider):
+    provider.create(id="parent", name="Parent")
+    provider.create(id="parent/child", name="Child", parent_id="parent")
+    assert provider.list_ids(context=CTX) == {"parent", "parent/child"}
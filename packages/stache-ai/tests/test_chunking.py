@@ -7,6 +7,7 @@ from stache_ai.chunking.character import CharacterChunkingStrategy
 from stache_ai.chunking.factory import ChunkingStrategyFactory
 from stache_ai.chunking.markdown import MarkdownChunkingStrategy
 from stache_ai.chunking.recursive import RecursiveChunkingStrategy, find_best_boundary
+from stache_ai.chunking.transcript import TranscriptChunkingStrategy
 
 
 class TestChunk:
@@ -246,6 +247,38 @@ class TestCharacterChunkingStrategy:
                 assert len(chunk.text) == 50  # Last chunk
 
 
+class TestTranscriptChunkingStrategy:
+    """Tests for TranscriptChunkingStrategy cue parsing"""
+
+    def test_parse_vtt_cues(self):
+        """Should parse cue timing, speaker and strip tags from text"""
+        text = (
+            "WEBVTT\n\n"
+            "NOTE intro\n\n"
+            "1\n00:00:01.000 --> 00:00:03.500 <v Alice>\nHello <b>there</b>\nworld\n\n"
+            "00:01:00.000 --> 00:01:02.000\n<v Bob>Hi</v>"
+        )
+        strategy = TranscriptChunkingStrategy()
+        cues = strategy._parse_vtt(text)
+
+        assert cues == [
+            {'start': 1.0, 'end': 3.5, 'text': 'Hello there\nworld', 'speaker': 'Alice'},
+            {'start': 60.0, 'end': 62.0, 'text': 'Hi', 'speaker': None},
+        ]
+
+    def test_parse_srt_cues(self):
+        """Should accept comma milliseconds and skip cues without text"""
+        text = (
+            "1\n00:00:01,000 --> 00:00:02,000\nFirst line\n\n"
+            "2\n00:00:02,000 --> 00:00:03,000\n\n"
+            "3\n00:00:03,000 --> 00:00:04,000\nThird line"
+        )
+        strategy = TranscriptChunkingStrategy()
+        cues = strategy._parse_srt_or_plain(text)
+
+        assert [(c['start'], c['text']) for c in cues] == [(1.0, 'First line'), (3.0, 'Third line')]
+
+
 class TestChunkingStrategyFactory:
     """Tests for ChunkingStrategyFactory"""
 
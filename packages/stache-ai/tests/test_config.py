@@ -1,5 +1,7 @@
 """Tests for configuration module"""
 
+import subprocess
+import sys
 
 import pytest
 
@@ -190,6 +192,23 @@ class TestGlobalSettings:
 
         assert isinstance(settings, Settings)
 
+    def test_global_settings_is_cached(self):
+        """Test that the lazily created global settings are built only once"""
+        from stache_ai.config import get_settings, settings
+
+        assert get_settings() is get_settings()
+        assert settings is get_settings()
+
+    def test_importing_cli_does_not_build_settings(self):
+        """Importing the CLI (and the core modules it pulls in) stays lazy"""
+        code = (
+            "import stache_ai.config as c, stache_ai.cli.main; "
+            "print(c.get_settings.cache_info().currsize)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "0"
+
 
 class TestAWSConfigValidation:
     """Tests for AWS configuration validation"""
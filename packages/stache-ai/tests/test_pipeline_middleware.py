@@ -853,6 +853,225 @@ class TestMiddlewareChainUnit:
         chain = MiddlewareChain([m1, m2])
         assert len(chain.middlewares) == 2
 
+    async def test_middleware_chain_orders_by_dependency_over_priority(self):
+        """depends_on/runs_before win over priority, and the order is cached"""
+        from stache_ai.middleware.chain import MiddlewareChain, _sorted_positions
+
+        class First(BaseTestMockQueryProcessor):
+            pass
+
+        class Second(BaseTestMockQueryProcessor):
+            depends_on = ("First",)
+
+        class Third(BaseTestMockQueryProcessor):
+            depends_on = ("Second",)
+
+        _sorted_positions.cache_clear()
+        for _ in range(2):
+            chain = MiddlewareChain([Third(priority=100), Second(priority=200), First(priority=300)])
+            assert [type(m).__name__ for m in chain.middlewares] == ["First", "Second", "Third"]
+
+        assert _sorted_positions.cache_info().hits == 1
+
+    async def test_middleware_chain_keeps_repeated_middleware_with_dependencies(self):
+        """Two instances of one class that depends on another both run after it"""
+        from stache_ai.middleware.chain import MiddlewareChain
+
+        class Base(BaseTestMockQueryProcessor):
+            pass
+
+        class Dependent(BaseTestMockQueryProcessor):
+            depends_on = ("Base",)
+
+        first, second, base = Dependent(), Dependent(), Base()
+        chain = MiddlewareChain([first, second, base])
+
+        assert [id(m) for m in chain.middlewares] == [id(base), id(first), id(second)]
+
+    async def test_middleware_chain_keeps_input_order_for_equal_priorities(self):
+        """Priority ties resolve in the order the middleware were given"""
+        from stache_ai.middleware.chain import MiddlewareChain
+
+        middlewares = [BaseTestMockEnricher(priority=p) for p in (100, 50, 100, 50, 100)]
+        chain = MiddlewareChain(middlewares)
+
+        expected = [middlewares[i] for i in (1, 3, 0, 2, 4)]
+        assert all(a is b for a, b in zip(chain.middlewares, expected, strict=True))
+
+    async def test_middleware_chain_validates_process_fn_at_build_time(self):
+        """A chain built with process_fn rejects unusable middleware up front"""
+        from stache_ai.middleware.chain import MiddlewareChain, MiddlewareError
+
+        class SyncProcessor(BaseTestMockQueryProcessor):
+            def process(self, query, context):
+                return QueryProcessorResult(action="allow")
+
+        with pytest.raises(MiddlewareError, match="must be async"):
+            MiddlewareChain([SyncProcessor()], process_fn="process")
+        with pytest.raises(MiddlewareError, match="Missing required method 'rewrite'"):
+            MiddlewareChain([BaseTestMockQueryProcessor()], process_fn="rewrite")
+
+        # Without process_fn, validation happens on the first execute()
+        chain = MiddlewareChain([BaseTestMockQueryProcessor()])
+        with pytest.raises(MiddlewareError, match="'rewrite'"):
+            await chain.execute("query", MagicMock(), process_fn="rewrite")
+
+    async def test_middleware_chain_runs_lifecycle_hooks_when_binding_fails(self):
+        """An unusable process_fn still runs on_chain_start and on_chain_complete"""
+        from datetime import datetime, timezone
+
+        from stache_ai.middleware.chain import MiddlewareChain, MiddlewareError
+
+        calls = []
+
+        class HookedProcessor(BaseTestMockQueryProcessor):
+            async def on_chain_start(self, context):
+                calls.append("start")
+
+            async def on_chain_complete(self, context, success):
+                calls.append(("complete", success))
+
+        chain = MiddlewareChain([HookedProcessor()])
+        context = RequestContext(
+            request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns"
+        )
+
+        with pytest.raises(MiddlewareError, match="'rewrite'"):
+            await chain.execute("query", context, process_fn="rewrite")
+
+        assert calls == ["start", ("complete", False)]
+
+    async def test_middleware_chain_rejects_circular_dependencies(self):
+        """A dependency cycle raises instead of dropping middleware"""
+        from stache_ai.middleware.chain import MiddlewareChain
+
+        class Ping(BaseTestMockQueryProcessor):
+            depends_on = ("Pong",)
+
+        class Pong(BaseTestMockQueryProcessor):
+            depends_on = ("Ping",)
+
+        with pytest.raises(ValueError, match="Circular dependency"):
+            MiddlewareChain([Ping(), Pong()])
+
+    async def test_middleware_chain_runs_only_overridden_lifecycle_hooks(self):
+        """Lifecycle hooks run for middleware that override them, and only those"""
+        from stache_ai.middleware.chain import MiddlewareChain
+
+        calls = []
+
+        class PlainProcessor(QueryProcessor):
+            async def process(self, query, context):
+                return QueryProcessorResult(action="allow")
+
+        class HookedProcessor(PlainProcessor):
+            async def on_chain_start(self, context):
+                calls.append("start")
+
+            async def on_chain_complete(self, context, success):
+                calls.append(("complete", success))
+
+        hooked = HookedProcessor()
+        chain = MiddlewareChain([hooked, PlainProcessor()])
+
+        assert chain._start_hooks == [hooked]
+        assert chain._complete_hooks == [hooked]
+
+        from datetime import datetime, timezone
+        context = RequestContext(
+            request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns"
+        )
+        await chain.execute("query", context)
+
+        assert calls == ["start", ("complete", True)]
+
+    async def test_middleware_chain_logs_timing_only_when_info_enabled(self, caplog):
+        """middleware_executed records carry a duration and are skipped below INFO"""
+        import logging
+        from datetime import datetime, timezone
+
+        from stache_ai.middleware.chain import MiddlewareChain
+
+        class Processor(QueryProcessor):
+            async def process(self, query, context):
+                return QueryProcessorResult(action="allow")
+
+        chain = MiddlewareChain([Processor()])
+        context = RequestContext(
+            request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns"
+        )
+
+        with caplog.at_level(logging.INFO, logger="stache_ai.middleware.chain"):
+            await chain.execute("query", context)
+        [record] = [r for r in caplog.records if r.getMessage() == "middleware_executed"]
+        assert record.middleware == "Processor"
+        assert record.duration_ms >= 0
+
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="stache_ai.middleware.chain"):
+            await chain.execute("query", context)
+        assert not caplog.records
+
+    async def test_middleware_chain_enforces_timeouts(self):
+        """A middleware exceeding timeout_seconds is skipped or rejected per on_error"""
+        import asyncio
+        from datetime import datetime, timezone
+
+        from stache_ai.middleware.chain import MiddlewareChain, MiddlewareError
+
+        class Slow(QueryProcessor):
+            timeout_seconds = 0.01
+
+            async def process(self, query, context):
+                await asyncio.sleep(1)
+                return QueryProcessorResult(action="transform", query="late")
+
+        class SlowSkipped(Slow):
+            on_error = "skip"
+
+        context = RequestContext(
+            request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns"
+        )
+
+        final, results = await MiddlewareChain([SlowSkipped()]).execute("query", context)
+        assert (final, results) == ("query", [])
+
+        with pytest.raises(MiddlewareError, match="Timeout after 0.01s"):
+            await MiddlewareChain([Slow()]).execute("query", context)
+
+    async def test_middleware_chain_isolates_lifecycle_hook_failures(self):
+        """A failing hook is logged and does not stop the other hooks or the chain"""
+        from datetime import datetime, timezone
+
+        from stache_ai.middleware.chain import MiddlewareChain
+
+        completed = []
+
+        class Processor(QueryProcessor):
+            async def process(self, query, context):
+                return QueryProcessorResult(action="allow")
+
+        class BrokenHooks(Processor):
+            async def on_chain_start(self, context):
+                raise RuntimeError("start failed")
+
+            async def on_chain_complete(self, context, success):
+                raise RuntimeError("complete failed")
+
+        class GoodHooks(Processor):
+            async def on_chain_complete(self, context, success):
+                completed.append(success)
+
+        chain = MiddlewareChain([BrokenHooks(), GoodHooks()])
+        context = RequestContext(
+            request_id="r", timestamp=datetime.now(timezone.utc), namespace="ns"
+        )
+        final, results = await chain.execute("query", context)
+
+        assert final == "query"
+        assert len(results) == 2
+        assert completed == [True]
+
     async def test_search_result_dataclass(self):
         """Test SearchResult dataclass structure"""
         result = SearchResult(
@@ -888,6 +1107,14 @@ class TestMiddlewareChainUnit:
         assert result.content == "New content"
         assert result.metadata["enriched"] is True
 
+    async def test_results_apply_to_current_value(self):
+        """Only a transform with a replacement value changes the chain value"""
+        assert EnrichmentResult(action="transform", content="new").apply_to("old") == "new"
+        assert EnrichmentResult(action="transform").apply_to("old") == "old"
+        assert EnrichmentResult(action="allow", content="new").apply_to("old") == "old"
+        assert QueryProcessorResult(action="transform", query="new").apply_to("old") == "new"
+        assert QueryProcessorResult(action="transform", filters={}).apply_to("old") == "old"
+
     async def test_enrichment_result_reject_action(self):
         """Test EnrichmentResult with reject action"""
         result = EnrichmentResult(
@@ -994,3 +1221,41 @@ class TestMiddlewareOrdering:
         assert enricher_low.call_count == 1
         assert enricher_mid.call_count == 1
         assert enricher_high.call_count == 1
+
+
+class TestMiddlewareBaseSlots:
+    """Tests for __slots__ on the middleware base classes"""
+
+    def test_slotted_subclass_has_no_instance_dict(self):
+        """Subclasses declaring __slots__ don't regain a __dict__"""
+        class SlottedObserver(ChunkObserver):
+            __slots__ = ("seen",)
+
+            async def on_chunks_stored(self, stored, context):
+                return ObserverResult(action="allow")
+
+        observer = SlottedObserver()
+        observer.seen = 1
+        assert not hasattr(observer, "__dict__")
+
+    def test_unslotted_subclass_keeps_instance_dict(self):
+        """Existing subclasses that set instance attributes are unaffected"""
+        enricher = MockEnricher(action="allow")
+        assert enricher._action == "allow"
+        assert hasattr(enricher, "__dict__")
+
+
+class TestMiddlewareOrderingAttributes:
+    """Tests for normalization of depends_on / runs_before"""
+
+    def test_lists_are_stored_as_tuples(self):
+        class ListDeps(ChunkObserver):
+            depends_on = ["Alpha", "Beta"]
+            runs_before = "Gamma"
+
+            async def on_chunks_stored(self, stored, context):
+                return ObserverResult(action="allow")
+
+        assert ListDeps.depends_on == ("Alpha", "Beta")
+        assert ListDeps.runs_before == ("Gamma",)
+        assert ListDeps.get_metadata()["depends_on"] == ["Alpha", "Beta"]